@@ -0,0 +1,107 @@
+"""Measure event-loop time spent on logging: synchronous handler vs. queue-backed handler.
+
+Simulates many concurrent generations each emitting the per-call log lines of a request,
+and reports the wall time of the event loop and the per-record cost on the loop thread.
+``--sink-latency-us`` emulates a slow log sink (a blocked stderr pipe or busy disk).
+
+Usage:
+    poetry run python benchmarks/logging_overhead.py [--tasks 200] [--records 50]
+        [--sink-latency-us 50]
+"""
+
+import argparse
+import asyncio
+import logging
+import logging.handlers
+import os
+import queue
+import tempfile
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from lore_engine.core.logging import (  # noqa: E402
+    SAMPLED,
+    TEXT_FORMAT,
+    DeferredQueueHandler,
+    JSONFormatter,
+    RequestContextFilter,
+    SamplingFilter,
+    request_id_var,
+)
+
+PAYLOAD = {"prompt": "x" * 400, "factions": ["The Ashen Choir", "Iron Tide"]}
+
+
+class SlowFileHandler(logging.FileHandler):
+    """File handler whose writes take at least ``latency`` seconds."""
+
+    def __init__(self, filename: str, latency: float) -> None:
+        super().__init__(filename)
+        self.latency = latency
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if self.latency:
+            time.sleep(self.latency)
+
+
+async def _generation(bench_logger: logging.Logger, index: int, records: int) -> None:
+    request_id_var.set(f"req-{index}")
+    for i in range(records):
+        bench_logger.info(f"Executing tool call: fetch_genre with args: {PAYLOAD}", extra=SAMPLED)
+        bench_logger.info(f"LLM invocation iteration {i}")
+        await asyncio.sleep(0)
+
+
+def _run(bench_logger: logging.Logger, tasks: int, records: int) -> float:
+    async def main() -> None:
+        await asyncio.gather(*(_generation(bench_logger, i, records) for i in range(tasks)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return time.perf_counter() - start
+
+
+def _bench(name: str, handler: logging.Handler, tasks: int, records: int, stop=None) -> None:
+    bench_logger = logging.getLogger(f"bench.{name}")
+    bench_logger.propagate = False
+    bench_logger.setLevel(logging.INFO)
+    bench_logger.handlers = [handler]
+
+    elapsed = _run(bench_logger, tasks, records)
+    if stop:
+        stop()
+    total = tasks * records * 2
+    print(f"{name:<28} loop time {elapsed * 1000:8.1f} ms  {elapsed / total * 1e6:6.2f} us/record")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=200, help="Concurrent generations")
+    parser.add_argument("--records", type=int, default=50, help="Log calls per generation")
+    parser.add_argument("--sink-latency-us", type=float, default=0, help="Added write latency")
+    args = parser.parse_args()
+    latency = args.sink_latency_us / 1e6
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sync_handler = SlowFileHandler(os.path.join(tmp, "sync.log"), latency)
+        sync_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        sync_handler.addFilter(RequestContextFilter())
+        _bench("sync text handler", sync_handler, args.tasks, args.records)
+
+        for name, rate in (("queue json handler", 1.0), ("queue json handler sampled", 0.1)):
+            file_handler = SlowFileHandler(os.path.join(tmp, f"{rate}.log"), latency)
+            file_handler.setFormatter(JSONFormatter())
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            queue_handler = DeferredQueueHandler(log_queue)
+            queue_handler.addFilter(RequestContextFilter())
+            queue_handler.addFilter(SamplingFilter(rate))
+            listener = logging.handlers.QueueListener(log_queue, file_handler)
+            listener.start()
+            _bench(name, queue_handler, args.tasks, args.records, stop=listener.stop)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Replay recorded traffic against the app and report throughput and latency percentiles.
+
+Runs the API in-process with ``TRAFFIC_MODE=replay``, so no LLM provider or MCP server is
+contacted: each request is served from a cassette recorded with ``TRAFFIC_MODE=record``,
+sleeping for the recorded call durations. Requests are issued at their recorded arrival
+offsets (compressed by ``--speedup``), reproducing the concurrency of the original traffic.
+
+Usage:
+    poetry run python benchmarks/replay_traffic.py [--cassettes cassettes] [--speedup 1]
+        [--time-scale 1.0] [--repeat 1] [--output run.json] [--baseline previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+parser.add_argument("--cassettes", default="cassettes", help="Directory of recorded cassettes")
+parser.add_argument(
+    "--speedup", type=float, default=1.0, help="Compress recorded arrival times by this factor"
+)
+parser.add_argument(
+    "--time-scale", type=float, default=1.0, help="Multiplier for recorded call durations"
+)
+parser.add_argument("--repeat", type=int, default=1, help="Replay the recorded traffic N times")
+parser.add_argument("--output", help="Write the results to this JSON file")
+parser.add_argument("--baseline", help="Compare against results from a previous --output")
+args = parser.parse_args()
+
+os.environ.setdefault("OPENAI_API_KEY", "replay")
+os.environ["TRAFFIC_MODE"] = "replay"
+os.environ["TRAFFIC_CASSETTE_DIR"] = args.cassettes
+os.environ["TRAFFIC_REPLAY_TIME_SCALE"] = str(args.time_scale)
+os.environ["LORE_STORE_ENABLED"] = "false"
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import httpx  # noqa: E402
+
+from lore_engine.api.app import app  # noqa: E402
+
+
+def _load_cassettes(directory: str) -> list[dict]:
+    cassettes = [
+        json.loads(path.read_text(encoding="utf-8")) for path in Path(directory).glob("*.json")
+    ]
+    return sorted(cassettes, key=lambda c: c["started_at"])
+
+
+async def _send(client: httpx.AsyncClient, cassette: dict, delay: float) -> tuple[str, float, int]:
+    await asyncio.sleep(delay)
+    headers = {"X-Replay-Cassette": cassette["id"]}
+    start = time.perf_counter()
+    if cassette["kind"] == "faction":
+        response = await client.get(f"/factions/{cassette['params']['count']}", headers=headers)
+    else:
+        factions = cassette["params"]["factions"]
+        body = {"factions": factions} if factions else {}
+        response = await client.post("/quests/", json=body, headers=headers)
+    return cassette["kind"], time.perf_counter() - start, response.status_code
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))]
+
+
+def _summarize(latencies: list[float]) -> dict[str, float]:
+    return {
+        "count": len(latencies),
+        "mean": statistics.fmean(latencies),
+        "p50": _percentile(latencies, 50),
+        "p95": _percentile(latencies, 95),
+        "p99": _percentile(latencies, 99),
+    }
+
+
+async def main() -> dict:
+    cassettes = _load_cassettes(args.cassettes)
+    if not cassettes:
+        sys.exit(f"No cassettes in {args.cassettes}; record some with TRAFFIC_MODE=record")
+
+    t0 = cassettes[0]["started_at"]
+    span = cassettes[-1]["started_at"] - t0 + 1e-3
+    schedule = [
+        (cassette, (cassette["started_at"] - t0 + span * round_) / args.speedup)
+        for round_ in range(args.repeat)
+        for cassette in cassettes
+    ]
+
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://replay", timeout=None) as client,
+    ):
+        start = time.perf_counter()
+        results = await asyncio.gather(*(_send(client, c, delay) for c, delay in schedule))
+        elapsed = time.perf_counter() - start
+
+    failures = sum(1 for _, _, status in results if status != 200)
+    by_kind: dict[str, list[float]] = {}
+    for kind, latency, status in results:
+        if status == 200:
+            by_kind.setdefault(kind, []).append(latency)
+    return {
+        "requests": len(results),
+        "failures": failures,
+        "elapsed": elapsed,
+        "throughput": (len(results) - failures) / elapsed,
+        "latency": {kind: _summarize(latencies) for kind, latencies in by_kind.items()},
+    }
+
+
+def _report(results: dict, baseline: dict | None) -> None:
+    print(
+        f"{results['requests']} requests, {results['failures']} failed, "
+        f"{results['elapsed']:.2f}s, {results['throughput']:.2f} req/s"
+    )
+    print(f"{'kind':<10}{'count':>7}{'mean':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for kind, stats in results["latency"].items():
+        print(
+            f"{kind:<10}{stats['count']:>7}"
+            + "".join(f"{stats[key]:>10.3f}" for key in ("mean", "p50", "p95", "p99"))
+        )
+        previous = (baseline or {}).get("latency", {}).get(kind)
+        if previous:
+            deltas = "".join(
+                f"{(stats[key] - previous[key]) / previous[key]:>+10.1%}"
+                for key in ("mean", "p50", "p95", "p99")
+            )
+            print(f"{'  vs base':<17}{deltas}")
+
+
+if __name__ == "__main__":
+    results = asyncio.run(main())
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    _report(results, baseline)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
@@ -0,0 +1,162 @@
+"""Measure the CPU cost per response of turning generated lore into an HTTP body.
+
+Compares the previous route path with the current one on the same data:
+
+- before: copy each stored record into a payload dict, build the response models one by
+  one (NPCs rebuilt by the old ``validate_npcs``), then let FastAPI process the returned
+  model through ``response_model`` (dump, validate again, ``jsonable_encoder``) and
+  encode it with ``json.dumps``
+- after: validate the data once with a prebuilt adapter, attach ids, and serialize the
+  models straight to JSON bytes
+
+Usage:
+    poetry run python benchmarks/response_path.py [--iterations 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from pydantic import field_validator  # noqa: E402
+
+from lore_engine.api.serialization import (  # noqa: E402
+    FACTION_LIST,
+    QUEST_LIST,
+    json_response,
+    with_ids,
+)
+from lore_engine.models.responses import (  # noqa: E402
+    NPC,
+    FactionResponse,
+    FactionsResponse,
+    QuestResponse,
+    QuestsPage,
+)
+from lore_engine.services.lore_store import record_payload  # noqa: E402
+
+
+class LegacyQuestResponse(QuestResponse):
+    """Quest model with the NPC validator as it was before the single-validation path."""
+
+    @field_validator("npcs", mode="before")
+    @classmethod
+    def validate_npcs(cls, v: Any) -> list[NPC] | str:
+        """Convert NPCs to proper format if needed."""
+        if isinstance(v, str):
+            return v
+        elif isinstance(v, list):
+            npcs = []
+            for npc in v:
+                if isinstance(npc, dict):
+                    npcs.append(NPC(**npc))
+                elif isinstance(npc, NPC):
+                    npcs.append(npc)
+                else:
+                    return str(v)
+            return npcs
+        else:
+            return str(v)
+
+
+FACTIONS_FIELD = create_model_field("response", FactionsResponse, mode="serialization")
+QUESTS_PAGE_FIELD = create_model_field("response", QuestsPage, mode="serialization")
+
+
+def _records(kind: str, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"{kind}-{i:016x}",
+            "kind": kind,
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "data": d,
+        }
+        for i, d in enumerate(items)
+    ]
+
+
+FACTIONS = [
+    {
+        "name": f"The Ashen Choir {i}",
+        "symbol": "A cracked bell wreathed in smoke",
+        "values": "Grief is a hymn. The dead must be sung home before the city can rest.",
+        "soundtrack_vibe": "funeral doom with choral drones",
+    }
+    for i in range(10)
+]
+QUESTS = [
+    {
+        "title": f"The Last Toll {i}",
+        "quest_brief": "A bell that should not ring has rung three nights in a row.",
+        "npcs": [
+            {"name": f"Sister {n}", "role": "bell keeper", "faction": "The Ashen Choir"}
+            for n in range(4)
+        ],
+        "conflict": "The Choir wants the bell silenced; the Iron Tide wants it sold.",
+        "location": "The drowned belfry of Saltmere",
+    }
+    for i in range(100)
+]
+FACTION_RECORDS = _records("faction", FACTIONS)
+QUEST_RECORDS = _records("quest", QUESTS)
+
+
+async def factions_before() -> Any:
+    payloads = [record_payload(record) for record in FACTION_RECORDS]
+    content = FactionsResponse(factions=[FactionResponse(**faction) for faction in payloads])
+    return JSONResponse(await serialize_response(field=FACTIONS_FIELD, response_content=content))
+
+
+async def factions_after() -> Any:
+    factions = with_ids(FACTION_LIST.validate_python(FACTIONS), FACTION_RECORDS)
+    return json_response(FactionsResponse.model_construct(factions=factions))
+
+
+async def quests_page_before() -> Any:
+    quests = [LegacyQuestResponse.model_validate(record_payload(r)) for r in QUEST_RECORDS]
+    content = QuestsPage(quests=quests, next_cursor=100)
+    return JSONResponse(await serialize_response(field=QUESTS_PAGE_FIELD, response_content=content))
+
+
+async def quests_page_after() -> Any:
+    quests = with_ids(QUEST_LIST.validate_python(QUESTS), QUEST_RECORDS)
+    return json_response(QuestsPage.model_construct(quests=quests, next_cursor=100))
+
+
+async def _cpu_per_call(build: Callable[[], Awaitable[Any]], iterations: int) -> float:
+    await build()
+    start = time.process_time()
+    for _ in range(iterations):
+        await build()
+    return (time.process_time() - start) / iterations
+
+
+async def main() -> None:
+    """Run every scenario and print the CPU time per response before and after."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    scenarios = {
+        "factions (10)": (factions_before, factions_after),
+        "quests page (100)": (quests_page_before, quests_page_after),
+    }
+    print(f"{'response':<20} {'before us':>10} {'after us':>10} {'saved':>7}")
+    for name, (before, after) in scenarios.items():
+        before_cpu = await _cpu_per_call(before, args.iterations)
+        after_cpu = await _cpu_per_call(after, args.iterations)
+        print(
+            f"{name:<20} {before_cpu * 1e6:>10.1f} {after_cpu * 1e6:>10.1f} "
+            f"{1 - after_cpu / before_cpu:>7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
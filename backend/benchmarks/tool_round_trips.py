@@ -0,0 +1,186 @@
+"""Measure LLM rounds, MCP round trips and tokens of faction generation, with and without
+the batch seed tools.
+
+Runs the real MCP server in-process (over an in-memory MCP session) and the real
+generation loop, with a scripted model in place of the LLM. Without batch tools the model
+fetches one genre per round, as models usually do when told to make one ``fetch_genre``
+call per faction (``--parallel`` requests them all in one round instead). With batch
+tools it makes a single ``fetch_genres(n)`` call. Input tokens add up every message sent
+in every round, since each round resends the whole conversation.
+
+Tokens are counted with tiktoken when its encoding is available, otherwise estimated as
+four characters per token.
+
+Usage:
+    poetry run python benchmarks/tool_round_trips.py [--counts 1 3 5 10] [--parallel]
+        [--source local]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+
+from langchain_core.messages import AIMessage, BaseMessage  # noqa: E402
+from mcp.shared.memory import create_connected_server_and_client_session  # noqa: E402
+
+from lore_engine.core.config import LLMEndpointConfig  # noqa: E402
+from lore_engine.mcp_server.server import mcp, server_settings  # noqa: E402
+from lore_engine.services.llm_router import LLMRouter  # noqa: E402
+from lore_engine.services.lore_generator import BATCH_TOOLS, LoreGenerator  # noqa: E402
+
+FACTION = {"name": "Iron Tide", "symbol": "A wave", "values": "Freedom", "soundtrack_vibe": "ska"}
+
+
+def _token_counter() -> tuple[Any, str]:
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("o200k_base")
+        return lambda text: len(encoding.encode(text)), "tiktoken o200k_base"
+    except Exception:
+        return lambda text: (len(text) + 3) // 4, "estimated, 4 chars/token"
+
+
+count_tokens, TOKEN_METHOD = _token_counter()
+
+
+def _message_text(message: BaseMessage) -> str:
+    text = str(message.content)
+    for tool_call in getattr(message, "tool_calls", None) or []:
+        text += json.dumps({"name": tool_call["name"], "args": tool_call["args"]})
+    return text
+
+
+class SessionMCPClient:
+    """MCP client over an in-memory session, counting round trips."""
+
+    def __init__(self, session: Any, batch: bool) -> None:
+        self.session = session
+        self.batch = batch
+        self.round_trips = 0
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        self.round_trips += 1
+        response = await self.session.list_tools()
+        return [
+            {"name": tool.name, "description": tool.description, "inputSchema": tool.inputSchema}
+            for tool in response.tools
+            if self.batch or tool.name not in BATCH_TOOLS
+        ]
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None) -> Any:
+        self.round_trips += 1
+        return (await self.session.call_tool(tool_name, arguments or {})).content
+
+
+@dataclass
+class ModelStats:
+    """LLM usage of one generation."""
+
+    rounds: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+class SeedFollowingLLM:
+    """Chat model stand-in that follows the seed instructions of the faction prompt."""
+
+    def __init__(
+        self,
+        count: int,
+        parallel: bool,
+        stats: ModelStats,
+        tool_names: frozenset[str] = frozenset(),
+    ) -> None:
+        self.count = count
+        self.parallel = parallel
+        self.stats = stats
+        self.tool_names = tool_names
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> "SeedFollowingLLM":
+        names = frozenset(tool.name for tool in tools)
+        return SeedFollowingLLM(self.count, self.parallel, self.stats, names)
+
+    def _respond(self, messages: list[BaseMessage]) -> AIMessage:
+        seeds = sum(message.type == "tool" for message in messages)
+        if "fetch_genres" in self.tool_names and self.count > 1:
+            if seeds == 0:
+                call = {"name": "fetch_genres", "args": {"n": self.count}, "id": "call-0"}
+                return AIMessage(content="", tool_calls=[call])
+        elif self.tool_names and seeds < self.count:
+            batch = self.count - seeds if self.parallel else 1
+            calls = [
+                {"name": "fetch_genre", "args": {}, "id": f"call-{seeds + i}"} for i in range(batch)
+            ]
+            return AIMessage(content="", tool_calls=calls)
+        return AIMessage(content=json.dumps([FACTION] * self.count))
+
+    async def ainvoke(self, messages: list[BaseMessage], **kwargs: Any) -> AIMessage:
+        response = self._respond(messages)
+        self.stats.rounds += 1
+        self.stats.input_tokens += sum(count_tokens(_message_text(m)) for m in messages)
+        self.stats.output_tokens += count_tokens(_message_text(response))
+        return response
+
+
+async def _measure(count: int, batch: bool, parallel: bool) -> dict[str, Any]:
+    stats = ModelStats()
+    llm = SeedFollowingLLM(count, parallel, stats)
+    router = LLMRouter([LLMEndpointConfig(name="bench", model="m")], llm_factory=lambda c: llm)
+    generator = LoreGenerator(router=router)
+    async with create_connected_server_and_client_session(mcp._mcp_server) as session:
+        client = SessionMCPClient(session, batch)
+        start = time.perf_counter()
+        try:
+            factions = await generator.generate_faction(client, count)
+            result = "ok" if len(factions) == count else "short"
+        except ValueError:
+            # Out of LLM rounds before the model got to answer
+            result = "failed"
+        elapsed = time.perf_counter() - start
+    return {
+        "result": result,
+        "tools": "batch" if batch else "single",
+        "count": count,
+        "llm_rounds": stats.rounds,
+        "mcp_round_trips": client.round_trips,
+        "input_tokens": stats.input_tokens,
+        "output_tokens": stats.output_tokens,
+        "ms": elapsed * 1000,
+    }
+
+
+async def main() -> None:
+    """Run the comparison and print one row per tool mode and faction count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 3, 5, 10])
+    parser.add_argument(
+        "--parallel", action="store_true", help="Single-seed model requests all seeds at once"
+    )
+    parser.add_argument("--source", choices=["local", "remote", "auto"], default="local")
+    args = parser.parse_args()
+    server_settings.genre_source = args.source
+
+    print(f"Tokens: {TOKEN_METHOD}")
+    print(
+        f"{'tools':>6} {'count':>5} {'llm rounds':>10} {'mcp trips':>9} {'in tok':>7} "
+        f"{'out tok':>7} {'ms':>8} result"
+    )
+    for count in args.counts:
+        for batch in (False, True):
+            row = await _measure(count, batch, args.parallel)
+            print(
+                f"{row['tools']:>6} {row['count']:>5} {row['llm_rounds']:>10} "
+                f"{row['mcp_round_trips']:>9} {row['input_tokens']:>7} "
+                f"{row['output_tokens']:>7} {row['ms']:>8.1f} {row['result']}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,14 +1,66 @@
 """FastAPI application for the Lore Engine API."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from lore_engine.api.dependencies import mcp_client_session
+from lore_engine.api.middleware import RequestIdMiddleware
+from lore_engine.core.config import settings
 from lore_engine.core.logging import logger
+from lore_engine.core.loop_monitor import LoopMonitor
+from lore_engine.core.metrics import metrics
+from lore_engine.mcp_client import MCPClientPool
+from lore_engine.services import QuestSpeculator, SessionStore, create_lore_generator
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create app-wide services on startup and release them on shutdown."""
+    app.state.lore_generator = create_lore_generator()
+    app.state.mcp_pool = None
+    if settings.mcp_server_url and settings.traffic_mode != "replay":
+        app.state.mcp_pool = MCPClientPool(settings.mcp_server_url, settings.mcp_pool_size)
+        await app.state.mcp_pool.start()
+    app.state.session_store = SessionStore(
+        max_sessions=settings.session_max_sessions, ttl_seconds=settings.session_ttl_seconds
+    )
+    app.state.quest_speculator = None
+    if settings.speculative_quests:
+        app.state.quest_speculator = QuestSpeculator(
+            app.state.lore_generator,
+            partial(mcp_client_session, app.state.mcp_pool),
+            max_inflight=settings.speculation_max_inflight,
+            ttl_seconds=settings.speculation_ttl_seconds,
+            max_entries=settings.speculation_max_entries,
+        )
+    # Started last, so a failing startup step cannot leave its watchdog thread running
+    app.state.loop_monitor = None
+    if settings.loop_monitor_enabled:
+        app.state.loop_monitor = LoopMonitor(
+            settings.loop_monitor_interval, settings.loop_block_threshold
+        )
+        app.state.loop_monitor.start()
+    try:
+        yield
+    finally:
+        if app.state.quest_speculator is not None:
+            await app.state.quest_speculator.aclose()
+        if app.state.mcp_pool is not None:
+            await app.state.mcp_pool.aclose()
+        await app.state.lore_generator.aclose()
+        logger.info("Closed LoreGenerator connection pool")
+        if app.state.loop_monitor is not None:
+            await app.state.loop_monitor.stop()
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Lore Engine",
     version="0.1.0",
     description="A worldbuilding lore generation API powered by LLMs and MCP tools. "
@@ -24,7 +76,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
+app.add_middleware(RequestIdMiddleware)
 
 
 @app.get("/health", tags=["health"])
@@ -42,9 +96,22 @@ async def health_check() -> dict[str, Any]:
     }
 
 
-from lore_engine.api.routes import factions, quests  # noqa: E402
+@app.get("/metrics", tags=["health"])
+async def get_metrics() -> dict[str, Any]:
+    """Expose in-process metrics (counters and histograms).
+
+    Returns:
+        Snapshot of every registered metric
+    """
+    return metrics.snapshot()
+
+
+from lore_engine.api.routes import debug, factions, lore, quests, sessions  # noqa: E402
 
 app.include_router(factions.router)
 app.include_router(quests.router)
+app.include_router(lore.router)
+app.include_router(sessions.router)
+app.include_router(debug.router)
 
 logger.info("FastAPI application initialized")
@@ -0,0 +1,65 @@
+"""Cancellation of in-flight work when the HTTP client goes away."""
+
+import asyncio
+from collections.abc import Awaitable
+from typing import TypeVar
+
+from fastapi import Request
+
+from lore_engine.core.config import settings
+from lore_engine.core.logging import logger
+from lore_engine.core.metrics import metrics
+
+T = TypeVar("T")
+
+# Non-standard status (nginx convention) for requests the client closed before completion
+CLIENT_CLOSED_REQUEST = 499
+
+abandoned_total = metrics.counter(
+    "generation_abandoned_total", "Generations cancelled because the client disconnected"
+)
+timed_out_total = metrics.counter(
+    "generation_timed_out_total", "Generations stopped because the request deadline passed"
+)
+
+
+class ClientDisconnectedError(Exception):
+    """Raised when the client disconnects before the response is ready."""
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while not await request.is_disconnected():
+        await asyncio.sleep(settings.disconnect_poll_interval)
+
+
+async def run_until_disconnected(request: Request, awaitable: Awaitable[T], kind: str) -> T:
+    """Run ``awaitable``, cancelling it as soon as the client disconnects.
+
+    Args:
+        request: Incoming request whose connection is watched
+        awaitable: Work producing the response
+        kind: Kind of work, used as the metric label ("faction" or "quest")
+
+    Returns:
+        The awaitable's result
+
+    Raises:
+        ClientDisconnectedError: If the client disconnected and the work was cancelled
+    """
+    task = asyncio.ensure_future(awaitable)
+    watcher = asyncio.create_task(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        watcher.cancel()
+
+    if not task.done():
+        task.cancel()
+        abandoned_total.inc(kind=kind)
+        logger.warning(f"Client disconnected, cancelled {kind} generation")
+        raise ClientDisconnectedError(f"Client disconnected during {kind} generation")
+
+    return task.result()
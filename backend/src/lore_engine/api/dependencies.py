@@ -1,22 +1,99 @@
 """Dependency injection functions for FastAPI."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from fastapi import Request
+from starlette.requests import HTTPConnection
+
 from lore_engine.core.config import settings
 from lore_engine.core.logging import logger
 from lore_engine.mcp_client import get_mcp_client as create_mcp_client
 from lore_engine.mcp_client.client import MCPClient
+from lore_engine.mcp_client.pool import MCPClientPool
+from lore_engine.services.lore_generator import LoreGenerator
+from lore_engine.services.lore_store import LoreStore
+from lore_engine.services.sessions import SessionStore
+from lore_engine.services.speculation import QuestSpeculator
+from lore_engine.services.traffic import OfflineMCPClient
+
+
+@asynccontextmanager
+async def mcp_client_session(pool: MCPClientPool | None = None) -> AsyncIterator[MCPClient]:
+    """Provide an MCP client for the duration of the block.
 
+    With a pool (``MCP_SERVER_URL`` set), a shared session to the MCP service is used.
+    Otherwise a stdio server is started for the block and cleaned up afterwards. In
+    traffic replay mode no MCP server is used; tool traffic comes from cassettes.
 
-async def get_mcp_client() -> MCPClient:
-    """Get or create an MCP client instance.
+    Args:
+        pool: Pool of sessions to a shared MCP server, if configured
 
     Yields:
         Connected MCP client instance
     """
+    if settings.traffic_mode == "replay":
+        yield OfflineMCPClient()
+        return
+
+    if pool is not None:
+        yield pool.get()
+        return
+
     logger.info("Creating MCP client for request")
     mcp_client = await create_mcp_client(settings.mcp_server_script_path)
     try:
         yield mcp_client
     finally:
-        # Cleanup after request
         await mcp_client.cleanup()
         logger.info("Cleaned up MCP client after request")
+
+
+async def get_mcp_client(connection: HTTPConnection) -> AsyncIterator[MCPClient]:
+    """Get an MCP client for the duration of the request.
+
+    Yields:
+        Connected MCP client instance
+    """
+    async with mcp_client_session(connection.app.state.mcp_pool) as mcp_client:
+        yield mcp_client
+
+
+@lru_cache
+def get_lore_store() -> LoreStore:
+    """Get the process-wide lore store, loading it from disk on first use.
+
+    Returns:
+        Loaded LoreStore instance
+    """
+    store = LoreStore(settings.lore_store_path)
+    store.load()
+    return store
+
+
+def get_lore_generator(connection: HTTPConnection) -> LoreGenerator:
+    """Get the app-wide LoreGenerator created at startup.
+
+    Returns:
+        Shared LoreGenerator instance
+    """
+    return connection.app.state.lore_generator
+
+
+def get_quest_speculator(request: Request) -> QuestSpeculator | None:
+    """Get the app-wide quest speculator, if speculative quests are enabled.
+
+    Returns:
+        Shared QuestSpeculator instance, or None
+    """
+    return request.app.state.quest_speculator
+
+
+def get_session_store(connection: HTTPConnection) -> SessionStore:
+    """Get the app-wide store of generation sessions.
+
+    Returns:
+        Shared SessionStore instance
+    """
+    return connection.app.state.session_store
@@ -0,0 +1,129 @@
+"""Debugging endpoints, disabled unless ``DEBUG_ENDPOINTS_ENABLED`` is set."""
+
+import asyncio
+import cProfile
+import hmac
+import threading
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import PlainTextResponse
+
+from lore_engine.core.config import settings
+from lore_engine.core.logging import logger
+from lore_engine.core.profiling import (
+    StackSampler,
+    collapsed_output,
+    pstats_dump,
+    pstats_output,
+)
+
+
+def require_debug_access(x_debug_token: str | None = Header(None)) -> None:
+    """Hide debug endpoints unless enabled, and check the debug token if one is set.
+
+    Raises:
+        HTTPException: 404 if debug endpoints are disabled, 403 on a bad token
+    """
+    if not settings.debug_endpoints_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if settings.debug_token and not hmac.compare_digest(x_debug_token or "", settings.debug_token):
+        raise HTTPException(status_code=403, detail="Invalid debug token")
+
+
+router = APIRouter(
+    prefix="/debug",
+    tags=["debug"],
+    include_in_schema=False,
+    dependencies=[Depends(require_debug_access)],
+)
+
+# Profiles are process-wide, so only one runs at a time
+_profile_lock = asyncio.Lock()
+
+
+@router.get("/profile")
+async def profile(
+    seconds: float = Query(10.0, gt=0, description="Length of the profiling window"),
+    mode: Literal["sampling", "cprofile"] = Query("sampling", description="Profiler to run"),
+    output: Literal["collapsed", "pstats", "pstats-binary"] | None = Query(
+        None, description="Output format (collapsed for sampling, pstats for cprofile)"
+    ),
+    sort: Literal["cumulative", "tottime", "ncalls"] = Query(
+        "cumulative", description="pstats sort key"
+    ),
+    limit: int = Query(100, ge=1, description="Number of pstats entries"),
+) -> Response:
+    """Profile the whole process (every task on the event loop) for a time window.
+
+    ``sampling`` samples the event-loop thread's stack and returns collapsed stacks for
+    flamegraph tools (``flamegraph.pl``, speedscope). ``cprofile`` traces every call on
+    the loop and returns a pstats report, or the binary stats with ``pstats-binary``
+    (for snakeviz or ``pstats.Stats``).
+
+    Args:
+        seconds: Length of the profiling window (capped at ``PROFILE_MAX_SECONDS``)
+        mode: Profiler to run
+        output: Output format
+        sort: pstats sort key
+        limit: Number of pstats entries to report
+
+    Returns:
+        Profile output as text or binary
+
+    Raises:
+        HTTPException: 409 if a profile is already running, 400 for an invalid output
+            format
+    """
+    output = output or ("collapsed" if mode == "sampling" else "pstats")
+    if (mode == "sampling") != (output == "collapsed"):
+        raise HTTPException(status_code=400, detail=f"Output '{output}' needs another mode")
+    if _profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+
+    seconds = min(seconds, settings.profile_max_seconds)
+    async with _profile_lock:
+        logger.warning(f"Profiling the process for {seconds}s ({mode})")
+        if mode == "sampling":
+            sampler = StackSampler(threading.get_ident(), settings.profile_sample_interval)
+            sampler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                samples = sampler.stop()
+            return PlainTextResponse(collapsed_output(samples))
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Another profiler (e.g. a coverage tool) already owns the profiling hook
+            raise HTTPException(status_code=409, detail=str(e)) from e
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+
+    if output == "pstats-binary":
+        return Response(
+            pstats_dump(profiler),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": 'attachment; filename="lore-engine.pstats"'},
+        )
+    return PlainTextResponse(pstats_output(profiler, sort, limit))
+
+
+@router.get("/blocking")
+async def blocking_stacks(request: Request) -> PlainTextResponse:
+    """Stacks the event loop was stuck in when the loop monitor caught it blocked.
+
+    Returns:
+        Collapsed stacks with the number of stalls caught in each, heaviest first
+
+    Raises:
+        HTTPException: 404 if the loop monitor is disabled
+    """
+    monitor = getattr(request.app.state, "loop_monitor", None)
+    if monitor is None:
+        raise HTTPException(status_code=404, detail="Loop monitor is disabled")
+    return PlainTextResponse(collapsed_output(monitor.blocked_stacks))
@@ -1,44 +1,92 @@
 """Factions API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Path, Request, Response
 
-from lore_engine.api.dependencies import get_mcp_client
+from lore_engine.api.cancellation import (
+    CLIENT_CLOSED_REQUEST,
+    ClientDisconnectedError,
+    run_until_disconnected,
+    timed_out_total,
+)
+from lore_engine.api.dependencies import (
+    get_lore_generator,
+    get_lore_store,
+    get_mcp_client,
+    get_quest_speculator,
+)
+from lore_engine.api.serialization import FACTION_LIST, json_response, with_ids
+from lore_engine.core.config import settings
+from lore_engine.core.deadline import Deadline, DeadlineExceededError
 from lore_engine.core.logging import logger
 from lore_engine.mcp_client.client import MCPClient
-from lore_engine.models.responses import FactionResponse, FactionsResponse
-from lore_engine.services import create_lore_generator
+from lore_engine.models.responses import FactionsResponse
+from lore_engine.services import LoreGenerator, LoreStore, QuestSpeculator
+from lore_engine.services.traffic import REPLAY_CASSETTE_HEADER, traffic_session
 
 router = APIRouter(prefix="/factions", tags=["factions"])
 
 
 @router.get("/{count}", response_model=FactionsResponse)
 async def generate_factions(
+    request: Request,
+    background_tasks: BackgroundTasks,
     count: int = Path(ge=1, le=10, description="Number of factions to generate (1-10)"),
     mcp_client: MCPClient = Depends(get_mcp_client),
-) -> FactionsResponse:
+    store: LoreStore = Depends(get_lore_store),
+    lore_generator: LoreGenerator = Depends(get_lore_generator),
+    speculator: QuestSpeculator | None = Depends(get_quest_speculator),
+) -> Response:
     """Generate multiple factions for worldbuilding.
 
+    Generation is cancelled if the client disconnects and bounded by the request deadline.
+    With speculative quests enabled, a quest for the returned factions is started in the
+    background once the response is sent.
+
     Args:
+        request: Incoming request (watched for client disconnects)
+        background_tasks: Work to run after the response is sent
         count: Number of factions to generate (between 1 and 10)
         mcp_client: MCP client instance (injected)
+        store: Lore store instance (injected)
+        lore_generator: Shared LoreGenerator instance (injected)
+        speculator: Shared quest speculator, if enabled (injected)
 
     Returns:
-        FactionsResponse containing list of generated factions
+        FactionsResponse containing list of generated factions, serialized once
 
     Raises:
-        HTTPException: If generation fails
+        HTTPException: If generation fails (500) or exceeds the request deadline (504)
     """
     try:
         logger.info(f"Received request to generate {count} faction(s)")
 
-        lore_generator = await create_lore_generator(mcp_client)
+        deadline = Deadline(settings.request_timeout_seconds)
+        async with traffic_session(
+            "faction", {"count": count}, request.headers.get(REPLAY_CASSETTE_HEADER)
+        ):
+            factions_data = await run_until_disconnected(
+                request,
+                lore_generator.generate_faction(mcp_client, count=count, deadline=deadline),
+                "faction",
+            )
 
-        factions_data = await lore_generator.generate_faction(count=count)
+        faction_responses = FACTION_LIST.validate_python(factions_data)
+        if settings.lore_store_enabled:
+            with_ids(faction_responses, await store.add("faction", factions_data))
 
-        faction_responses = [FactionResponse(**faction) for faction in factions_data]
+        if speculator is not None:
+            background_tasks.add_task(speculator.schedule, factions_data)
 
         logger.info(f"Successfully generated {len(faction_responses)} faction(s)")
-        return FactionsResponse(factions=faction_responses)
+        return json_response(FactionsResponse.model_construct(factions=faction_responses))
+
+    except ClientDisconnectedError:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+    except DeadlineExceededError as e:
+        timed_out_total.inc(kind="faction")
+        logger.error(f"Faction generation timed out: {e}")
+        raise HTTPException(status_code=504, detail=f"Failed to generate factions: {str(e)}") from e
 
     except Exception as e:
         logger.error(f"Failed to generate factions: {e}", exc_info=True)
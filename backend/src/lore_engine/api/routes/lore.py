@@ -0,0 +1,144 @@
+"""Stored lore API endpoints."""
+
+import hashlib
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+
+from lore_engine.api.dependencies import get_lore_store
+from lore_engine.api.serialization import (
+    FACTION_LIST,
+    QUEST_LIST,
+    json_response,
+    validate_records,
+)
+from lore_engine.models.responses import FactionResponse, FactionsPage, QuestResponse, QuestsPage
+from lore_engine.services.lore_store import LoreKind, LoreStore
+
+router = APIRouter(prefix="/lore", tags=["lore"])
+
+
+def _not_modified(etag: str, if_none_match: str | None, response: Response) -> bool:
+    """Set the ETag header and report whether the client's cached copy is still current."""
+    response.headers["ETag"] = etag
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _page_etag(store: LoreStore, kind: LoreKind, *parts: object) -> str:
+    """Build an ETag for a search page; the store is append-only so its size is a version."""
+    key = ":".join(str(part) for part in (kind, store.version(kind), *parts))
+    return f'"{hashlib.sha256(key.encode()).hexdigest()[:16]}"'
+
+
+@router.get("/factions", response_model=FactionsPage)
+async def search_factions(
+    response: Response,
+    q: str | None = Query(None, description="Words to search for in faction names and values"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of factions to return"),
+    cursor: int | None = Query(None, ge=0, description="Cursor returned by the previous page"),
+    if_none_match: str | None = Header(None),
+    store: LoreStore = Depends(get_lore_store),
+) -> Response:
+    """Search stored factions, newest first.
+
+    Args:
+        response: Outgoing response (used to set the ETag header)
+        q: Optional search query
+        limit: Page size
+        cursor: Paging cursor
+        if_none_match: ETag of the client's cached page
+        store: Lore store instance (injected)
+
+    Returns:
+        FactionsPage with matching factions, or 304 if the cached page is current
+    """
+    etag = _page_etag(store, "faction", q, limit, cursor)
+    if _not_modified(etag, if_none_match, response):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    records, next_cursor = store.search("faction", query=q, limit=limit, cursor=cursor)
+    factions = validate_records(FACTION_LIST, records)
+    page = FactionsPage.model_construct(factions=factions, next_cursor=next_cursor)
+    return json_response(page, headers={"ETag": etag})
+
+
+@router.get("/factions/{faction_id}", response_model=FactionResponse)
+async def get_faction(
+    faction_id: str,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    store: LoreStore = Depends(get_lore_store),
+) -> Response:
+    """Fetch a stored faction by id.
+
+    Raises:
+        HTTPException: If no faction has the given id
+    """
+    record = store.get("faction", faction_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Faction not found: {faction_id}")
+
+    etag = f'"{record["id"]}"'
+    if _not_modified(etag, if_none_match, response):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    [faction] = validate_records(FACTION_LIST, [record])
+    return json_response(faction, headers={"ETag": etag})
+
+
+@router.get("/quests", response_model=QuestsPage)
+async def search_quests(
+    response: Response,
+    q: str | None = Query(None, description="Words to search for in quest titles and locations"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of quests to return"),
+    cursor: int | None = Query(None, ge=0, description="Cursor returned by the previous page"),
+    if_none_match: str | None = Header(None),
+    store: LoreStore = Depends(get_lore_store),
+) -> Response:
+    """Search stored quests, newest first.
+
+    Args:
+        response: Outgoing response (used to set the ETag header)
+        q: Optional search query
+        limit: Page size
+        cursor: Paging cursor
+        if_none_match: ETag of the client's cached page
+        store: Lore store instance (injected)
+
+    Returns:
+        QuestsPage with matching quests, or 304 if the cached page is current
+    """
+    etag = _page_etag(store, "quest", q, limit, cursor)
+    if _not_modified(etag, if_none_match, response):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    records, next_cursor = store.search("quest", query=q, limit=limit, cursor=cursor)
+    quests = validate_records(QUEST_LIST, records)
+    page = QuestsPage.model_construct(quests=quests, next_cursor=next_cursor)
+    return json_response(page, headers={"ETag": etag})
+
+
+@router.get("/quests/{quest_id}", response_model=QuestResponse)
+async def get_quest(
+    quest_id: str,
+    response: Response,
+    if_none_match: str | None = Header(None),
+    store: LoreStore = Depends(get_lore_store),
+) -> Response:
+    """Fetch a stored quest by id.
+
+    Raises:
+        HTTPException: If no quest has the given id
+    """
+    record = store.get("quest", quest_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Quest not found: {quest_id}")
+
+    etag = f'"{record["id"]}"'
+    if _not_modified(etag, if_none_match, response):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    [quest] = validate_records(QUEST_LIST, [record])
+    return json_response(quest, headers={"ETag": etag})
@@ -1,32 +1,71 @@
 """Quests API endpoints."""
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 
-from lore_engine.api.dependencies import get_mcp_client
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+
+from lore_engine.api.cancellation import (
+    CLIENT_CLOSED_REQUEST,
+    ClientDisconnectedError,
+    abandoned_total,
+    run_until_disconnected,
+    timed_out_total,
+)
+from lore_engine.api.dependencies import (
+    get_lore_generator,
+    get_lore_store,
+    get_mcp_client,
+    get_quest_speculator,
+)
+from lore_engine.api.serialization import json_response, to_json, with_ids
+from lore_engine.core.config import settings
+from lore_engine.core.deadline import Deadline, DeadlineExceededError
 from lore_engine.core.logging import logger
 from lore_engine.mcp_client.client import MCPClient
-from lore_engine.models.responses import QuestRequest, QuestResponse
-from lore_engine.services import create_lore_generator
+from lore_engine.models.responses import (
+    QuestMatrixItem,
+    QuestMatrixRequest,
+    QuestRequest,
+    QuestResponse,
+)
+from lore_engine.services import LoreGenerator, LoreStore, QuestSpeculator
+from lore_engine.services.quest_matrix import PairResult, generate_quest_matrix
+from lore_engine.services.traffic import REPLAY_CASSETTE_HEADER, traffic_session
 
 router = APIRouter(prefix="/quests", tags=["quests"])
 
 
 @router.post("/", response_model=QuestResponse)
 async def generate_quest(
+    http_request: Request,
     request: QuestRequest = Body(default=QuestRequest()),
     mcp_client: MCPClient = Depends(get_mcp_client),
-) -> QuestResponse:
+    store: LoreStore = Depends(get_lore_store),
+    lore_generator: LoreGenerator = Depends(get_lore_generator),
+    speculator: QuestSpeculator | None = Depends(get_quest_speculator),
+) -> Response:
     """Generate a quest for worldbuilding.
 
+    Generation is cancelled if the client disconnects and bounded by the request deadline.
+    A quest speculatively generated for the same factions is returned (or joined while
+    still running) instead of generating a new one.
+
     Args:
+        http_request: Incoming request (watched for client disconnects)
         request: Quest generation request with optional factions
         mcp_client: MCP client instance (injected)
+        store: Lore store instance (injected)
+        lore_generator: Shared LoreGenerator instance (injected)
+        speculator: Shared quest speculator, if enabled (injected)
 
     Returns:
-        QuestResponse containing the generated quest
+        QuestResponse containing the generated quest, serialized once
 
     Raises:
-        HTTPException: If generation fails
+        HTTPException: If generation fails (500) or exceeds the request deadline (504)
     """
     try:
         factions_input = None
@@ -38,13 +77,113 @@ async def generate_quest(
         else:
             logger.info("Received request to generate quest")
 
-        lore_generator = await create_lore_generator(mcp_client)
-        quest_data = await lore_generator.generate_quest(factions=factions_input)
-        quest_response = QuestResponse(**quest_data)
+        quest_data = None
+        if speculator is not None and factions_input:
+            quest_data = await run_until_disconnected(
+                http_request, speculator.take(factions_input), "quest"
+            )
+
+        if quest_data is None:
+            deadline = Deadline(settings.request_timeout_seconds)
+            async with traffic_session(
+                "quest",
+                {"factions": factions_input},
+                http_request.headers.get(REPLAY_CASSETTE_HEADER),
+            ):
+                quest_data = await run_until_disconnected(
+                    http_request,
+                    lore_generator.generate_quest(
+                        mcp_client, factions=factions_input, deadline=deadline
+                    ),
+                    "quest",
+                )
+
+        quest_response = QuestResponse.model_validate(quest_data)
+        if settings.lore_store_enabled:
+            with_ids([quest_response], await store.add("quest", [quest_data]))
 
         logger.info("Successfully generated quest")
-        return quest_response
+        return json_response(quest_response)
+
+    except ClientDisconnectedError:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+    except DeadlineExceededError as e:
+        timed_out_total.inc(kind="quest")
+        logger.error(f"Quest generation timed out: {e}")
+        raise HTTPException(status_code=504, detail=f"Failed to generate quest: {str(e)}") from e
 
     except Exception as e:
         logger.error(f"Failed to generate quest: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to generate quest: {str(e)}") from e
+
+
+async def _matrix_item(result: PairResult, store: LoreStore) -> QuestMatrixItem:
+    """Validate and store the quest of a pair, turning failures into an error item."""
+    if result.quest is None:
+        return QuestMatrixItem(pair=result.pair, error=result.error)
+    try:
+        quest = QuestResponse.model_validate(result.quest)
+        if settings.lore_store_enabled:
+            with_ids([quest], await store.add("quest", [result.quest]))
+    except Exception as e:
+        logger.error(f"Invalid quest for faction pair {result.pair}: {e}")
+        return QuestMatrixItem(pair=result.pair, error=f"Invalid quest: {e}")
+    return QuestMatrixItem(pair=result.pair, quest=quest)
+
+
+@router.post("/matrix", response_class=StreamingResponse)
+async def generate_quest_matrix_stream(
+    request: QuestMatrixRequest,
+    mcp_client: MCPClient = Depends(get_mcp_client),
+    store: LoreStore = Depends(get_lore_store),
+    lore_generator: LoreGenerator = Depends(get_lore_generator),
+) -> StreamingResponse:
+    """Generate a quest for every pair of factions, or for the selected pairs.
+
+    Pairs are generated concurrently (at most ``max_concurrency`` at once, capped by
+    ``QUEST_MATRIX_MAX_CONCURRENCY``) and streamed back as newline-delimited JSON, one
+    ``QuestMatrixItem`` per line in completion order. A pair that fails is reported on
+    its line and does not stop the others. Each pair has its own request deadline.
+    Disconnecting cancels the pairs still running.
+
+    Args:
+        request: Factions, optional pairs and concurrency
+        mcp_client: MCP client instance (injected)
+        store: Lore store instance (injected)
+        lore_generator: Shared LoreGenerator instance (injected)
+
+    Returns:
+        Streaming ``application/x-ndjson`` response
+
+    Raises:
+        HTTPException: If more factions are sent than ``QUEST_MATRIX_MAX_FACTIONS`` (400)
+    """
+    if len(request.factions) > settings.quest_matrix_max_factions:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.quest_matrix_max_factions} factions are allowed",
+        )
+    factions = [faction.model_dump() for faction in request.factions]
+    max_concurrency = min(request.max_concurrency, settings.quest_matrix_max_concurrency)
+
+    async def stream() -> AsyncIterator[bytes]:
+        try:
+            async with aclosing(
+                generate_quest_matrix(
+                    lore_generator,
+                    mcp_client,
+                    factions,
+                    request.pairs,
+                    max_concurrency,
+                    settings.request_timeout_seconds,
+                )
+            ) as results:
+                async for result in results:
+                    yield to_json(await _matrix_item(result, store)) + b"\n"
+        except (asyncio.CancelledError, GeneratorExit):
+            abandoned_total.inc(kind="quest_matrix")
+            raise
+
+    logger.info(f"Received request to generate quest matrix for {len(factions)} faction(s)")
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -0,0 +1,165 @@
+"""Stateful generation sessions over WebSocket."""
+
+import asyncio
+import json
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
+from pydantic import TypeAdapter, ValidationError
+
+from lore_engine.api.cancellation import abandoned_total, timed_out_total
+from lore_engine.api.dependencies import (
+    get_lore_generator,
+    get_lore_store,
+    get_mcp_client,
+    get_session_store,
+)
+from lore_engine.api.serialization import FACTION_LIST, with_ids
+from lore_engine.core.config import settings
+from lore_engine.core.deadline import Deadline, DeadlineExceededError
+from lore_engine.core.logging import logger
+from lore_engine.mcp_client.client import MCPClient
+from lore_engine.models.responses import (
+    FactionsAction,
+    QuestAction,
+    QuestResponse,
+    SessionAction,
+    TweakFactionAction,
+)
+from lore_engine.services import LoreGenerator, LoreStore, SessionStore
+from lore_engine.services.sessions import Session, SessionGenerator
+
+router = APIRouter(prefix="/sessions", tags=["sessions"])
+
+_session_action = TypeAdapter(SessionAction)
+
+
+async def _factions_message(factions: list[dict[str, Any]], store: LoreStore) -> dict[str, Any]:
+    faction_responses = FACTION_LIST.validate_python(factions)
+    if settings.lore_store_enabled:
+        with_ids(faction_responses, await store.add("faction", factions))
+    return {
+        "type": "factions",
+        "factions": FACTION_LIST.dump_python(faction_responses, mode="json"),
+    }
+
+
+async def _run_action(
+    action: FactionsAction | QuestAction | TweakFactionAction,
+    session: Session,
+    generator: SessionGenerator,
+    mcp_client: MCPClient,
+    store: LoreStore,
+) -> dict[str, Any]:
+    """Run one session action and build the message pushed back to the client."""
+    deadline = Deadline(settings.request_timeout_seconds)
+
+    if isinstance(action, FactionsAction):
+        factions = await generator.factions(session, mcp_client, action.count, deadline)
+        return await _factions_message(factions, store)
+
+    if isinstance(action, TweakFactionAction):
+        factions = await generator.tweak_faction(
+            session, mcp_client, action.index, action.instruction, deadline
+        )
+        return await _factions_message(factions, store)
+
+    if action.factions is not None:
+        factions = [faction.model_dump() for faction in action.factions]
+        if factions != session.factions:
+            generator.set_factions(session, factions)
+    quest = await generator.quest(session, mcp_client, deadline)
+    quest_response = QuestResponse.model_validate(quest)
+    if settings.lore_store_enabled:
+        with_ids([quest_response], await store.add("quest", [quest]))
+    return {"type": "quest", "quest": quest_response.model_dump(mode="json")}
+
+
+async def _process_actions(
+    websocket: WebSocket,
+    actions: asyncio.Queue[str],
+    session: Session,
+    generator: SessionGenerator,
+    mcp_client: MCPClient,
+    store: LoreStore,
+) -> None:
+    """Run queued actions in order, pushing each result as soon as it is ready."""
+    while True:
+        raw = await actions.get()
+        try:
+            action = _session_action.validate_json(raw)
+        except ValidationError as e:
+            await websocket.send_json(
+                {"type": "error", "detail": json.loads(e.json(include_url=False))}
+            )
+            continue
+
+        try:
+            async with session.lock:
+                message = await _run_action(action, session, generator, mcp_client, store)
+        except DeadlineExceededError as e:
+            timed_out_total.inc(kind="session")
+            logger.error(f"Session {action.action} timed out: {e}")
+            message = {"type": "error", "action": action.action, "detail": str(e)}
+        except Exception as e:
+            logger.error(f"Session {action.action} failed: {e}", exc_info=True)
+            message = {"type": "error", "action": action.action, "detail": str(e)}
+
+        await websocket.send_json(message)
+
+
+@router.websocket("/ws")
+async def session_socket(
+    websocket: WebSocket,
+    session_id: str | None = Query(None, description="Session to resume"),
+    mcp_client: MCPClient = Depends(get_mcp_client),
+    store: LoreStore = Depends(get_lore_store),
+    lore_generator: LoreGenerator = Depends(get_lore_generator),
+    sessions: SessionStore = Depends(get_session_store),
+) -> None:
+    """Iterative worldbuilding session.
+
+    On connect the server sends ``{"type": "session", "session_id": ..., "factions": [...]}``;
+    pass ``session_id`` to resume a session after reconnecting. The client then sends
+    actions, which run in order with their results pushed as they complete:
+
+    - ``{"action": "factions", "count": 3}`` - generate a new faction set
+    - ``{"action": "quest"}`` - generate a quest for the session's factions (another
+      one on each call, continuing the same conversation); optionally pass ``factions``
+    - ``{"action": "tweak_faction", "index": 3, "instruction": "..."}`` - revise one
+      faction
+
+    Args:
+        websocket: Client connection
+        session_id: Optional id of a session to resume
+        mcp_client: MCP client instance (injected)
+        store: Lore store instance (injected)
+        lore_generator: Shared LoreGenerator instance (injected)
+        sessions: Session store (injected)
+    """
+    await websocket.accept()
+
+    session = sessions.get(session_id) if session_id else None
+    if session is None:
+        session = sessions.create()
+    logger.info(f"Session {session.id} connected")
+    await websocket.send_json(
+        {"type": "session", "session_id": session.id, "factions": session.factions}
+    )
+
+    generator = SessionGenerator(lore_generator, max_turns=settings.session_max_turns)
+    actions: asyncio.Queue[str] = asyncio.Queue()
+    worker = asyncio.create_task(
+        _process_actions(websocket, actions, session, generator, mcp_client, store)
+    )
+    try:
+        while True:
+            actions.put_nowait(await websocket.receive_text())
+    except WebSocketDisconnect:
+        if session.lock.locked():
+            abandoned_total.inc(kind="session")
+            logger.warning(f"Session {session.id} disconnected, cancelled running action")
+    finally:
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        logger.info(f"Session {session.id} disconnected")
@@ -0,0 +1,67 @@
+"""Fast response path from generated or stored lore to the HTTP body.
+
+A route returning a model makes FastAPI dump it to a dict, validate that dict again
+against ``response_model``, convert it with ``jsonable_encoder`` and encode it with
+``json.dumps``. Routes here validate the data once, with type adapters built at import
+time, and serialize the validated models straight to JSON bytes with pydantic-core.
+Returning a ``Response`` skips FastAPI's response processing; ``response_model`` still
+documents the schema.
+"""
+
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from lore_engine.models.responses import (
+    FactionResponse,
+    FactionsPage,
+    FactionsResponse,
+    QuestMatrixItem,
+    QuestResponse,
+    QuestsPage,
+)
+
+T = TypeVar("T")
+
+FACTION_LIST = TypeAdapter(list[FactionResponse])
+QUEST_LIST = TypeAdapter(list[QuestResponse])
+
+RESPONSE_ADAPTERS: dict[type, TypeAdapter[Any]] = {
+    model: TypeAdapter(model)
+    for model in (
+        FactionResponse,
+        FactionsPage,
+        FactionsResponse,
+        QuestMatrixItem,
+        QuestResponse,
+        QuestsPage,
+    )
+}
+
+
+def with_ids(models: list[T], records: list[dict[str, Any]]) -> list[T]:
+    """Attach the ids of lore store records to the models validated from their data."""
+    for model, record in zip(models, records, strict=True):
+        model.id = record["id"]
+    return models
+
+
+def validate_records(adapter: TypeAdapter[list[T]], records: list[dict[str, Any]]) -> list[T]:
+    """Validate the data of stored records once and attach their ids."""
+    return with_ids(adapter.validate_python([record["data"] for record in records]), records)
+
+
+def to_json(model: Any) -> bytes:
+    """Serialize a response model to JSON bytes."""
+    return RESPONSE_ADAPTERS[type(model)].dump_json(model)
+
+
+def json_response(
+    model: Any, status_code: int = 200, headers: Mapping[str, str] | None = None
+) -> Response:
+    """Build a JSON response whose body is the model serialized once to bytes."""
+    return Response(
+        to_json(model), status_code=status_code, headers=headers, media_type="application/json"
+    )
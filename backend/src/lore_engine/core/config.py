@@ -1,17 +1,81 @@
 """Configuration settings for the Lore Engine application."""
 
+from typing import Literal
+
+from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class LLMEndpointConfig(BaseModel):
+    """An OpenAI-compatible endpoint/model pair the generator can route calls to."""
+
+    name: str = Field(..., description="Unique name used in logs and metrics")
+    model: str = Field(..., description="Model name to request from the endpoint")
+    base_url: str | None = Field(None, description="API base URL (None for OpenAI)")
+    api_key: str | None = Field(None, description="API key (defaults to OPENAI_API_KEY)")
+    max_request_size: int | None = Field(
+        None, description="Largest request (items to generate) this endpoint should serve"
+    )
+    cost_weight: float = Field(1.0, description="Relative cost of a call; higher is avoided")
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     openai_api_key: str
     mcp_server_script_path: str = "src/lore_engine/mcp_server/server.py"
+    mcp_server_url: str | None = None
+    mcp_pool_size: int = 4
+    mcp_request_timeout: float = 30.0
+    environment: str = "development"
     log_level: str = "INFO"
+    log_format: Literal["json", "text"] = "json"
+    log_sample_rate: float = 0.1
+    log_payloads: bool | None = None
     openai_model: str = "gpt-4o-mini"
+    llm_endpoints: list[LLMEndpointConfig] = []
+    llm_latency_alpha: float = 0.3
+    llm_eject_after_failures: int = 3
+    llm_eject_seconds: float = 30.0
+    llm_max_connections: int = 100
+    llm_max_keepalive_connections: int = 20
+    llm_keepalive_expiry: float = 30.0
+    llm_http_timeout: float = 120.0
+    request_timeout_seconds: float | None = 120.0
+    disconnect_poll_interval: float = 0.5
+    lore_store_enabled: bool = True
+    lore_store_path: str = "data/lore.jsonl"
+    traffic_mode: Literal["live", "record", "replay"] = "live"
+    traffic_cassette_dir: str = "cassettes"
+    traffic_replay_time_scale: float = 1.0
+    speculative_quests: bool = False
+    speculation_max_inflight: int = 2
+    speculation_ttl_seconds: float = 300.0
+    speculation_max_entries: int = 128
+    session_max_sessions: int = 1000
+    session_ttl_seconds: float = 1800.0
+    session_max_turns: int = 8
+    quest_matrix_max_factions: int = 12
+    quest_matrix_max_concurrency: int = 8
+    debug_endpoints_enabled: bool = False
+    debug_token: str | None = None
+    profile_max_seconds: float = 60.0
+    profile_sample_interval: float = 0.005
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval: float = 0.05
+    loop_block_threshold: float = 0.25
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    @property
+    def payload_logging(self) -> bool:
+        """Whether tool arguments and LLM responses may be logged.
 
-    model_config = SettingsConfigDict(env_file=".env")
+        Defaults to on outside production unless ``log_payloads`` is set explicitly.
+        """
+        if self.log_payloads is not None:
+            return self.log_payloads
+        return self.environment != "production"
 
 
 settings = Settings()
@@ -0,0 +1,57 @@
+"""Per-request deadlines shared by every awaited step of a generation."""
+
+import asyncio
+import time
+from collections.abc import Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceededError(TimeoutError):
+    """Raised when a request runs out of its time budget."""
+
+
+class Deadline:
+    """Absolute point in time by which a request must finish.
+
+    Every step run through :meth:`run` gets only the budget that is left, so later LLM
+    iterations and tool calls get progressively shorter timeouts.
+
+    Args:
+        seconds: Total budget in seconds, or None for no deadline
+    """
+
+    def __init__(self, seconds: float | None) -> None:
+        """Start the deadline clock."""
+        self.seconds = seconds
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self) -> float | None:
+        """Seconds left before the deadline (never negative), or None if unbounded."""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    async def run(self, awaitable: Awaitable[T], step: str) -> T:
+        """Await ``awaitable`` within the remaining budget.
+
+        Args:
+            awaitable: Work to run
+            step: Short description of the work, used in the error message
+
+        Returns:
+            The awaitable's result
+
+        Raises:
+            DeadlineExceededError: If the budget runs out before the work completes
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, timeout=remaining)
+        except asyncio.TimeoutError as e:
+            raise DeadlineExceededError(
+                f"Request deadline of {self.seconds}s exceeded during {step}"
+            ) from e
@@ -1,12 +1,117 @@
-"""Logging configuration for the Lore Engine application."""
+"""Logging configuration for the Lore Engine application.
 
+Records are handed to a queue on the calling thread and formatted and written by a
+background listener thread, so logging never blocks the event loop on I/O.
+"""
+
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from typing import Any
 
 from lore_engine.core.config import settings
 
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    level=settings.log_level,
-)
+# Correlation id of the request being handled, set by the request id middleware
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+# Pass as ``extra=SAMPLED`` for verbose per-call lines that only need to be sampled
+SAMPLED = {"sampled": True}
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+
+
+class RequestContextFilter(logging.Filter):
+    """Attach the current request's correlation id to each record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Add ``record.request_id`` from the request context."""
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of records marked as sampled; other records always pass.
+
+    Args:
+        rate: Fraction of sampled records to keep (0.0-1.0)
+    """
+
+    def __init__(self, rate: float) -> None:
+        """Initialize the filter with its sample rate."""
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Drop sampled records that fall outside the sample rate."""
+        if not getattr(record, "sampled", False) or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize the record's core fields, plus exception info if present."""
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
+
+    The standard ``QueueHandler.prepare`` fully formats each record before enqueueing it,
+    which would put formatting cost back on the calling thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record as-is; it is only consumed within this process."""
+        return record
+
+
+def configure_logging() -> logging.handlers.QueueListener:
+    """Route root logging through a queue to a background listener thread.
+
+    Returns:
+        The started QueueListener (stopped automatically at interpreter exit)
+    """
+    if settings.log_format == "json":
+        formatter: logging.Formatter = JSONFormatter()
+    else:
+        formatter = logging.Formatter(TEXT_FORMAT)
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+    queue_handler.addFilter(SamplingFilter(settings.log_sample_rate))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(settings.log_level)
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+listener = configure_logging()
 
 logger = logging.getLogger("lore_engine")
@@ -0,0 +1,100 @@
+"""Event-loop lag monitor and blocking-call watchdog.
+
+Every route, the generation loop and MCP I/O share one event loop per worker, so any
+synchronous work on it stalls every concurrent request. ``LoopMonitor`` measures that
+cost continuously and finds its source:
+
+- A task on the loop sleeps for a fixed interval and records how late it wakes up in the
+  ``event_loop_lag_seconds`` histogram. Each wake-up also refreshes a heartbeat.
+- A watchdog thread checks the heartbeat. When the loop has not run for longer than the
+  block threshold, the watchdog captures the loop thread's stack, logs it and counts it in
+  ``event_loop_blocked_total``. The stacks are kept as collapsed stacks for
+  ``GET /debug/blocking``.
+"""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+
+from lore_engine.core.logging import logger
+from lore_engine.core.metrics import metrics
+from lore_engine.core.profiling import collapse_stack, format_stack, thread_frame
+
+LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LoopMonitor:
+    """Measures scheduling lag of the running event loop and reports blocking calls.
+
+    The watchdog reads the loop thread's stack when it gets the GIL, so a C call that
+    holds the GIL for the whole stall (e.g. a huge ``json.loads``) is attributed to the
+    code running right after it returns.
+
+    Args:
+        interval: Seconds between lag measurements
+        block_threshold: Seconds without a heartbeat before the loop counts as blocked
+    """
+
+    def __init__(self, interval: float = 0.05, block_threshold: float = 0.25) -> None:
+        """Prepare the monitor; call ``start`` from the event loop to begin."""
+        self.interval = interval
+        self.block_threshold = block_threshold
+        self.blocked_stacks: Counter[str] = Counter()
+        self._lag = metrics.histogram(
+            "event_loop_lag_seconds",
+            "Delay between a scheduled event-loop wake-up and when it ran",
+            buckets=LAG_BUCKETS,
+        )
+        self._blocked = metrics.counter(
+            "event_loop_blocked_total", "Times the event loop was blocked past the threshold"
+        )
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._stop = threading.Event()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+
+    async def _measure(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._heartbeat = time.monotonic()
+            self._lag.observe(max(self._heartbeat - start - self.interval, 0.0))
+
+    def _watch(self) -> None:
+        reported_beat = None
+        while not self._stop.wait(min(self.interval, self.block_threshold / 2)):
+            beat = self._heartbeat
+            stalled = time.monotonic() - beat - self.interval
+            if stalled < self.block_threshold or beat == reported_beat:
+                continue
+            # Report each stall once, with the stack the loop is stuck in
+            reported_beat = beat
+            frame = thread_frame(self._loop_thread_id)
+            if frame is None:
+                continue
+            self.blocked_stacks[collapse_stack(frame)] += 1
+            self._blocked.inc()
+            logger.warning(f"Event loop blocked for over {stalled:.3f}s in:\n{format_stack(frame)}")
+            del frame
+
+    def start(self) -> None:
+        """Start measuring the running event loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog.start()
+        logger.info(
+            f"Event-loop monitor started (interval={self.interval}s, "
+            f"block_threshold={self.block_threshold}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the measuring task and the watchdog."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        if self._watchdog.is_alive():
+            await asyncio.to_thread(self._watchdog.join)
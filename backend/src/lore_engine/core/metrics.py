@@ -0,0 +1,106 @@
+"""In-process metrics for the Lore Engine application."""
+
+import threading
+from bisect import bisect_left
+from typing import Any
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _label_key(labels: dict[str, str]) -> str:
+    return ",".join(f"{name}={value}" for name, value in sorted(labels.items()))
+
+
+class Counter:
+    """Monotonically increasing count, optionally split by labels."""
+
+    def __init__(self, description: str) -> None:
+        """Initialize the counter at zero."""
+        self.description = description
+        self._values: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increase the counter for the given labels."""
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for the given labels."""
+        return self._values.get(_label_key(labels), 0)
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable view of the counter."""
+        return {"type": "counter", "description": self.description, "values": dict(self._values)}
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets, optionally split by labels."""
+
+    def __init__(self, description: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize an empty histogram with upper-bound ``buckets``."""
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation for the given labels."""
+        key = _label_key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+                self._series[key] = series
+            series["counts"][index] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable view of the histogram with cumulative bucket counts."""
+        values = {}
+        with self._lock:
+            for key, series in self._series.items():
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip((*self.buckets, "+Inf"), series["counts"], strict=True):
+                    cumulative += count
+                    buckets[str(bound)] = cumulative
+                values[key] = {"buckets": buckets, "sum": series["sum"], "count": series["count"]}
+        return {"type": "histogram", "description": self.description, "values": values}
+
+
+class MetricsRegistry:
+    """Named collection of metrics, created on first use."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """Get or create the counter called ``name``."""
+        with self._lock:
+            metric = self._metrics.setdefault(name, Counter(description))
+        if not isinstance(metric, Counter):
+            raise TypeError(f"Metric '{name}' is not a counter")
+        return metric
+
+    def histogram(
+        self, name: str, description: str = "", buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Get or create the histogram called ``name``."""
+        with self._lock:
+            metric = self._metrics.setdefault(name, Histogram(description, buckets))
+        if not isinstance(metric, Histogram):
+            raise TypeError(f"Metric '{name}' is not a histogram")
+        return metric
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable view of every registered metric."""
+        return {name: metric.snapshot() for name, metric in sorted(self._metrics.items())}
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,128 @@
+"""On-demand profiling of the API process.
+
+Two profilers are available, both costing nothing until started:
+
+- ``StackSampler`` samples the stack of the event-loop thread at a fixed interval and
+  aggregates the samples as collapsed stacks, the input format of flamegraph tools. The
+  coroutine frames of whichever task is running are on that stack, so samples attribute
+  CPU time to the awaiting code path.
+- ``cProfile`` (deterministic) is enabled on the event-loop thread for the window, so
+  it records every call made by any task on the loop.
+"""
+
+import cProfile
+import io
+import marshal
+import os
+import pstats
+import signal
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Any
+
+
+def frame_label(frame: FrameType) -> str:
+    """Short ``function (path:line)`` label for a frame."""
+    code = frame.f_code
+    path = os.path.join(*code.co_filename.split(os.sep)[-2:])
+    return f"{code.co_name} ({path}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    """Render a stack as a collapsed line: outermost frame first, frames joined by ``;``."""
+    labels = []
+    while frame is not None:
+        labels.append(frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def format_stack(frame: FrameType | None) -> str:
+    """Render a stack as indented lines, outermost frame first, with current line numbers."""
+    lines = []
+    while frame is not None:
+        code = frame.f_code
+        lines.append(f"  {code.co_filename}:{frame.f_lineno} in {code.co_name}")
+        frame = frame.f_back
+    return "\n".join(reversed(lines))
+
+
+def thread_frame(thread_id: int) -> FrameType | None:
+    """Current frame of a thread, or None if the thread is gone."""
+    return sys._current_frames().get(thread_id)
+
+
+class StackSampler:
+    """Samples the stack of a thread at a fixed interval.
+
+    When the sampled thread is the main thread of a Unix process (where uvicorn runs the
+    event loop), a ``SIGPROF`` timer drives the sampling: it ticks on CPU time and its
+    handler runs on the sampled thread between bytecodes, so samples land exactly where
+    Python code is burning CPU and idle waits are not sampled. Otherwise a background
+    thread reads ``sys._current_frames()``, which can only sample when the thread
+    releases the GIL and so over-represents I/O waits.
+
+    Args:
+        thread_id: Identifier of the thread to sample (``threading.get_ident()``)
+        interval: Seconds between samples
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005) -> None:
+        """Prepare the sampler; call ``start`` from the sampled thread to begin."""
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[str] = Counter()
+        self.use_signal = (
+            hasattr(signal, "setitimer") and thread_id == threading.main_thread().ident
+        )
+        self._previous_handler: Any = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _on_signal(self, signum: int, frame: FrameType | None) -> None:
+        self.samples[collapse_stack(frame)] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = thread_frame(self.thread_id)
+            if frame is not None:
+                self.samples[collapse_stack(frame)] += 1
+            del frame
+
+    def start(self) -> None:
+        """Start sampling."""
+        if self.use_signal:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        """Stop sampling and return the sample count per collapsed stack."""
+        if self.use_signal:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self._previous_handler)
+        else:
+            self._stop.set()
+            self._thread.join()
+        return self.samples
+
+
+def collapsed_output(samples: Counter[str]) -> str:
+    """Format samples as collapsed-stack lines (``stack count``), heaviest first."""
+    return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+
+
+def pstats_output(profiler: cProfile.Profile, sort: str = "cumulative", limit: int = 100) -> str:
+    """Format a finished cProfile run as a pstats text report."""
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+def pstats_dump(profiler: cProfile.Profile) -> bytes:
+    """Serialize a finished cProfile run in the binary format read by ``pstats.Stats``."""
+    profiler.create_stats()
+    return marshal.dumps(profiler.stats)
@@ -2,6 +2,7 @@
 
 from lore_engine.core import logger, settings
 from lore_engine.mcp_client.client import MCPClient
+from lore_engine.mcp_client.pool import MCPClientPool
 
 
 async def get_mcp_client(server_script_path: str | None = None) -> MCPClient:
@@ -28,4 +29,4 @@ async def get_mcp_client(server_script_path: str | None = None) -> MCPClient:
     return client
 
 
-__all__ = ["MCPClient", "get_mcp_client"]
+__all__ = ["MCPClient", "MCPClientPool", "get_mcp_client"]
@@ -1,13 +1,48 @@
 """MCP Client wrapper for managing connections to MCP servers."""
 
+import asyncio
 from contextlib import AsyncExitStack
+from datetime import timedelta
 from typing import Any
 
-from mcp import ClientSession, StdioServerParameters
+import anyio
+import httpx
+from mcp import ClientSession, McpError, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import CONNECTION_CLOSED
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from lore_engine.core import logger
+try:
+    from mcp.client.streamable_http import streamable_http_client
+except ImportError:  # mcp < 1.24
+    from mcp.client.streamable_http import streamablehttp_client as streamable_http_client
+
+from lore_engine.core import logger, settings
+from lore_engine.core.logging import SAMPLED
+
+# Transport failures meaning the session to an HTTP server is gone and worth reconnecting
+TRANSPORT_ERRORS = (
+    httpx.TransportError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+)
+
+# Codes of the errors the client transport reports when the session itself is gone: the
+# connection closed, or the server answered 404 for a session it no longer knows (the
+# streamable HTTP client reports this with a positive 32600, not JSON-RPC's -32600)
+SESSION_GONE_CODES = frozenset({CONNECTION_CLOSED, 32600})
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """Whether ``error`` means the session is gone and worth reconnecting.
+
+    Errors the server answered a call with (tool and protocol errors, request timeouts)
+    are not: reconnecting would tear down a session shared by other requests and repeat
+    a call that may not be safe to repeat.
+    """
+    if isinstance(error, McpError):
+        return error.error.code in SESSION_GONE_CODES
+    return isinstance(error, TRANSPORT_ERRORS)
 
 
 class MCPClient:
@@ -18,6 +53,10 @@ class MCPClient:
         self.session: ClientSession | None = None
         self.exit_stack: AsyncExitStack | None = None
         self.is_connected: bool = False
+        self.server_url: str | None = None
+        self._owner: asyncio.Task[None] | None = None
+        self._stop: asyncio.Event | None = None
+        self._reconnect_lock = asyncio.Lock()
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
     async def connect(self, server_script_path: str) -> None:
@@ -34,7 +73,9 @@ class MCPClient:
             logger.info(f"Connecting to MCP server at {server_script_path}")
 
             server_params = StdioServerParameters(
-                command="poetry", args=["run", "python", "-m", server_script_path]
+                # Explicit, so MCP_TRANSPORT meant for a standalone server does not apply
+                command="poetry",
+                args=["run", "python", "-m", server_script_path, "--transport", "stdio"],
             )
             self.exit_stack = AsyncExitStack()
             stdio_transport = await self.exit_stack.enter_async_context(stdio_client(server_params))
@@ -53,6 +94,95 @@ class MCPClient:
                 await self.exit_stack.aclose()
             raise
 
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10))
+    async def connect_url(self, url: str) -> None:
+        """
+        Connect to an MCP server over streamable HTTP.
+
+        The session is held open by a background task so it can be shared by many
+        requests and reconnected from any of them.
+
+        Args:
+            url: Endpoint of the server, e.g. ``http://127.0.0.1:8765/mcp``
+
+        Raises:
+            Exception: If connection or initialization fails
+        """
+        logger.info(f"Connecting to MCP server at {url}")
+        self.server_url = url
+        self._stop = asyncio.Event()
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._owner = asyncio.create_task(self._hold_session(url, self._stop, ready))
+        try:
+            await ready
+        except Exception as e:
+            logger.error(f"Failed to connect to MCP server: {e}")
+            raise
+        logger.info("Successfully connected to MCP server")
+
+    async def _hold_session(
+        self, url: str, stop: asyncio.Event, ready: asyncio.Future[None]
+    ) -> None:
+        """Open the HTTP session and keep it open until ``stop`` is set."""
+        try:
+            async with (
+                streamable_http_client(url) as (read_stream, write_stream, _),
+                ClientSession(
+                    read_stream,
+                    write_stream,
+                    read_timeout_seconds=timedelta(seconds=settings.mcp_request_timeout),
+                ) as session,
+            ):
+                await session.initialize()
+                self.session = session
+                self.is_connected = True
+                ready.set_result(None)
+                await stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"MCP session to {url} closed: {e}")
+        finally:
+            self.is_connected = False
+            self.session = None
+
+    async def reconnect(self, failed_session: ClientSession | None = None) -> None:
+        """Replace the HTTP session, unless another caller already replaced it.
+
+        Args:
+            failed_session: The session that failed; no-op if it is no longer current.
+                Without it, no-op if a live session is already in place.
+        """
+        if self.server_url is None:
+            raise RuntimeError("Only streamable HTTP connections can be reconnected")
+        async with self._reconnect_lock:
+            if failed_session is not None and self.session is not failed_session:
+                return
+            if failed_session is None and self.is_connected and self.session is not None:
+                # Another caller reconnected while this one waited for the lock
+                return
+            logger.warning(f"Reconnecting to MCP server at {self.server_url}")
+            await self.cleanup()
+            await self.connect_url(self.server_url)
+
+    async def _request(self, name: str, call: Any) -> Any:
+        """Run ``call(session)``, reconnecting once if an HTTP session has gone away."""
+        if not self.is_connected or not self.session:
+            if self.server_url is None:
+                raise RuntimeError("Not connected to MCP server. Call connect() first.")
+            await self.reconnect()
+
+        session = self.session
+        try:
+            return await call(session)
+        except Exception as e:
+            if self.server_url is None or not is_connection_error(e):
+                raise
+            logger.warning(f"MCP {name} failed on a broken session ({e}), retrying")
+            await self.reconnect(session)
+            return await call(self.session)
+
     async def list_tools(self) -> list[dict[str, Any]]:
         """
         List all available tools from the connected MCP server.
@@ -64,12 +194,9 @@ class MCPClient:
             RuntimeError: If not connected to server
             Exception: If listing tools fails
         """
-        if not self.is_connected or not self.session:
-            raise RuntimeError("Not connected to MCP server. Call connect() first.")
-
         try:
-            logger.info("Listing available tools from MCP server")
-            response = await self.session.list_tools()
+            logger.info("Listing available tools from MCP server", extra=SAMPLED)
+            response = await self._request("list_tools", lambda session: session.list_tools())
 
             tools = []
             for tool in response.tools:
@@ -81,7 +208,7 @@ class MCPClient:
                     }
                 )
 
-            logger.info(f"Found {len(tools)} available tools")
+            logger.info(f"Found {len(tools)} available tools", extra=SAMPLED)
             return tools
 
         except Exception as e:
@@ -103,14 +230,19 @@ class MCPClient:
             RuntimeError: If not connected to server
             Exception: If tool call fails
         """
-        if not self.is_connected or not self.session:
-            raise RuntimeError("Not connected to MCP server. Call connect() first.")
-
         try:
-            logger.info(f"Calling tool '{tool_name}' with arguments: {arguments}")
-            result = await self.session.call_tool(tool_name, arguments or {})
+            if settings.payload_logging:
+                logger.info(
+                    f"Calling tool '{tool_name}' with arguments: {arguments}", extra=SAMPLED
+                )
+            else:
+                logger.info(f"Calling tool '{tool_name}'", extra=SAMPLED)
+            result = await self._request(
+                f"call to '{tool_name}'",
+                lambda session: session.call_tool(tool_name, arguments or {}),
+            )
 
-            logger.info(f"Tool '{tool_name}' executed successfully")
+            logger.info(f"Tool '{tool_name}' executed successfully", extra=SAMPLED)
             return result.content
 
         except Exception as e:
@@ -123,6 +255,12 @@ class MCPClient:
 
         This should be called when the client is no longer needed.
         """
+        if self._owner is not None:
+            self._stop.set()
+            await self._owner
+            self._owner = None
+            return
+
         try:
             if self.exit_stack:
                 logger.info("Cleaning up MCP client resources")
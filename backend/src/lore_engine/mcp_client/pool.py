@@ -0,0 +1,43 @@
+"""Pool of long-lived MCP sessions to a shared streamable-HTTP server."""
+
+import asyncio
+import itertools
+
+from lore_engine.core import logger
+from lore_engine.mcp_client.client import MCPClient
+
+
+class MCPClientPool:
+    """Fixed set of MCP sessions shared by every request of an API worker.
+
+    An MCP session multiplexes concurrent requests, so clients are handed out
+    round-robin rather than checked out exclusively. Each client reconnects on its own
+    when its session breaks.
+
+    Args:
+        url: Endpoint of the MCP server, e.g. ``http://127.0.0.1:8765/mcp``
+        size: Number of sessions to keep open
+    """
+
+    def __init__(self, url: str, size: int = 4) -> None:
+        """Create the pool; call ``start`` to open the sessions."""
+        self.url = url
+        self.clients = [MCPClient() for _ in range(max(size, 1))]
+        self._next = itertools.cycle(self.clients)
+
+    async def start(self) -> None:
+        """Open every session of the pool.
+
+        Raises:
+            Exception: If the server cannot be reached
+        """
+        await asyncio.gather(*(client.connect_url(self.url) for client in self.clients))
+        logger.info(f"Opened {len(self.clients)} MCP session(s) to {self.url}")
+
+    def get(self) -> MCPClient:
+        """Get the next client of the pool; do not clean it up after use."""
+        return next(self._next)
+
+    async def aclose(self) -> None:
+        """Close every session of the pool."""
+        await asyncio.gather(*(client.cleanup() for client in self.clients), return_exceptions=True)
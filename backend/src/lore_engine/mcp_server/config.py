@@ -0,0 +1,33 @@
+"""Configuration settings for the Lore Engine MCP server."""
+
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+ToolSource = Literal["remote", "local", "auto"]
+Transport = Literal["stdio", "streamable-http"]
+
+
+class MCPServerSettings(BaseSettings):
+    """MCP server settings loaded from ``MCP_``-prefixed environment variables.
+
+    Each seed tool can be served from the upstream Genrenator API (``remote``), from the
+    built-in grammar generator (``local``), or from the upstream with an automatic local
+    fallback when it is slow or down (``auto``).
+
+    The server runs over stdio as a child of one API worker by default, or as a
+    standalone streamable-HTTP service shared by every worker.
+    """
+
+    genre_source: ToolSource = "auto"
+    story_source: ToolSource = "auto"
+    upstream_timeout: float = 2.0
+    generator_seed: int | None = None
+    transport: Transport = "stdio"
+    host: str = "127.0.0.1"
+    port: int = 8765
+
+    model_config = SettingsConfigDict(env_prefix="MCP_", env_file=".env", extra="ignore")
+
+
+server_settings = MCPServerSettings()
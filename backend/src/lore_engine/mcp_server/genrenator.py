@@ -0,0 +1,203 @@
+"""Offline grammar-based genre and story generator.
+
+Produces phrases in the style of the Genrenator API (e.g. "post-doom zydeco" or
+"You're never too old to listen to israeli ska.") from small preloaded vocabularies,
+so the seed tools keep working without the upstream service.
+"""
+
+import random
+
+PREFIXES = (
+    "post",
+    "neo",
+    "proto",
+    "pseudo",
+    "nu",
+    "avant",
+    "anti",
+    "retro",
+    "cyber",
+    "psycho",
+)
+
+REGIONS = (
+    "israeli",
+    "nordic",
+    "swedish",
+    "tropical",
+    "brazilian",
+    "icelandic",
+    "balkan",
+    "celtic",
+    "siberian",
+    "andalusian",
+    "appalachian",
+    "mongolian",
+)
+
+MOODS = (
+    "dark",
+    "doom",
+    "acid",
+    "lo-fi",
+    "cosmic",
+    "progressive",
+    "melodic",
+    "industrial",
+    "gothic",
+    "ambient",
+    "noise",
+    "baroque",
+    "triangle",
+    "christian",
+    "experimental",
+)
+
+STYLES = (
+    "ska",
+    "polka",
+    "jazz",
+    "metal",
+    "cabaret",
+    "bluegrass",
+    "zydeco",
+    "folk",
+    "hip hop",
+    "disco",
+    "shoegaze",
+    "opera",
+    "dub",
+    "surf rock",
+    "chiptune",
+    "waltz",
+    "sea shanty",
+    "trance",
+)
+
+SUFFIXES = (
+    "core",
+    "wave",
+    "step",
+    "gaze",
+    "punk",
+    "tronica",
+)
+
+TAILS = (
+    "revival",
+    "fusion",
+    "listening",
+    "video game music",
+    "choir",
+    "ensemble",
+)
+
+GENRE_RULES = (
+    ("mood", "style"),
+    ("region", "style"),
+    ("prefix-mood", "style"),
+    ("region", "mood", "style"),
+    ("mood", "style-suffix"),
+    ("prefix-style",),
+    ("region", "style", "tail"),
+    ("mood", "style", "tail"),
+)
+
+STORY_TEMPLATES = (
+    "You're never too old to listen to {genre}.",
+    "Legend says {genre} was invented by {subject} {place}.",
+    "{Subject} refused to play anything but {genre} for {duration}.",
+    "Nobody expected {subject} to start a band playing {genre} {place}.",
+    "The only cure for the curse was {duration} of {genre}.",
+    "{Subject} found a lost record of {genre} {place} and was never the same.",
+    "Every full moon, {subject} hosts {genre} nights {place}.",
+    "It took {duration} for {subject} to master {genre}.",
+)
+
+SUBJECTS = (
+    "a retired lighthouse keeper",
+    "a coven of witches",
+    "a disgraced knight",
+    "two rival bakers",
+    "a talking raven",
+    "the village blacksmith",
+    "a forgetful necromancer",
+    "a band of smugglers",
+    "an exiled princess",
+    "a wandering monk",
+)
+
+PLACES = (
+    "in a flooded cathedral",
+    "beneath the old mill",
+    "at the edge of the world",
+    "in a tavern with no doors",
+    "on a ship made of bones",
+    "in the ruins of a sky fortress",
+    "deep in the salt mines",
+    "behind the city walls",
+)
+
+DURATIONS = (
+    "seven years",
+    "a single night",
+    "three winters",
+    "a hundred days",
+    "an entire lifetime",
+    "one eclipse",
+)
+
+
+class Genrenator:
+    """Generates random genres and stories from a compact grammar.
+
+    Args:
+        seed: Optional seed for reproducible output. ``None`` seeds from system entropy.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        """Initialize the generator with its own random number generator."""
+        self._rng = random.Random(seed)
+
+    def _slot(self, slot: str) -> str:
+        choice = self._rng.choice
+        if slot == "mood":
+            return choice(MOODS)
+        if slot == "style":
+            return choice(STYLES)
+        if slot == "region":
+            return choice(REGIONS)
+        if slot == "tail":
+            return choice(TAILS)
+        if slot == "prefix-mood":
+            return f"{choice(PREFIXES)}-{choice(MOODS)}"
+        if slot == "prefix-style":
+            return f"{choice(PREFIXES)}-{choice(STYLES)}"
+        if slot == "style-suffix":
+            return f"{choice(STYLES).replace(' ', '')}{choice(SUFFIXES)}"
+        raise ValueError(f"Unknown grammar slot: {slot}")
+
+    def genre(self) -> str:
+        """Generate a random music genre.
+
+        Returns:
+            Lowercase genre phrase, e.g. "balkan doom polka"
+        """
+        rule = self._rng.choice(GENRE_RULES)
+        return " ".join(self._slot(slot) for slot in rule)
+
+    def story(self) -> str:
+        """Generate a random one-sentence story built around a random genre.
+
+        Returns:
+            Story sentence, e.g. "You're never too old to listen to israeli ska."
+        """
+        choice = self._rng.choice
+        subject = choice(SUBJECTS)
+        return choice(STORY_TEMPLATES).format(
+            genre=self.genre(),
+            subject=subject,
+            Subject=subject[0].upper() + subject[1:],
+            place=choice(PLACES),
+            duration=choice(DURATIONS),
+        )
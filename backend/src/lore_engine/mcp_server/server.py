@@ -1,45 +1,131 @@
 """MCP Server implementation for the Lore Engine."""
 
+import argparse
+import asyncio
+import logging
+from typing import Annotated
+
 import httpx
 from mcp.server.fastmcp import FastMCP
+from pydantic import Field
+
+from lore_engine.mcp_server.config import ToolSource, server_settings
+from lore_engine.mcp_server.genrenator import Genrenator
+
+GENRENATOR_API_URL = "https://binaryjazz.us/wp-json/genrenator/v1"
+
+# Most seeds a batch tool returns in one call
+MAX_BATCH = 10
+
+logger = logging.getLogger("lore_engine.mcp_server")
 
 mcp = FastMCP("lore-engine-mcp")
+genrenator = Genrenator(seed=server_settings.generator_seed)
+
+
+async def _fetch_upstream(client: httpx.AsyncClient, resource: str) -> str:
+    """Fetch a random phrase from the Genrenator API.
+
+    Args:
+        client: HTTP client to send the request with
+        resource: API resource to fetch ("genre" or "story")
+
+    Returns:
+        The phrase returned by the API
+
+    Raises:
+        httpx.HTTPError: If the request fails or exceeds the upstream timeout
+        ValueError: If the API returns no data
+    """
+    response = await client.get(f"{GENRENATOR_API_URL}/{resource}/")
+    response.raise_for_status()
+    data = response.json()
+    if not data:
+        raise ValueError(f"No {resource} data found")
+    return data
+
+
+async def _fetch(resource: str, source: ToolSource, count: int = 1) -> list[str]:
+    """Fetch phrases from the configured source, falling back to the local generator.
+
+    Remote phrases are fetched concurrently over a single HTTP client.
+
+    Args:
+        resource: Resource to produce ("genre" or "story")
+        source: Where to get it from ("remote", "local" or "auto")
+        count: Number of phrases to fetch
+
+    Returns:
+        The phrases; a phrase whose remote fetch fails without fallback is replaced by
+        an error message
+    """
+    local = genrenator.genre if resource == "genre" else genrenator.story
+    if source == "local":
+        return [local() for _ in range(count)]
+
+    async def fetch_one(client: httpx.AsyncClient) -> str:
+        try:
+            return await _fetch_upstream(client, resource)
+        except (httpx.HTTPError, ValueError) as e:
+            if source == "auto":
+                logger.warning(f"Upstream {resource} fetch failed, using local generator: {e}")
+                return local()
+            return f"Error fetching {resource}: {str(e)}"
+
+    async with httpx.AsyncClient(timeout=server_settings.upstream_timeout) as client:
+        return list(await asyncio.gather(*(fetch_one(client) for _ in range(count))))
 
 
 @mcp.tool()
 async def fetch_genre() -> str:
     """Fetches a random genre from the Genrenator API."""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("https://binaryjazz.us/wp-json/genrenator/v1/genre/")
-            response.raise_for_status()
-            data = response.json()
-            if not data:
-                raise ValueError("No genre data found")
-            return data
-    except (httpx.HTTPError, ValueError) as e:
-        return f"Error fetching genre: {str(e)}"
+    [genre] = await _fetch("genre", server_settings.genre_source)
+    return genre
 
 
 @mcp.tool()
 async def fetch_story() -> str:
     """Fetches a random story from the Genrenator API."""
+    [story] = await _fetch("story", server_settings.story_source)
+    return story
+
+
+@mcp.tool()
+async def fetch_genres(
+    n: Annotated[int, Field(ge=1, le=MAX_BATCH, description="Number of genres to fetch")],
+) -> list[str]:
+    """Fetches n random genres in one call; prefer it to n fetch_genre calls."""
+    return await _fetch("genre", server_settings.genre_source, n)
+
+
+@mcp.tool()
+async def fetch_stories(
+    n: Annotated[int, Field(ge=1, le=MAX_BATCH, description="Number of stories to fetch")],
+) -> list[str]:
+    """Fetches n random stories in one call; prefer it to n fetch_story calls."""
+    return await _fetch("story", server_settings.story_source, n)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the MCP server.
+
+    Args:
+        argv: Command-line arguments (defaults to ``sys.argv``); see ``--help``
+    """
+    parser = argparse.ArgumentParser(description="Lore Engine MCP server")
+    parser.add_argument(
+        "--transport", choices=["stdio", "streamable-http"], default=server_settings.transport
+    )
+    parser.add_argument("--host", default=server_settings.host)
+    parser.add_argument("--port", type=int, default=server_settings.port)
+    args = parser.parse_args(argv)
+
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("https://binaryjazz.us/wp-json/genrenator/v1/story/")
-            response.raise_for_status()
-            data = response.json()
-            if not data:
-                raise ValueError("No genre data found")
-            return data
-    except (httpx.HTTPError, ValueError) as e:
-        return f"Error fetching story: {str(e)}"
-
-
-def main() -> None:
-    """Run the MCP server."""
-    try:
-        mcp.run(transport="stdio")
+        if args.transport == "streamable-http":
+            mcp.settings.host = args.host
+            mcp.settings.port = args.port
+            logger.info(f"Serving MCP over streamable HTTP at http://{args.host}:{args.port}/mcp")
+        mcp.run(transport=args.transport)
     except Exception as e:
         print(f"Error running MCP server: {str(e)}", flush=True)
         raise
@@ -1,5 +1,11 @@
 """Pydantic models for API requests and responses."""
 
-from lore_engine.models.responses import FactionResponse, FactionsResponse, QuestResponse
+from lore_engine.models.responses import (
+    FactionResponse,
+    FactionsPage,
+    FactionsResponse,
+    QuestResponse,
+    QuestsPage,
+)
 
-__all__ = ["FactionResponse", "FactionsResponse", "QuestResponse"]
+__all__ = ["FactionResponse", "FactionsPage", "FactionsResponse", "QuestResponse", "QuestsPage"]
@@ -1,8 +1,8 @@
 """Response models for the Lore Engine API."""
 
-from typing import Any
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class FactionInput(BaseModel):
@@ -17,6 +17,7 @@ class FactionInput(BaseModel):
 class FactionResponse(BaseModel):
     """Response model for a single faction."""
 
+    id: str | None = Field(None, description="Stable id of the faction in the lore store")
     name: str = Field(..., description="The faction's name")
     symbol: str = Field(..., description="Description of the faction's symbol or emblem")
     values: str = Field(..., description="Core beliefs and values of the faction")
@@ -49,6 +50,7 @@ class QuestRequest(BaseModel):
 class QuestResponse(BaseModel):
     """Response model for a quest."""
 
+    id: str | None = Field(None, description="Stable id of the quest in the lore store")
     title: str = Field(..., description="The quest title")
     quest_brief: str = Field(..., description="Brief description of the quest")
     npcs: list[NPC] | str = Field(..., description="Key NPCs involved in the quest")
@@ -57,19 +59,97 @@ class QuestResponse(BaseModel):
 
     @field_validator("npcs", mode="before")
     @classmethod
-    def validate_npcs(cls, v: Any) -> list[NPC] | str:
-        """Convert NPCs to proper format if needed."""
+    def validate_npcs(cls, v: Any) -> Any:
+        """Coerce NPCs that are neither a string nor a list of NPC objects to a string.
+
+        A list of dicts is left to the ``list[NPC]`` schema, which validates it in one
+        pass.
+        """
         if isinstance(v, str):
             return v
-        elif isinstance(v, list):
-            npcs = []
-            for npc in v:
-                if isinstance(npc, dict):
-                    npcs.append(NPC(**npc))
-                elif isinstance(npc, NPC):
-                    npcs.append(npc)
-                else:
-                    return str(v)
-            return npcs
-        else:
-            return str(v)
+        if isinstance(v, list) and all(isinstance(npc, (dict, NPC)) for npc in v):
+            return v
+        return str(v)
+
+
+class QuestMatrixRequest(BaseModel):
+    """Request model for generating quests for pairs of factions."""
+
+    factions: list[FactionInput] = Field(..., min_length=2, description="Factions to pair up")
+    pairs: list[tuple[int, int]] | None = Field(
+        None,
+        description="Unordered pairs of faction indices (0-based), each generated once; "
+        "every pair if omitted",
+    )
+    max_concurrency: int = Field(4, ge=1, description="Maximum quests generated at once")
+
+    @model_validator(mode="after")
+    def validate_pairs(self) -> "QuestMatrixRequest":
+        """Check that every pair names two different factions of the request.
+
+        Pairs are unordered: each is normalized to ascending order and duplicates are
+        dropped, so no request generates more quests than there are distinct pairs.
+        """
+        if self.pairs is None:
+            return self
+        count = len(self.factions)
+        if len(self.pairs) > count * (count - 1) // 2:
+            raise ValueError(f"At most {count * (count - 1) // 2} pairs of {count} factions")
+        for first, second in self.pairs:
+            if not (0 <= first < count and 0 <= second < count):
+                raise ValueError(f"Pair ({first}, {second}) is out of range")
+            if first == second:
+                raise ValueError(f"Pair ({first}, {second}) must name two different factions")
+        self.pairs = list(dict.fromkeys(tuple(sorted(pair)) for pair in self.pairs))
+        return self
+
+
+class QuestMatrixItem(BaseModel):
+    """One line of the quest matrix stream: the quest of a faction pair, or its error."""
+
+    pair: tuple[int, int] = Field(..., description="Indices of the two factions")
+    quest: QuestResponse | None = Field(None, description="The generated quest")
+    error: str | None = Field(None, description="Why the quest could not be generated")
+
+
+class FactionsPage(BaseModel):
+    """Response model for a page of stored factions."""
+
+    factions: list[FactionResponse] = Field(..., description="Stored factions, newest first")
+    next_cursor: int | None = Field(None, description="Cursor for the next page, if any")
+
+
+class QuestsPage(BaseModel):
+    """Response model for a page of stored quests."""
+
+    quests: list[QuestResponse] = Field(..., description="Stored quests, newest first")
+    next_cursor: int | None = Field(None, description="Cursor for the next page, if any")
+
+
+class FactionsAction(BaseModel):
+    """Session action: generate a new faction set for the session."""
+
+    action: Literal["factions"]
+    count: int = Field(1, ge=1, le=10, description="Number of factions to generate (1-10)")
+
+
+class QuestAction(BaseModel):
+    """Session action: generate a quest for the session's factions."""
+
+    action: Literal["quest"]
+    factions: list[FactionInput] | None = Field(
+        None, description="Factions to use instead of the session's current ones"
+    )
+
+
+class TweakFactionAction(BaseModel):
+    """Session action: revise one faction of the session."""
+
+    action: Literal["tweak_faction"]
+    index: int = Field(..., ge=1, description="Position of the faction to revise (1-based)")
+    instruction: str = Field(..., min_length=1, description="How to change the faction")
+
+
+SessionAction = Annotated[
+    FactionsAction | QuestAction | TweakFactionAction, Field(discriminator="action")
+]
@@ -1,5 +1,14 @@
 """Services module for lore generation."""
 
 from lore_engine.services.lore_generator import LoreGenerator, create_lore_generator
+from lore_engine.services.lore_store import LoreStore
+from lore_engine.services.sessions import SessionStore
+from lore_engine.services.speculation import QuestSpeculator
 
-__all__ = ["LoreGenerator", "create_lore_generator"]
+__all__ = [
+    "LoreGenerator",
+    "LoreStore",
+    "QuestSpeculator",
+    "SessionStore",
+    "create_lore_generator",
+]
@@ -0,0 +1,205 @@
+"""Latency- and cost-aware routing of LLM calls across OpenAI-compatible endpoints."""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from lore_engine.core.config import LLMEndpointConfig, settings
+from lore_engine.core.logging import logger
+from lore_engine.core.metrics import metrics
+
+# Penalty multiplier applied to an endpoint's score per unit of error rate
+ERROR_PENALTY = 4.0
+
+llm_latency = metrics.histogram("llm_call_seconds", "Latency of LLM calls by endpoint")
+llm_errors = metrics.counter("llm_call_errors_total", "Failed LLM calls by endpoint")
+llm_ejections = metrics.counter("llm_endpoint_ejections_total", "Endpoint ejections")
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Build the pooled keep-alive HTTP client shared by every LLM endpoint."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(settings.llm_http_timeout, connect=10.0),
+    )
+
+
+def create_chat_model(
+    config: LLMEndpointConfig, http_client: httpx.AsyncClient | None = None
+) -> ChatOpenAI:
+    """Build the chat model for an endpoint configuration.
+
+    Args:
+        config: Endpoint configuration
+        http_client: Shared async HTTP client to send requests through
+    """
+    return ChatOpenAI(
+        model=config.model,
+        temperature=0.9,
+        api_key=config.api_key or settings.openai_api_key,
+        base_url=config.base_url,
+        http_async_client=http_client,
+    )
+
+
+class LLMEndpoint:
+    """A routable endpoint with its chat model and observed health.
+
+    Args:
+        config: Endpoint configuration
+        llm: Chat model bound to the endpoint
+    """
+
+    def __init__(self, config: LLMEndpointConfig, llm: Any) -> None:
+        """Initialize the endpoint with no observations."""
+        self.config = config
+        self.llm = llm
+        self.latency_ewma: float | None = None
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+
+    @property
+    def name(self) -> str:
+        """Endpoint name from its configuration."""
+        return self.config.name
+
+    def serves(self, request_size: int) -> bool:
+        """Whether the endpoint is configured to handle requests of this size."""
+        limit = self.config.max_request_size
+        return limit is None or request_size <= limit
+
+    def is_ejected(self, now: float) -> bool:
+        """Whether the endpoint is currently ejected from routing."""
+        return now < self.ejected_until
+
+    def score(self) -> float:
+        """Expected cost of routing a call here; lower is better.
+
+        Endpoints with no observations score 0 so each one is tried at least once.
+        """
+        if self.latency_ewma is None:
+            return 0.0
+        return self.latency_ewma * self.config.cost_weight * (1 + ERROR_PENALTY * self.error_rate)
+
+
+class LLMRouter:
+    """Routes each LLM call to the best available endpoint.
+
+    Endpoints are filtered by the request size they serve and ranked by a moving
+    average of observed latency, weighted by cost and recent error rate. An endpoint
+    that fails several times in a row is ejected for a cool-down period, after which it
+    gets a single trial call before being ejected again on failure.
+
+    Args:
+        configs: Endpoint configurations, in order of preference for ties
+        llm_factory: Builds the chat model for a configuration. Defaults to ChatOpenAI
+            models sharing one pooled HTTP client owned by the router.
+    """
+
+    def __init__(
+        self,
+        configs: list[LLMEndpointConfig],
+        llm_factory: Callable[[LLMEndpointConfig], Any] | None = None,
+    ) -> None:
+        """Create the endpoints and their chat models."""
+        if not configs:
+            raise ValueError("At least one LLM endpoint must be configured")
+        self.http_client: httpx.AsyncClient | None = None
+        if llm_factory is None:
+            self.http_client = create_http_client()
+            models = [create_chat_model(config, self.http_client) for config in configs]
+        else:
+            models = [llm_factory(config) for config in configs]
+        self.endpoints = [
+            LLMEndpoint(config, llm) for config, llm in zip(configs, models, strict=True)
+        ]
+        self.alpha = settings.llm_latency_alpha
+        self.eject_after = settings.llm_eject_after_failures
+        self.eject_seconds = settings.llm_eject_seconds
+
+    def select(
+        self, request_size: int = 1, exclude: LLMEndpoint | None = None
+    ) -> LLMEndpoint | None:
+        """Pick the endpoint for a call.
+
+        Args:
+            request_size: Number of items the request generates
+            exclude: Endpoint to skip, e.g. one that just failed this call
+
+        Returns:
+            The best available endpoint. If every suitable endpoint is ejected, the one
+            whose ejection ends soonest is returned rather than failing the call. None
+            only if ``exclude`` was the sole candidate.
+        """
+        now = time.monotonic()
+        candidates = [e for e in self.endpoints if e is not exclude]
+        if not candidates:
+            return None
+        suitable = [e for e in candidates if e.serves(request_size)] or candidates
+        available = [e for e in suitable if not e.is_ejected(now)]
+        if not available:
+            return min(suitable, key=lambda e: e.ejected_until)
+        return min(available, key=lambda e: e.score())
+
+    def _observe_latency(self, endpoint: LLMEndpoint, latency: float) -> None:
+        endpoint.latency_ewma = (
+            latency
+            if endpoint.latency_ewma is None
+            else self.alpha * latency + (1 - self.alpha) * endpoint.latency_ewma
+        )
+        llm_latency.observe(latency, endpoint=endpoint.name)
+
+    def record_success(self, endpoint: LLMEndpoint, latency: float) -> None:
+        """Record a successful call and its latency."""
+        self._observe_latency(endpoint, latency)
+        endpoint.error_rate *= 1 - self.alpha
+        endpoint.consecutive_failures = 0
+
+    def record_timeout(self, endpoint: LLMEndpoint, elapsed: float) -> None:
+        """Record a call cut off by the request deadline.
+
+        The time it ran is a lower bound of the endpoint's latency and goes into the
+        moving average, and the call counts as a failure, so an endpoint that hangs is
+        ranked down and eventually ejected.
+        """
+        self._observe_latency(endpoint, elapsed)
+        self.record_failure(endpoint)
+
+    def record_failure(self, endpoint: LLMEndpoint) -> None:
+        """Record a failed call, ejecting the endpoint after repeated failures."""
+        endpoint.error_rate = self.alpha + (1 - self.alpha) * endpoint.error_rate
+        endpoint.consecutive_failures += 1
+        llm_errors.inc(endpoint=endpoint.name)
+
+        if endpoint.consecutive_failures >= self.eject_after:
+            endpoint.ejected_until = time.monotonic() + self.eject_seconds
+            llm_ejections.inc(endpoint=endpoint.name)
+            logger.warning(
+                f"Ejected LLM endpoint '{endpoint.name}' for {self.eject_seconds}s after "
+                f"{endpoint.consecutive_failures} consecutive failures"
+            )
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if the router owns one."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+
+def create_llm_router() -> LLMRouter:
+    """Build a router from settings, defaulting to the single OPENAI_MODEL endpoint.
+
+    Returns:
+        LLMRouter over the configured endpoints
+    """
+    configs = settings.llm_endpoints or [
+        LLMEndpointConfig(name="openai", model=settings.openai_model)
+    ]
+    return LLMRouter(configs)
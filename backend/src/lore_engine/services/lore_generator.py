@@ -1,42 +1,179 @@
 """LoreGenerator service for generating factions and quests using LangChain and MCP tools."""
 
+import asyncio
 import json
+import time
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.runnables import Runnable
 from langchain_core.tools import StructuredTool
-from langchain_openai import ChatOpenAI
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 from lore_engine.core.config import settings
-from lore_engine.core.logging import logger
+from lore_engine.core.deadline import Deadline, DeadlineExceededError
+from lore_engine.core.logging import SAMPLED, logger
+from lore_engine.core.metrics import metrics
 from lore_engine.mcp_client.client import MCPClient
+from lore_engine.services import traffic
+from lore_engine.services.llm_router import LLMEndpoint, LLMRouter, create_llm_router
+
+# Hard cap on LLM rounds when a conversation has no tool budget
+MAX_ITERATIONS = 10
+
+# Batch tools returning ``n`` seeds of a single-seed tool in one call; a batch call
+# counts as ``n`` calls of that tool against a tool budget
+BATCH_TOOLS = {"fetch_genres": "fetch_genre", "fetch_stories": "fetch_story"}
+
+# Seed instructions of the faction prompt, without and with the batch tool available
+GENRE_INSTRUCTIONS = """All the faction info should be based on a random genre or theme you can get
+by using the fetch_genre tool. You are ONLY allowed to use that tool to get inspiration for the
+factions. You perform  a UNIQUE call to the fetch_genre tool for EACH faction you generate."""
+
+BATCH_GENRE_INSTRUCTIONS = """All the faction info should be based on random genres or themes, one
+per faction, that you can get by using the fetch_genres tool. You are ONLY allowed to use that
+tool to get inspiration for the factions. Get every genre at once with a SINGLE call to
+fetch_genres with n={count}."""
+
+# Python types of JSON Schema property types, for tool argument models
+JSON_SCHEMA_TYPES: dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+TOOL_BUDGET_EXHAUSTED = (
+    "Not executed: '{tool}' is not needed anymore, the results above already cover this "
+    "request. Do not call any more tools; write the final answer now."
+)
+
+llm_rounds = metrics.histogram(
+    "generation_llm_rounds",
+    "LLM round trips per generation",
+    buckets=(1, 2, 3, 4, 5, 6, 8, 10, 12),
+)
+redundant_tool_calls = metrics.counter(
+    "redundant_tool_calls_total", "Tool calls refused because the tool budget was already met"
+)
+
+# MCP client of the request being generated, used when LangChain runs a tool directly
+_request_mcp_client: ContextVar[MCPClient] = ContextVar("request_mcp_client")
+
+
+def tool_result_text(content: Any) -> str:
+    """Text of an MCP tool result, one line per content item."""
+    if isinstance(content, list):
+        return "\n".join(getattr(item, "text", None) or str(item) for item in content)
+    return str(content)
+
+
+def _budget_cost(tool_name: str, tool_args: dict[str, Any]) -> tuple[str, int]:
+    """Tool a call counts against in a tool budget, and how many calls it counts as."""
+    if tool_name not in BATCH_TOOLS:
+        return tool_name, 1
+    try:
+        return BATCH_TOOLS[tool_name], max(int(tool_args.get("n", 1)), 1)
+    except (TypeError, ValueError):
+        return BATCH_TOOLS[tool_name], 1
+
+
+def _mcp_tool_coroutine(tool_name: str) -> Callable[..., Awaitable[str]]:
+    """Build the coroutine LangChain uses to run an MCP tool."""
+
+    async def tool_func(*args, **kwargs) -> str:
+        """Execute the MCP tool on the current request's client."""
+        result = await _request_mcp_client.get().call_tool(tool_name, kwargs)
+        return tool_result_text(result)
+
+    return tool_func
+
+
+def describe_faction(faction: dict[str, Any]) -> str:
+    """Render a faction as the description block used in quest prompts."""
+    return (
+        f"Faction: {faction['name']}\n"
+        f"- Symbol: {faction['symbol']}\n"
+        f"- Values: {faction['values']}\n"
+        f"- Soundtrack Vibe: {faction['soundtrack_vibe']}"
+    )
 
 
 class LoreGenerator:
-    """Generates worldbuilding lore (factions, quests) using LLM with MCP tools."""
+    """Generates worldbuilding lore (factions, quests) using LLM with MCP tools.
 
-    def __init__(self, mcp_client: MCPClient):
-        """Initialize the LoreGenerator with an MCP client.
+    A single instance is shared by every request for the lifetime of the app. It holds
+    only request-independent state: the LLM router (and its pooled HTTP client), the
+    discovered tools, the system prompt and the tool-bound models. Per-request state (MCP
+    client, deadline, conversation) is passed to each generation call.
+    """
+
+    def __init__(self, router: LLMRouter | None = None):
+        """Initialize the LoreGenerator.
 
         Args:
-            mcp_client: Connected MCP client instance for tool access
+            router: Router over the LLM endpoints (built from settings if omitted)
         """
-        self.mcp_client = mcp_client
-        self.llm = ChatOpenAI(
-            model=settings.openai_model,
-            temperature=0.9,
-            api_key=settings.openai_api_key,
-        )
-        logger.info(f"Initialized LoreGenerator with model: {settings.openai_model}")
+        self.router = router or create_llm_router()
+        self._mcp_tools: list[dict[str, Any]] = []
+        self._tools: list[StructuredTool] | None = None
+        self._system_prompt = ""
+        self._system_message: SystemMessage | None = None
+        self._setup_lock = asyncio.Lock()
+        self._bound_models: dict[tuple[str, tuple[str, ...]], Runnable] = {}
+        endpoint_names = ", ".join(endpoint.name for endpoint in self.router.endpoints)
+        logger.info(f"Initialized LoreGenerator with LLM endpoints: {endpoint_names}")
+
+    async def aclose(self) -> None:
+        """Release the LLM clients' connection pool."""
+        await self.router.aclose()
+
+    async def _prepare(
+        self, mcp_client: MCPClient, deadline: Deadline
+    ) -> tuple[str, list[StructuredTool]]:
+        """Return the shared system prompt and tools, discovering the tools on first use.
+
+        Args:
+            mcp_client: MCP client of the current request
+            deadline: Deadline of the current request
 
-    async def _get_langchain_tools(self) -> list[StructuredTool]:
+        Returns:
+            Tuple of (system prompt, LangChain tools)
+        """
+        if self._tools is None:
+            async with self._setup_lock:
+                if self._tools is None:
+                    tools = await self._get_langchain_tools(mcp_client, deadline)
+                    self._system_prompt = self._build_system_prompt(tools)
+                    self._system_message = SystemMessage(content=self._system_prompt)
+                    self._tools = tools
+        traffic.record_tools(self._mcp_tools)
+        return self._system_prompt, self._tools
+
+    async def _get_langchain_tools(
+        self, mcp_client: MCPClient, deadline: Deadline
+    ) -> list[StructuredTool]:
         """Discover MCP tools and convert them to LangChain tools.
 
+        Args:
+            mcp_client: MCP client of the current request
+            deadline: Deadline of the current request
+
         Returns:
             List of LangChain StructuredTool instances
         """
-        mcp_tools = await self.mcp_client.list_tools()
+        mcp_tools = await deadline.run(mcp_client.list_tools(), "MCP tool discovery")
+        self._mcp_tools = mcp_tools
         langchain_tools = []
 
         for tool in mcp_tools:
@@ -46,47 +183,44 @@ class LoreGenerator:
             input_schema = tool.get("inputSchema")
 
             if input_schema and "properties" in input_schema:
+                required = set(input_schema.get("required", []))
                 fields = {}
                 for prop_name, prop_info in input_schema.get("properties", {}).items():
-                    field_type = str
+                    field_type = JSON_SCHEMA_TYPES.get(prop_info.get("type"), str)
                     field_description = prop_info.get("description", "")
+                    default = ... if prop_name in required else prop_info.get("default")
                     fields[prop_name] = (
                         field_type,
-                        Field(description=field_description),
+                        Field(default, description=field_description),
                     )
 
-                ToolInput = type(f"{tool_name}Input", (BaseModel,), {"__annotations__": fields})  # noqa: N806
+                ToolInput = create_model(f"{tool_name}Input", **fields)  # noqa: N806
             else:
                 ToolInput = type(f"{tool_name}Input", (BaseModel,), {})  # noqa: N806
 
-            async def tool_func(*args, **kwargs) -> str:
-                """Execute the MCP tool."""
-                # Capture tool_name in closure
-                current_tool_name = tool_name
-                result = await self.mcp_client.call_tool(current_tool_name, kwargs)
-                return str(result)
-
             langchain_tool = StructuredTool(
                 name=tool_name,
                 description=tool_description,
                 args_schema=ToolInput,
                 func=lambda **kwargs: None,  # Sync version (not used)
-                coroutine=tool_func,
+                coroutine=_mcp_tool_coroutine(tool_name),
             )
 
             langchain_tools.append(langchain_tool)
-            logger.debug(f"Converted MCP tool '{tool_name}' to LangChain tool")
+            logger.debug(f"Converted MCP tool '{tool_name}' to LangChain tool", extra=SAMPLED)
 
-        logger.info(f"Converted {len(langchain_tools)} MCP tools to LangChain tools")
+        logger.info(f"Converted {len(langchain_tools)} MCP tools to LangChain tools", extra=SAMPLED)
         return langchain_tools
 
-    async def _build_system_prompt(self) -> str:
+    def _build_system_prompt(self, tools: list[StructuredTool]) -> str:
         """Build system prompt with tool information.
 
+        Args:
+            tools: Available LangChain tools
+
         Returns:
             System prompt string describing the LLM's purpose and available tools
         """
-        tools = await self._get_langchain_tools()
         tool_descriptions = "\n".join([f"- {tool.name}: {tool.description}" for tool in tools])
 
         prompt = f"""
@@ -109,26 +243,153 @@ Guidelines:
 
         return prompt
 
-    async def _execute_tool_calls(self, messages: list[Any], tool_calls: list[Any]) -> list[Any]:
+    async def _invoke_llm(
+        self,
+        messages: list[Any],
+        tools: list[StructuredTool],
+        request_size: int,
+        deadline: Deadline,
+        step: str,
+    ) -> AIMessage:
+        """Invoke the LLM on the routed endpoint, failing over once if the call errors.
+
+        Args:
+            messages: Current conversation messages
+            tools: Tools to bind to the model
+            request_size: Number of items the request generates (used for routing)
+            deadline: Deadline of the current request
+            step: Short description of the call, used in deadline errors
+
+        Returns:
+            The model's response message
+
+        Raises:
+            DeadlineExceededError: If the request deadline passes during the call
+            Exception: If the call fails on every endpoint tried
+        """
+        endpoint = self.router.select(request_size)
+        try:
+            return await self._invoke_endpoint(endpoint, messages, tools, deadline, step)
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            fallback = self.router.select(request_size, exclude=endpoint)
+            if fallback is None or fallback.is_ejected(time.monotonic()):
+                raise
+            logger.warning(
+                f"LLM endpoint '{endpoint.name}' failed ({e}), retrying on '{fallback.name}'"
+            )
+            return await self._invoke_endpoint(fallback, messages, tools, deadline, step)
+
+    def _bind(self, endpoint: LLMEndpoint, tools: list[StructuredTool]) -> Runnable:
+        """Return the endpoint's model bound to ``tools``, reusing it across requests."""
+        if not tools:
+            return endpoint.llm
+        key = (endpoint.name, tuple(tool.name for tool in tools))
+        bound = self._bound_models.get(key)
+        if bound is None:
+            bound = self._bound_models[key] = endpoint.llm.bind_tools(tools)
+        return bound
+
+    async def _invoke_endpoint(
+        self,
+        endpoint: LLMEndpoint,
+        messages: list[Any],
+        tools: list[StructuredTool],
+        deadline: Deadline,
+        step: str,
+    ) -> AIMessage:
+        """Invoke one endpoint and report the outcome to the router."""
+        start = time.perf_counter()
+        try:
+            bound = self._bind(endpoint, tools)
+            response = await deadline.run(
+                traffic.llm_call(endpoint.name, messages, lambda: bound.ainvoke(messages)), step
+            )
+        except DeadlineExceededError:
+            self.router.record_timeout(endpoint, time.perf_counter() - start)
+            raise
+        except Exception:
+            self.router.record_failure(endpoint)
+            raise
+
+        self.router.record_success(endpoint, time.perf_counter() - start)
+        return response
+
+    async def _call_tool(
+        self, mcp_client: MCPClient, tool_name: str, tool_args: dict[str, Any]
+    ) -> str:
+        """Call an MCP tool and return its result as text."""
+        return tool_result_text(await mcp_client.call_tool(tool_name, tool_args))
+
+    async def _execute_tool_calls(
+        self,
+        mcp_client: MCPClient,
+        messages: list[Any],
+        tool_calls: list[Any],
+        deadline: Deadline,
+        remaining: dict[str, int] | None = None,
+    ) -> list[Any]:
         """Execute tool calls and add results to messages.
 
         Args:
+            mcp_client: MCP client of the current request
             messages: Current conversation messages
             tool_calls: List of tool calls from LLM response
+            deadline: Deadline of the current request
+            remaining: Calls still allowed per tool, decremented as calls run. Calls
+                beyond it are answered with a refusal instead of being executed, and
+                batch calls are trimmed to what is left (see ``BATCH_TOOLS``). None
+                allows every call.
 
         Returns:
             Updated messages list with tool results
+
+        Raises:
+            DeadlineExceededError: If the request deadline passes during a tool call
         """
         for tool_call in tool_calls:
             tool_name = tool_call["name"]
             tool_args = tool_call["args"]
             tool_call_id = tool_call.get("id", "")
 
-            logger.info(f"Executing tool call: {tool_name} with args: {tool_args}")
+            if remaining is not None:
+                budget_tool, cost = _budget_cost(tool_name, tool_args)
+                left = remaining.get(budget_tool, 0)
+                if left <= 0:
+                    redundant_tool_calls.inc(tool=tool_name)
+                    logger.info(f"Refused redundant tool call: {tool_name}", extra=SAMPLED)
+                    messages.append(
+                        ToolMessage(
+                            content=TOOL_BUDGET_EXHAUSTED.format(tool=tool_name),
+                            tool_call_id=tool_call_id,
+                            name=tool_name,
+                        )
+                    )
+                    continue
+                if cost > left:
+                    tool_args = {**tool_args, "n": left}
+                    cost = left
+                remaining[budget_tool] -= cost
+
+            if settings.payload_logging:
+                logger.info(
+                    f"Executing tool call: {tool_name} with args: {tool_args}", extra=SAMPLED
+                )
+            else:
+                logger.info(f"Executing tool call: {tool_name}", extra=SAMPLED)
 
             try:
-                result = await self.mcp_client.call_tool(tool_name, tool_args)
-                result_content = str(result)
+                result_content = await deadline.run(
+                    traffic.tool_call(
+                        tool_name,
+                        tool_args,
+                        lambda: self._call_tool(mcp_client, tool_name, tool_args),
+                    ),
+                    f"tool call '{tool_name}'",
+                )
+            except DeadlineExceededError:
+                raise
             except Exception as e:
                 logger.error(f"Tool call failed for {tool_name}: {e}")
                 result_content = f"Error: {str(e)}"
@@ -143,27 +404,27 @@ Guidelines:
 
         return messages
 
-    async def generate_faction(self, count: int = 1) -> list[dict[str, Any]]:
-        """Generate faction(s) for worldbuilding.
+    async def faction_messages(
+        self, mcp_client: MCPClient, count: int = 1, deadline: Deadline | None = None
+    ) -> list[BaseMessage]:
+        """Build the opening messages of a faction generation conversation.
 
         Args:
+            mcp_client: Connected MCP client of the current request
             count: Number of factions to generate (1-10)
+            deadline: Optional deadline of the current request
 
         Returns:
-            List of faction dictionaries with structure:
-            {
-                "name": str,
-                "symbol": str,
-                "values": str,
-                "soundtrack_vibe": str
-            }
+            System and user messages requesting ``count`` factions
         """
-        logger.info(f"Generating {count} faction(s)")
-
-        system_prompt = await self._build_system_prompt()
-        langchain_tools = await self._get_langchain_tools()
+        system_prompt, tools = await self._prepare(mcp_client, deadline or Deadline(None))
 
         faction_word = "faction" if count == 1 else "factions"
+        if count > 1 and any(tool.name == "fetch_genres" for tool in tools):
+            seed_instructions = BATCH_GENRE_INSTRUCTIONS.format(count=count)
+        else:
+            seed_instructions = GENRE_INSTRUCTIONS
+
         user_message = f"""Generate {count} unique {faction_word} for a fantasy world.
 
 Each faction should have:
@@ -172,104 +433,45 @@ Each faction should have:
 - values: Core beliefs and values (2-3 sentences)
 - soundtrack_vibe: Musical genre/style that represents them
 
-All the faction info should be based on a random genre or theme you can get by using the
-fetch_genre tool. You are ONLY allowed to use that tool to get inspiration for the factions. You
-perform  a UNIQUE call to the fetch_genre tool for EACH faction you generate.
+{seed_instructions}
 
 Respond with ONLY a JSON array of faction objects, no additional text.
 Format: [{{"name": "...", "symbol": "...", "values": "...", "soundtrack_vibe": "..."}}]"""
 
-        messages = [
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_message),
         ]
-        llm_with_tools = self.llm.bind_tools(langchain_tools)
 
-        max_iterations = 10
-        for iteration in range(max_iterations):
-            logger.debug(f"LLM invocation iteration {iteration + 1}")
-            response = await llm_with_tools.ainvoke(messages)
-
-            messages.append(response)
-
-            if hasattr(response, "tool_calls") and response.tool_calls:
-                logger.info(f"LLM requested {len(response.tool_calls)} tool call(s)")
-                messages = await self._execute_tool_calls(messages, response.tool_calls)
-            else:
-                # No more tool calls, this should be the final response
-                logger.info("LLM returned final response (no tool calls)")
-                if response.content:
-                    break
-                else:
-                    logger.warning("Response has no content, continuing...")
-        else:
-            logger.warning(f"Max iterations ({max_iterations}) reached")
-
-        final_content = response.content
-        logger.info(f"Final content length: {len(final_content) if final_content else 0}")
-        logger.debug(f"Final content preview: {final_content[:500] if final_content else 'EMPTY'}")
+    async def system_message(
+        self, mcp_client: MCPClient, deadline: Deadline | None = None
+    ) -> SystemMessage:
+        """Return the system message shared by every conversation.
 
-        if not final_content or not final_content.strip():
-            raise ValueError("LLM returned empty response after all iterations")
-
-        try:
-            # Try to extract JSON if it's wrapped in markdown code blocks
-            content_to_parse = final_content.strip()
-            if content_to_parse.startswith("```"):
-                # Extract content between ```json and ``` or ``` and ```
-                lines = content_to_parse.split("\n")
-                content_to_parse = "\n".join(lines[1:-1])  # Remove first and last lines
-
-            factions = json.loads(content_to_parse)
-            if not isinstance(factions, list):
-                factions = [factions]
-
-            logger.info(f"Successfully generated {len(factions)} faction(s)")
-            return factions
+        Args:
+            mcp_client: Connected MCP client of the current request
+            deadline: Optional deadline of the current request
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Response content: {final_content}")
-            raise ValueError(f"LLM did not return valid JSON: {e}")
+        Returns:
+            System message describing the assistant and its tools
+        """
+        await self._prepare(mcp_client, deadline or Deadline(None))
+        return self._system_message
 
-    async def generate_quest(self, factions: list[dict[str, Any]] | None = None) -> dict[str, Any]:
-        """Generate a quest for worldbuilding.
+    def quest_prompt(self, faction_descriptions: list[str] | None = None) -> str:
+        """Build the user message requesting a quest.
 
         Args:
-            factions: Optional list of factions to base quest characters on.
-            Each faction should have:
-                - name: The faction's name
-                - symbol: Description of the faction's symbol or emblem
-                - values: Core beliefs and values of the faction
-                - soundtrack_vibe: Musical genre/style that represents the faction
+            faction_descriptions: Optional faction blocks (see ``describe_faction``) to
+                base the quest characters on
 
         Returns:
-            Quest dictionary with structure:
-            {
-                "title": str,
-                "quest_brief": str,
-                "npcs": str,
-                "conflict": str,
-                "location": str
-            }
+            User message requesting a quest
         """
-        logger.info("Generating quest")
+        if faction_descriptions:
+            factions_description = "\n\n".join(faction_descriptions)
 
-        system_prompt = await self._build_system_prompt()
-        langchain_tools = await self._get_langchain_tools()
-
-        if factions:
-            factions_description = "\n\n".join(
-                [
-                    f"Faction: {faction['name']}\n"
-                    f"- Symbol: {faction['symbol']}\n"
-                    f"- Values: {faction['values']}\n"
-                    f"- Soundtrack Vibe: {faction['soundtrack_vibe']}"
-                    for faction in factions
-                ]
-            )
-
-            user_message = f"""Generate a unique quest for a tabletop RPG.
+            return f"""Generate a unique quest for a tabletop RPG.
 
 The quest should have:
 - title: A compelling quest title
@@ -293,8 +495,8 @@ Format:
     {{"title": "...", "quest_brief": "...", "npcs": "Description of NPCs as a string",
     "conflict": "...", "location": "..."}}
 """
-        else:
-            user_message = """Generate a unique quest for a tabletop RPG.
+
+        return """Generate a unique quest for a tabletop RPG.
 
 The quest should have:
 - title: A compelling quest title
@@ -310,37 +512,123 @@ Format:
     {"title": "...", "quest_brief": "...", "npcs": "...", "conflict": "...", "location": "..."}
 """
 
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_message),
-        ]
+    async def quest_messages(
+        self,
+        mcp_client: MCPClient,
+        factions: list[dict[str, Any]] | None = None,
+        deadline: Deadline | None = None,
+    ) -> list[BaseMessage]:
+        """Build the opening messages of a quest generation conversation.
 
-        llm_with_tools = self.llm.bind_tools(langchain_tools)
+        Args:
+            mcp_client: Connected MCP client of the current request
+            factions: Optional list of factions to base quest characters on
+            deadline: Optional deadline of the current request
+
+        Returns:
+            System and user messages requesting a quest
+        """
+        system_message = await self.system_message(mcp_client, deadline)
+        descriptions = [describe_faction(faction) for faction in factions] if factions else None
+        return [system_message, HumanMessage(content=self.quest_prompt(descriptions))]
+
+    async def run_conversation(
+        self,
+        mcp_client: MCPClient,
+        messages: list[BaseMessage],
+        request_size: int = 1,
+        deadline: Deadline | None = None,
+        required_tools: dict[str, int] | None = None,
+        kind: str = "conversation",
+    ) -> Any:
+        """Run the LLM and its tool calls on a conversation until it gives a final answer.
+
+        The model's messages and tool results are appended to ``messages``, so a
+        conversation can be continued later by appending a follow-up user message.
+
+        With ``required_tools``, the conversation has a tool budget: once every required
+        call has been made, the next turn is sent without tools so the model must answer,
+        and calls beyond the budget are refused rather than executed. This bounds the
+        number of LLM round trips to the required calls plus the final answer (and one
+        retry if that comes back empty). The last round allowed is always sent without
+        tools, so a model making one call per round still gets to answer when the
+        required calls do not all fit.
+
+        Args:
+            mcp_client: Connected MCP client of the current request
+            messages: Conversation so far, ending with a user message
+            request_size: Number of items the request generates (used for routing)
+            deadline: Optional deadline shared by every LLM and tool call of the request
+            required_tools: Number of calls the request needs per tool; None for no budget
+            kind: Kind of generation, used as the metric label
+
+        Returns:
+            The JSON value of the model's final answer
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before generation completes
+            ValueError: If the final answer is empty or not valid JSON
+        """
+        deadline = deadline or Deadline(None)
+
+        _request_mcp_client.set(mcp_client)
+        _, langchain_tools = await self._prepare(mcp_client, deadline)
+
+        remaining = dict(required_tools) if required_tools is not None else None
+        if remaining is None:
+            max_iterations = MAX_ITERATIONS
+        else:
+            max_iterations = min(sum(remaining.values()) + 2, MAX_ITERATIONS)
+        force_answer = False
 
-        max_iterations = 10
         for iteration in range(max_iterations):
-            logger.debug(f"LLM invocation iteration {iteration + 1}")
-            response = await llm_with_tools.ainvoke(messages)
+            # The last round is always kept for the answer, even if seeds are still missing
+            if iteration == max_iterations - 1 or (
+                remaining is not None and all(count <= 0 for count in remaining.values())
+            ):
+                force_answer = True
+            logger.debug(
+                f"LLM invocation iteration {iteration + 1}"
+                f"{' (final answer, no tools)' if force_answer else ''}",
+                extra=SAMPLED,
+            )
+            response = await self._invoke_llm(
+                messages,
+                [] if force_answer else langchain_tools,
+                request_size,
+                deadline,
+                f"LLM iteration {iteration + 1}",
+            )
 
             messages.append(response)
 
             if hasattr(response, "tool_calls") and response.tool_calls:
-                logger.info(f"LLM requested {len(response.tool_calls)} tool call(s)")
-                messages = await self._execute_tool_calls(messages, response.tool_calls)
+                logger.info(f"LLM requested {len(response.tool_calls)} tool call(s)", extra=SAMPLED)
+                await self._execute_tool_calls(
+                    mcp_client, messages, response.tool_calls, deadline, remaining
+                )
                 # Continue loop to get final response after tool execution
             else:
                 # No more tool calls, this should be the final response
-                logger.info("LLM returned final response (no tool calls)")
+                logger.info("LLM returned final response (no tool calls)", extra=SAMPLED)
                 if response.content:
                     break
                 else:
                     logger.warning("Response has no content, continuing...")
+                    force_answer = remaining is not None
         else:
             logger.warning(f"Max iterations ({max_iterations}) reached")
 
+        llm_rounds.observe(iteration + 1, kind=kind)
+
         final_content = response.content
-        logger.info(f"Final content length: {len(final_content) if final_content else 0}")
-        logger.debug(f"Final content preview: {final_content[:500] if final_content else 'EMPTY'}")
+        logger.info(
+            f"Final content length: {len(final_content) if final_content else 0}", extra=SAMPLED
+        )
+        if settings.payload_logging:
+            logger.debug(
+                f"Final content preview: {final_content[:500] if final_content else 'EMPTY'}"
+            )
 
         if not final_content or not final_content.strip():
             raise ValueError("LLM returned empty response after all iterations")
@@ -353,24 +641,106 @@ Format:
                 lines = content_to_parse.split("\n")
                 content_to_parse = "\n".join(lines[1:-1])  # Remove first and last lines
 
-            quest = json.loads(content_to_parse)
-
-            logger.info("Successfully generated quest")
-            return quest
+            return json.loads(content_to_parse)
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Response content: {final_content}")
+            if settings.payload_logging:
+                logger.error(f"Response content: {final_content}")
             raise ValueError(f"LLM did not return valid JSON: {e}")
 
+    async def generate_faction(
+        self, mcp_client: MCPClient, count: int = 1, deadline: Deadline | None = None
+    ) -> list[dict[str, Any]]:
+        """Generate faction(s) for worldbuilding.
+
+        Args:
+            mcp_client: Connected MCP client of the current request
+            count: Number of factions to generate (1-10)
+            deadline: Optional deadline shared by every LLM and tool call of the request
+
+        Returns:
+            List of faction dictionaries with structure:
+            {
+                "name": str,
+                "symbol": str,
+                "values": str,
+                "soundtrack_vibe": str
+            }
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before generation completes
+        """
+        logger.info(f"Generating {count} faction(s)")
+        deadline = deadline or Deadline(None)
+
+        messages = await self.faction_messages(mcp_client, count, deadline)
+        factions = await self.run_conversation(
+            mcp_client,
+            messages,
+            count,
+            deadline,
+            required_tools={"fetch_genre": count},
+            kind="faction",
+        )
+        if not isinstance(factions, list):
+            factions = [factions]
+
+        logger.info(f"Successfully generated {len(factions)} faction(s)")
+        return factions
+
+    async def generate_quest(
+        self,
+        mcp_client: MCPClient,
+        factions: list[dict[str, Any]] | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """Generate a quest for worldbuilding.
+
+        Args:
+            mcp_client: Connected MCP client of the current request
+            factions: Optional list of factions to base quest characters on.
+            Each faction should have:
+                - name: The faction's name
+                - symbol: Description of the faction's symbol or emblem
+                - values: Core beliefs and values of the faction
+                - soundtrack_vibe: Musical genre/style that represents the faction
+            deadline: Optional deadline shared by every LLM and tool call of the request
+
+        Returns:
+            Quest dictionary with structure:
+            {
+                "title": str,
+                "quest_brief": str,
+                "npcs": str,
+                "conflict": str,
+                "location": str
+            }
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before generation completes
+        """
+        logger.info("Generating quest")
+        deadline = deadline or Deadline(None)
+
+        messages = await self.quest_messages(mcp_client, factions, deadline)
+        quest = await self.run_conversation(
+            mcp_client,
+            messages,
+            len(factions) if factions else 1,
+            deadline,
+            required_tools={"fetch_story": 1},
+            kind="quest",
+        )
+
+        logger.info("Successfully generated quest")
+        return quest
 
-async def create_lore_generator(mcp_client: MCPClient) -> LoreGenerator:
-    """Factory function to create a LoreGenerator instance.
 
-    Args:
-        mcp_client: Connected MCP client instance
+def create_lore_generator() -> LoreGenerator:
+    """Factory function to create the app-wide LoreGenerator instance.
 
     Returns:
-        LoreGenerator instance ready for use
+        LoreGenerator instance ready for use (close it with ``aclose`` on shutdown)
     """
-    return LoreGenerator(mcp_client)
+    return LoreGenerator()
@@ -0,0 +1,228 @@
+"""Append-only persistent store for generated lore with n-gram search."""
+
+import asyncio
+import hashlib
+import json
+from bisect import bisect_left
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from lore_engine.core.logging import logger
+from lore_engine.models.responses import FactionResponse, QuestResponse
+
+LoreKind = Literal["faction", "quest"]
+
+# Fields covered by the search index for each kind of record
+INDEXED_FIELDS: dict[str, tuple[str, ...]] = {
+    "faction": ("name", "values"),
+    "quest": ("title", "location"),
+}
+
+# Models the data of each kind of record must validate against to be stored or served
+RECORD_MODELS: dict[str, type[BaseModel]] = {
+    "faction": FactionResponse,
+    "quest": QuestResponse,
+}
+
+NGRAM_SIZE = 3
+
+
+def _lore_id(kind: str, data: dict[str, Any]) -> str:
+    """Derive a stable id from the record's content."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{kind}:{canonical}".encode()).hexdigest()[:16]
+
+
+def _ngrams(text: str, pad_end: bool = True) -> set[str]:
+    """Split text into padded character n-grams of its words.
+
+    Query words are not padded at the end so they match as word prefixes.
+    """
+    grams = set()
+    for word in text.lower().split():
+        padded = f" {word} " if pad_end else f" {word}"
+        for i in range(len(padded) - NGRAM_SIZE + 1):
+            grams.add(padded[i : i + NGRAM_SIZE])
+    return grams
+
+
+def record_payload(record: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a stored record into its generated data plus its id."""
+    return {**record["data"], "id": record["id"]}
+
+
+class LoreStore:
+    """Persists generated factions and quests to a JSONL file and indexes them for search.
+
+    Records are never rewritten: each one is appended to the file once, keyed by a content
+    hash, so regenerating identical content does not create duplicates. The search index
+    is rebuilt in memory when the store is loaded. Only data that validates against the
+    response model of its kind is stored, and rows that do not are skipped on load, so one
+    bad record cannot break every search page that includes it.
+
+    Args:
+        path: Path to the JSONL file backing the store
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize an empty store backed by ``path``."""
+        self.path = Path(path)
+        self._records: dict[str, dict[str, Any]] = {}
+        self._ids: dict[str, list[str]] = {kind: [] for kind in INDEXED_FIELDS}
+        self._texts: dict[str, list[str]] = {kind: [] for kind in INDEXED_FIELDS}
+        self._postings: dict[str, dict[str, list[int]]] = {kind: {} for kind in INDEXED_FIELDS}
+        self._lock = asyncio.Lock()
+
+    def load(self) -> None:
+        """Load existing records from disk and rebuild the index."""
+        if not self.path.exists():
+            return
+
+        skipped = 0
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    RECORD_MODELS[record["kind"]].model_validate(record["data"])
+                except (ValueError, KeyError, TypeError):
+                    # ValidationError and JSONDecodeError are both ValueErrors
+                    skipped += 1
+                    continue
+                self._index(record)
+
+        if skipped:
+            logger.warning(f"Skipped {skipped} invalid lore record(s) in {self.path}")
+        logger.info(f"Loaded {len(self._records)} lore record(s) from {self.path}")
+
+    def _index(self, record: dict[str, Any]) -> None:
+        """Add a record to the in-memory tables and search index."""
+        kind = record["kind"]
+        seq = len(self._ids[kind])
+        text = " ".join(str(record["data"].get(field, "")) for field in INDEXED_FIELDS[kind])
+
+        self._records[record["id"]] = record
+        self._ids[kind].append(record["id"])
+        self._texts[kind].append(text.lower())
+
+        postings = self._postings[kind]
+        for gram in _ngrams(text):
+            postings.setdefault(gram, []).append(seq)
+
+    def _append_lines(self, lines: list[str]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+    async def add(self, kind: LoreKind, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Persist generated items, skipping ones already stored.
+
+        Args:
+            kind: Kind of lore being stored
+            items: Generated items as returned by the LoreGenerator
+
+        Returns:
+            The stored records (``id``, ``kind``, ``created_at`` and ``data``) in input order
+
+        Raises:
+            ValidationError: If an item does not match the response model of ``kind``; no
+                item is stored then
+        """
+        model = RECORD_MODELS[kind]
+        for data in items:
+            model.model_validate(data)
+
+        async with self._lock:
+            records = []
+            new_records = []
+            for data in items:
+                record_id = _lore_id(kind, data)
+                record = self._records.get(record_id)
+                if record is None:
+                    record = {
+                        "id": record_id,
+                        "kind": kind,
+                        "created_at": datetime.now(UTC).isoformat(),
+                        "data": data,
+                    }
+                    new_records.append(record)
+                records.append(record)
+
+            if new_records:
+                lines = [json.dumps(record, default=str) + "\n" for record in new_records]
+                await asyncio.to_thread(self._append_lines, lines)
+                for record in new_records:
+                    self._index(record)
+                logger.info(f"Stored {len(new_records)} new {kind} record(s)")
+
+            return records
+
+    def get(self, kind: LoreKind, record_id: str) -> dict[str, Any] | None:
+        """Fetch a stored record by id.
+
+        Returns:
+            The record, or None if no record of that kind has the id
+        """
+        record = self._records.get(record_id)
+        if record is None or record["kind"] != kind:
+            return None
+        return record
+
+    def version(self, kind: LoreKind) -> int:
+        """Number of stored records of a kind; changes whenever one is added."""
+        return len(self._ids[kind])
+
+    def _matches(self, kind: str, query: str) -> list[int]:
+        """Return sequence numbers of records matching every word in the query, ascending."""
+        words = query.lower().split()
+        postings = self._postings[kind]
+
+        candidates: set[int] | None = None
+        for gram in sorted(_ngrams(query, pad_end=False), key=lambda g: len(postings.get(g, ()))):
+            hits = postings.get(gram)
+            if not hits:
+                return []
+            candidates = set(hits) if candidates is None else candidates.intersection(hits)
+            if not candidates:
+                return []
+
+        if candidates is None:
+            candidates = set(range(len(self._ids[kind])))
+
+        texts = self._texts[kind]
+        # n-grams can match out of order, so confirm each word actually occurs
+        return sorted(seq for seq in candidates if all(w in texts[seq] for w in words))
+
+    def search(
+        self,
+        kind: LoreKind,
+        query: str | None = None,
+        limit: int = 20,
+        cursor: int | None = None,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Search stored records, newest first.
+
+        Args:
+            kind: Kind of lore to search
+            query: Optional words that must all appear in the indexed fields
+            limit: Maximum number of records to return
+            cursor: Opaque cursor from a previous page
+
+        Returns:
+            Tuple of (records, cursor for the next page or None when exhausted)
+        """
+        ids = self._ids[kind]
+        if query and query.strip():
+            seqs = self._matches(kind, query)
+        else:
+            seqs = range(len(ids))
+
+        end = len(seqs) if cursor is None else bisect_left(seqs, cursor)
+        start = max(end - limit, 0)
+        page = [self._records[ids[seqs[i]]] for i in range(end - 1, start - 1, -1)]
+        next_cursor = seqs[start] if start > 0 else None
+        return page, next_cursor
@@ -0,0 +1,111 @@
+"""Bulk generation of quests for pairs of factions.
+
+Populating a campaign needs a quest for every pair of rival factions. Generating them in
+one call shares the per-request setup: the system message and tools are built once,
+each faction description is rendered once and reused by every pair it takes part in,
+and a fixed number of workers generate pairs concurrently over the same MCP client.
+Results are yielded as they complete, not in pair order.
+"""
+
+import asyncio
+import itertools
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.messages import HumanMessage
+
+from lore_engine.core.deadline import Deadline
+from lore_engine.core.logging import logger
+from lore_engine.core.metrics import metrics
+from lore_engine.mcp_client.client import MCPClient
+from lore_engine.services.lore_generator import LoreGenerator, describe_faction
+from lore_engine.services.traffic import traffic_session
+
+matrix_pairs_total = metrics.counter(
+    "quest_matrix_pairs_total", "Faction pairs generated by the quest matrix by outcome"
+)
+
+
+def all_pairs(count: int) -> list[tuple[int, int]]:
+    """Every unordered pair of distinct indices below ``count``."""
+    return list(itertools.combinations(range(count), 2))
+
+
+@dataclass
+class PairResult:
+    """Outcome of one faction pair: the quest, or the error that prevented it."""
+
+    pair: tuple[int, int]
+    quest: dict[str, Any] | None = None
+    error: str | None = None
+
+
+async def generate_quest_matrix(
+    lore_generator: LoreGenerator,
+    mcp_client: MCPClient,
+    factions: list[dict[str, Any]],
+    pairs: list[tuple[int, int]] | None = None,
+    max_concurrency: int = 4,
+    timeout: float | None = None,
+) -> AsyncIterator[PairResult]:
+    """Generate a quest for each pair of factions, yielding results as they complete.
+
+    A failed pair is yielded with its error and does not stop the others. Closing the
+    iterator early cancels the pairs still running.
+
+    Args:
+        lore_generator: Shared generator
+        mcp_client: Connected MCP client, shared by every pair
+        factions: Factions to pair up
+        pairs: Index pairs into ``factions``; every pair if omitted
+        max_concurrency: Maximum pairs generated at once
+        timeout: Deadline of each pair in seconds, counted from when it starts
+
+    Yields:
+        One PairResult per pair
+    """
+    pairs = all_pairs(len(factions)) if pairs is None else pairs
+    descriptions = [describe_faction(faction) for faction in factions]
+    logger.info(f"Generating quests for {len(pairs)} faction pair(s)")
+
+    pending = iter(pairs)
+    results: asyncio.Queue[PairResult] = asyncio.Queue()
+
+    async def generate_pair(pair: tuple[int, int]) -> PairResult:
+        first, second = pair
+        pair_factions = [factions[first], factions[second]]
+        prompt = lore_generator.quest_prompt([descriptions[first], descriptions[second]])
+        deadline = Deadline(timeout)
+        try:
+            # Each pair is its own traffic session, recorded and replayed like /quests
+            async with traffic_session("quest", {"factions": pair_factions}):
+                system_message = await lore_generator.system_message(mcp_client, deadline)
+                quest = await lore_generator.run_conversation(
+                    mcp_client,
+                    [system_message, HumanMessage(content=prompt)],
+                    len(pair_factions),
+                    deadline,
+                    required_tools={"fetch_story": 1},
+                    kind="quest",
+                )
+        except Exception as e:
+            matrix_pairs_total.inc(outcome="error")
+            logger.error(f"Quest generation failed for faction pair {pair}: {e}")
+            return PairResult(pair, error=str(e))
+        matrix_pairs_total.inc(outcome="ok")
+        return PairResult(pair, quest=quest)
+
+    async def worker() -> None:
+        # Workers share the iterator, so each pair is taken by exactly one of them
+        for pair in pending:
+            results.put_nowait(await generate_pair(pair))
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(max_concurrency, len(pairs)))]
+    try:
+        for _ in pairs:
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,235 @@
+"""Server-side worldbuilding sessions for iterative generation.
+
+A session keeps the faction set being worked on and the conversations that produced
+it, so follow-ups ("another quest for these factions", "tweak faction 3") continue the
+existing conversation instead of rebuilding the prompt and re-fetching tool seeds.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from pydantic import TypeAdapter
+
+from lore_engine.core.deadline import Deadline
+from lore_engine.core.logging import logger
+from lore_engine.core.metrics import metrics
+from lore_engine.mcp_client.client import MCPClient
+from lore_engine.models.responses import FactionInput
+from lore_engine.services.lore_generator import LoreGenerator
+
+# Generated faction sets are checked against this before they replace a session's factions
+FACTION_SET = TypeAdapter(list[FactionInput])
+
+sessions_evicted_total = metrics.counter(
+    "sessions_evicted_total", "Generation sessions evicted by reason"
+)
+
+ANOTHER_QUEST = """Generate another unique quest for the same factions, different from the \
+previous ones. Reuse the story elements you already fetched unless you need new inspiration.
+
+Respond with ONLY a JSON object in the same format, no additional text."""
+
+TWEAK_FACTION = """Revise faction {index} ("{name}") as follows: {instruction}
+
+Keep the other factions unchanged. Respond with ONLY the full JSON array of all factions in \
+the same format, no additional text."""
+
+
+def trim_turns(messages: list[BaseMessage], max_turns: int) -> list[BaseMessage]:
+    """Bound a conversation to its opening turn plus the most recent ones.
+
+    A turn starts at a user message and runs up to the next one, so tool calls always
+    stay with their results. The opening turn (system prompt, original request and
+    first tool results) is always kept because follow-ups build on it.
+
+    Args:
+        messages: Conversation messages
+        max_turns: Maximum number of turns to keep, including the opening one
+
+    Returns:
+        The trimmed conversation
+    """
+    starts = [i for i, message in enumerate(messages) if isinstance(message, HumanMessage)]
+    if len(starts) <= max_turns:
+        return messages
+    if max_turns <= 1:
+        return messages[: starts[1]]
+    return messages[: starts[1]] + messages[starts[-(max_turns - 1)] :]
+
+
+@dataclass
+class Session:
+    """State of one worldbuilding session."""
+
+    id: str
+    factions: list[dict[str, Any]] = field(default_factory=list)
+    faction_messages: list[BaseMessage] = field(default_factory=list)
+    quest_messages: list[BaseMessage] = field(default_factory=list)
+    last_used: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class SessionStore:
+    """In-memory sessions with LRU and idle-time eviction.
+
+    Args:
+        max_sessions: Maximum number of sessions kept; the least recently used is evicted
+        ttl_seconds: Idle time after which a session expires
+    """
+
+    def __init__(self, max_sessions: int = 1000, ttl_seconds: float = 1800.0) -> None:
+        """Initialize an empty store."""
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self._sessions: OrderedDict[str, Session] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of live sessions."""
+        return len(self._sessions)
+
+    def _expire(self, now: float) -> None:
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_used < self.ttl_seconds:
+                break
+            del self._sessions[session.id]
+            sessions_evicted_total.inc(reason="expired")
+
+    def create(self) -> Session:
+        """Start a new session, evicting the least recently used one if full."""
+        self._expire(time.monotonic())
+        session = Session(id=uuid.uuid4().hex)
+        self._sessions[session.id] = session
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+            sessions_evicted_total.inc(reason="lru")
+        return session
+
+    def get(self, session_id: str) -> Session | None:
+        """Resume a session by id, marking it as recently used.
+
+        Returns:
+            The session, or None if it never existed or was evicted
+        """
+        now = time.monotonic()
+        self._expire(now)
+        session = self._sessions.get(session_id)
+        if session is not None:
+            session.last_used = now
+            self._sessions.move_to_end(session_id)
+        return session
+
+
+class SessionGenerator:
+    """Runs session actions on the shared generator, continuing stored conversations.
+
+    Args:
+        lore_generator: Shared LoreGenerator
+        max_turns: Turns kept per conversation (see ``trim_turns``)
+    """
+
+    def __init__(self, lore_generator: LoreGenerator, max_turns: int = 8) -> None:
+        """Bind the generator and conversation bound."""
+        self.lore_generator = lore_generator
+        self.max_turns = max_turns
+
+    async def factions(
+        self, session: Session, mcp_client: MCPClient, count: int, deadline: Deadline
+    ) -> list[dict[str, Any]]:
+        """Generate a new faction set for the session, replacing the current one if valid."""
+        messages = await self.lore_generator.faction_messages(mcp_client, count, deadline)
+        factions = await self.lore_generator.run_conversation(
+            mcp_client,
+            messages,
+            count,
+            deadline,
+            required_tools={"fetch_genre": count},
+            kind="faction",
+        )
+        if not isinstance(factions, list):
+            factions = [factions]
+        FACTION_SET.validate_python(factions)
+        self.set_factions(session, factions)
+        session.faction_messages = trim_turns(messages, self.max_turns)
+        return factions
+
+    def set_factions(self, session: Session, factions: list[dict[str, Any]]) -> None:
+        """Replace the session's factions, dropping conversations built on the old ones."""
+        session.factions = factions
+        session.faction_messages = []
+        session.quest_messages = []
+
+    async def tweak_faction(
+        self,
+        session: Session,
+        mcp_client: MCPClient,
+        index: int,
+        instruction: str,
+        deadline: Deadline,
+    ) -> list[dict[str, Any]]:
+        """Revise one faction (1-based ``index``) by continuing the faction conversation.
+
+        The session is only updated if the revised factions are valid.
+
+        Raises:
+            ValueError: If ``index`` is out of range or the model returns no factions
+            ValidationError: If the revised factions are malformed
+        """
+        if not 1 <= index <= len(session.factions):
+            raise ValueError(f"No faction {index} in this session")
+
+        messages = list(session.faction_messages)
+        if not messages:
+            # Factions supplied by the client: start from their description
+            messages = await self.lore_generator.faction_messages(
+                mcp_client, len(session.factions), deadline
+            )
+            messages.append(AIMessage(content=json.dumps(session.factions)))
+
+        name = session.factions[index - 1].get("name", "")
+        messages.append(
+            HumanMessage(
+                content=TWEAK_FACTION.format(index=index, name=name, instruction=instruction)
+            )
+        )
+        # A tweak only rewrites existing factions: no new seeds are needed
+        factions = await self.lore_generator.run_conversation(
+            mcp_client, messages, len(session.factions), deadline, required_tools={}, kind="faction"
+        )
+        if not isinstance(factions, list) or not factions:
+            raise ValueError("LLM did not return the revised faction list")
+        FACTION_SET.validate_python(factions)
+
+        self.set_factions(session, factions)
+        session.faction_messages = trim_turns(messages, self.max_turns)
+        return factions
+
+    async def quest(
+        self, session: Session, mcp_client: MCPClient, deadline: Deadline
+    ) -> dict[str, Any]:
+        """Generate a quest for the session's factions, continuing earlier quests if any."""
+        messages = list(session.quest_messages)
+        if messages:
+            messages.append(HumanMessage(content=ANOTHER_QUEST))
+        else:
+            messages = await self.lore_generator.quest_messages(
+                mcp_client, session.factions, deadline
+            )
+
+        quest = await self.lore_generator.run_conversation(
+            mcp_client,
+            messages,
+            len(session.factions) or 1,
+            deadline,
+            required_tools={"fetch_story": 1},
+            kind="quest",
+        )
+        session.quest_messages = trim_turns(messages, self.max_turns)
+        logger.info(f"Session quest generated ({len(messages)} messages in conversation)")
+        return quest
@@ -0,0 +1,184 @@
+"""Speculative background generation of quests for freshly generated factions.
+
+Clients usually follow a factions response by requesting a quest for those exact
+factions. When enabled, the quest is generated in the background right after the
+factions are sent, so the quest request can take the finished result or join the
+generation already in progress instead of starting from scratch.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from typing import Any
+
+from lore_engine.core.config import settings
+from lore_engine.core.deadline import Deadline
+from lore_engine.core.logging import logger
+from lore_engine.core.metrics import metrics
+from lore_engine.mcp_client.client import MCPClient
+from lore_engine.services.lore_generator import LoreGenerator
+
+# Faction fields that identify a faction set (ids and extra fields are ignored)
+FACTION_FIELDS = ("name", "symbol", "values", "soundtrack_vibe")
+
+speculations_total = metrics.counter(
+    "quest_speculations_total", "Speculative quest generations by outcome"
+)
+speculation_lookups_total = metrics.counter(
+    "quest_speculation_lookups_total", "Quest requests checked against speculation by result"
+)
+
+
+def faction_set_key(factions: list[dict[str, Any]]) -> str:
+    """Canonical hash of a set of factions, independent of order and extra fields."""
+    canonical = sorted(
+        json.dumps({field: faction.get(field) for field in FACTION_FIELDS}, sort_keys=True)
+        for faction in factions
+    )
+    return hashlib.sha256(json.dumps(canonical).encode()).hexdigest()
+
+
+@dataclass
+class _Speculation:
+    task: asyncio.Task[dict[str, Any]]
+    created: float
+
+
+class QuestSpeculator:
+    """Generates quests ahead of time for faction sets that were just returned.
+
+    Speculation is budgeted: at most ``max_inflight`` generations run at once and new
+    faction sets are skipped rather than queued while the budget is spent, so
+    speculative work never builds up behind real traffic. Results are kept for
+    ``ttl_seconds`` and handed out once.
+
+    Args:
+        lore_generator: Shared generator used for speculative quests
+        mcp_client_factory: Opens an MCP client for the duration of one generation
+        max_inflight: Maximum concurrent speculative generations
+        ttl_seconds: How long an unclaimed result is kept
+        max_entries: Maximum number of results and generations tracked
+    """
+
+    def __init__(
+        self,
+        lore_generator: LoreGenerator,
+        mcp_client_factory: Callable[[], AbstractAsyncContextManager[MCPClient]],
+        max_inflight: int = 2,
+        ttl_seconds: float = 300.0,
+        max_entries: int = 128,
+    ) -> None:
+        """Initialize an empty speculator."""
+        self.lore_generator = lore_generator
+        self.mcp_client_factory = mcp_client_factory
+        self.max_inflight = max_inflight
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _Speculation] = OrderedDict()
+        self._inflight = 0
+
+    def _expire(self, now: float) -> None:
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if now - entry.created < self.ttl_seconds and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[key]
+            if not entry.task.done():
+                entry.task.cancel()
+
+    async def schedule(self, factions: list[dict[str, Any]]) -> bool:
+        """Start generating a quest for ``factions`` in the background, budget permitting.
+
+        Args:
+            factions: Factions just returned to the client
+
+        Returns:
+            True if a speculative generation was started
+        """
+        key = faction_set_key(factions)
+        self._expire(time.monotonic())
+        if key in self._entries:
+            return False
+        if self._inflight >= self.max_inflight:
+            speculations_total.inc(outcome="skipped")
+            logger.debug(f"Speculation budget spent, skipped quest for faction set {key[:12]}")
+            return False
+
+        self._inflight += 1
+        task = asyncio.create_task(self._generate(factions))
+        self._entries[key] = _Speculation(task, time.monotonic())
+        task.add_done_callback(lambda t: self._on_done(key, t))
+        speculations_total.inc(outcome="started")
+        return True
+
+    async def _generate(self, factions: list[dict[str, Any]]) -> dict[str, Any]:
+        # Let the response that triggered the speculation finish first
+        await asyncio.sleep(0)
+        async with self.mcp_client_factory() as mcp_client:
+            return await self.lore_generator.generate_quest(
+                mcp_client,
+                factions=factions,
+                deadline=Deadline(settings.request_timeout_seconds),
+            )
+
+    def _on_done(self, key: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        self._inflight -= 1
+        if task.cancelled():
+            speculations_total.inc(outcome="cancelled")
+        elif task.exception() is not None:
+            speculations_total.inc(outcome="failed")
+            logger.warning(f"Speculative quest generation failed: {task.exception()}")
+            entry = self._entries.get(key)
+            if entry is not None and entry.task is task:
+                del self._entries[key]
+        else:
+            speculations_total.inc(outcome="completed")
+
+    async def take(self, factions: list[dict[str, Any]]) -> dict[str, Any] | None:
+        """Claim the speculative quest for ``factions``, waiting for it if still running.
+
+        Args:
+            factions: Factions of the quest request
+
+        Returns:
+            The quest, or None if there is no usable speculation for this faction set
+        """
+        key = faction_set_key(factions)
+        self._expire(time.monotonic())
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            speculation_lookups_total.inc(result="miss")
+            return None
+
+        joined = not entry.task.done()
+        try:
+            # Shield so a disconnecting client does not cancel the shared generation
+            quest = await asyncio.shield(entry.task)
+        except asyncio.CancelledError:
+            if not entry.task.cancelled():
+                # The waiter was cancelled, not the generation: hand the entry back so
+                # its result can still be claimed and aclose() still cancels it
+                self._entries.setdefault(key, entry)
+                raise
+            speculation_lookups_total.inc(result="miss")
+            return None
+        except Exception:
+            speculation_lookups_total.inc(result="miss")
+            return None
+
+        speculation_lookups_total.inc(result="joined" if joined else "hit")
+        logger.info(f"Served quest from speculation ({'joined' if joined else 'ready'})")
+        return quest
+
+    async def aclose(self) -> None:
+        """Cancel speculative generations still running."""
+        tasks = [entry.task for entry in self._entries.values()]
+        self._entries.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
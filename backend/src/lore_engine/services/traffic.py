@@ -0,0 +1,289 @@
+"""Record and replay of LLM and MCP traffic for offline performance runs.
+
+In ``record`` mode every LLM call, tool call and tool discovery made while generating a
+response is captured with its timing into a JSON cassette, one per request. In
+``replay`` mode those cassettes are served back instead of calling the providers,
+sleeping for the recorded (optionally scaled) durations so the latency profile of real
+traffic can be reproduced against a new build.
+"""
+
+import asyncio
+import itertools
+import json
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Literal, TypeVar
+
+from langchain_core.messages import BaseMessage, messages_from_dict, messages_to_dict
+
+from lore_engine.core.config import settings
+from lore_engine.core.logging import logger
+
+T = TypeVar("T")
+
+TrafficMode = Literal["live", "record", "replay"]
+
+# Header a replay client can send to pick the cassette for a request
+REPLAY_CASSETTE_HEADER = "x-replay-cassette"
+
+
+class CassetteMismatchError(RuntimeError):
+    """Raised when a replayed request makes calls its cassette does not contain."""
+
+
+class ReplayedCallError(RuntimeError):
+    """Re-raises, during replay, an error that was recorded for a call."""
+
+
+class TrafficSession:
+    """Traffic of a single request, being either recorded or replayed.
+
+    Args:
+        kind: Kind of generation ("faction" or "quest")
+        params: Request parameters, stored so replays can be matched to requests
+        cassette: Cassette to replay; None to record a new one
+        time_scale: Multiplier applied to recorded durations during replay
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        params: dict[str, Any],
+        cassette: dict[str, Any] | None = None,
+        time_scale: float = 1.0,
+    ) -> None:
+        """Start recording, or prepare to replay ``cassette``."""
+        self.kind = kind
+        self.params = params
+        self.cassette = cassette
+        self.time_scale = time_scale
+        self.started_at = time.time()
+        self._t0 = time.monotonic()
+        self.tools: list[dict[str, Any]] = []
+        self.events: list[dict[str, Any]] = []
+        if cassette is not None:
+            self.tools = cassette["tools"]
+            self._llm_events = iter(e for e in cassette["events"] if e["type"] == "llm")
+            self._tool_events = iter(e for e in cassette["events"] if e["type"] == "tool")
+
+    @property
+    def replaying(self) -> bool:
+        """Whether this session serves recorded traffic."""
+        return self.cassette is not None
+
+    async def _replay(self, event: dict[str, Any] | None, what: str) -> dict[str, Any]:
+        if event is None:
+            raise CassetteMismatchError(
+                f"Cassette {self.cassette['id']} has no recorded {what} left to replay"
+            )
+        await asyncio.sleep(event["duration"] * self.time_scale)
+        if "error" in event:
+            raise ReplayedCallError(event["error"])
+        return event
+
+    async def _record(
+        self, event: dict[str, Any], call: Callable[[], Awaitable[T]], encode: Callable[[T], Any]
+    ) -> T:
+        start = time.monotonic()
+        event["offset"] = start - self._t0
+        try:
+            result = await call()
+        except Exception as e:
+            event["error"] = str(e)
+            raise
+        else:
+            event["result"] = encode(result)
+            return result
+        finally:
+            event["duration"] = time.monotonic() - start
+            self.events.append(event)
+
+    async def llm_call(
+        self, endpoint: str, messages: list[BaseMessage], call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run or replay an LLM call."""
+        if self.replaying:
+            event = await self._replay(next(self._llm_events, None), "LLM call")
+            return messages_from_dict([event["result"]])[0]
+
+        event = {"type": "llm", "endpoint": endpoint, "request": messages_to_dict(messages)}
+        return await self._record(event, call, lambda message: messages_to_dict([message])[0])
+
+    async def tool_call(
+        self, name: str, args: dict[str, Any], call: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Run or replay an MCP tool call returning its text result."""
+        if self.replaying:
+            event = next((e for e in self._tool_events if e["name"] == name), None)
+            return (await self._replay(event, f"'{name}' tool call"))["result"]
+
+        event = {"type": "tool", "name": name, "args": args}
+        return await self._record(event, call, lambda result: result)
+
+    def to_cassette(self) -> dict[str, Any]:
+        """Build the cassette for a recorded session."""
+        return {
+            "id": uuid.uuid4().hex[:12],
+            "kind": self.kind,
+            "params": self.params,
+            "recorded_at": datetime.fromtimestamp(self.started_at, UTC).isoformat(),
+            "started_at": self.started_at,
+            "duration": time.monotonic() - self._t0,
+            "tools": self.tools,
+            "events": self.events,
+        }
+
+
+_current_session: ContextVar[TrafficSession | None] = ContextVar("traffic_session", default=None)
+
+
+def current_session() -> TrafficSession | None:
+    """The traffic session of the request being generated, if any."""
+    return _current_session.get()
+
+
+async def llm_call(
+    endpoint: str, messages: list[BaseMessage], call: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Run an LLM call through the current session, or directly when there is none."""
+    session = _current_session.get()
+    if session is None:
+        return await call()
+    return await session.llm_call(endpoint, messages, call)
+
+
+async def tool_call(name: str, args: dict[str, Any], call: Callable[[], Awaitable[str]]) -> str:
+    """Run an MCP tool call through the current session, or directly when there is none."""
+    session = _current_session.get()
+    if session is None:
+        return await call()
+    return await session.tool_call(name, args, call)
+
+
+def record_tools(tools: list[dict[str, Any]]) -> None:
+    """Attach the discovered MCP tool definitions to the current recording."""
+    session = _current_session.get()
+    if session is not None and not session.replaying:
+        session.tools = tools
+
+
+class CassetteLibrary:
+    """Recorded cassettes available for replay, selected per request.
+
+    Args:
+        directory: Directory containing cassette JSON files
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Load every cassette in ``directory``."""
+        self.cassettes: dict[str, dict[str, Any]] = {}
+        for path in sorted(Path(directory).glob("*.json")):
+            cassette = json.loads(path.read_text(encoding="utf-8"))
+            self.cassettes[cassette["id"]] = cassette
+        self._rotations: dict[str, itertools.cycle] = {}
+        logger.info(f"Loaded {len(self.cassettes)} cassette(s) from {directory}")
+
+    def select(
+        self, kind: str, params: dict[str, Any], cassette_id: str | None = None
+    ) -> dict[str, Any]:
+        """Pick the cassette to replay for a request.
+
+        An explicit ``cassette_id`` wins; otherwise cassettes recorded with the same
+        parameters, then any of the same kind, are served round-robin.
+
+        Raises:
+            LookupError: If no suitable cassette exists
+        """
+        if cassette_id is not None:
+            cassette = self.cassettes.get(cassette_id)
+            if cassette is None or cassette["kind"] != kind:
+                raise LookupError(f"No {kind} cassette with id {cassette_id}")
+            return cassette
+
+        key = json.dumps([kind, params], sort_keys=True)
+        rotation = self._rotations.get(key)
+        if rotation is None:
+            candidates = [
+                c for c in self.cassettes.values() if c["kind"] == kind and c["params"] == params
+            ] or [c for c in self.cassettes.values() if c["kind"] == kind]
+            if not candidates:
+                raise LookupError(f"No recorded {kind} cassettes to replay")
+            rotation = self._rotations[key] = itertools.cycle(candidates)
+        return next(rotation)
+
+
+@lru_cache
+def get_cassette_library() -> CassetteLibrary:
+    """Get the process-wide cassette library for replay mode."""
+    return CassetteLibrary(settings.traffic_cassette_dir)
+
+
+def _write_cassette(cassette: dict[str, Any]) -> Path:
+    directory = Path(settings.traffic_cassette_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.fromtimestamp(cassette["started_at"], UTC).strftime("%Y%m%dT%H%M%S")
+    path = directory / f"{stamp}-{cassette['kind']}-{cassette['id']}.json"
+    path.write_text(json.dumps(cassette), encoding="utf-8")
+    return path
+
+
+@asynccontextmanager
+async def traffic_session(
+    kind: str, params: dict[str, Any], cassette_id: str | None = None
+) -> AsyncIterator[TrafficSession | None]:
+    """Record or replay the traffic of one request, according to ``TRAFFIC_MODE``.
+
+    Work started inside the block (including tasks it creates) sees the session. In
+    record mode the cassette is written when the block completes successfully.
+
+    Args:
+        kind: Kind of generation ("faction" or "quest")
+        params: Request parameters
+        cassette_id: Cassette to replay, e.g. from the ``X-Replay-Cassette`` header
+
+    Yields:
+        The session, or None in live mode
+    """
+    mode = settings.traffic_mode
+    if mode == "live":
+        yield None
+        return
+
+    cassette = None
+    if mode == "replay":
+        cassette = get_cassette_library().select(kind, params, cassette_id)
+
+    session = TrafficSession(kind, params, cassette, settings.traffic_replay_time_scale)
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
+
+    if not session.replaying:
+        path = await asyncio.to_thread(_write_cassette, session.to_cassette())
+        logger.info(f"Recorded {kind} traffic to {path}")
+
+
+class OfflineMCPClient:
+    """MCP client used in replay mode, where tool traffic comes from cassettes."""
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        """Tool definitions of the cassette being replayed."""
+        session = _current_session.get()
+        if session is None or not session.replaying:
+            raise RuntimeError("MCP tools are only available from cassettes in replay mode")
+        return session.tools
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None) -> Any:
+        """Never called: replayed tool calls are served by the traffic session."""
+        raise RuntimeError("MCP server is not available in replay mode")
+
+    async def cleanup(self) -> None:
+        """Nothing to clean up."""
@@ -0,0 +1,6 @@
+"""Shared pytest configuration."""
+
+import os
+
+# Settings require an API key at import time; tests never reach the provider.
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
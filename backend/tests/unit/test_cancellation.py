@@ -0,0 +1,77 @@
+"""Tests for request deadlines and disconnect cancellation."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from lore_engine.api.cancellation import (
+    ClientDisconnectedError,
+    abandoned_total,
+    run_until_disconnected,
+)
+from lore_engine.core.config import settings
+from lore_engine.core.deadline import Deadline, DeadlineExceededError
+
+
+class FakeRequest:
+    """Request stand-in that reports a disconnect after a number of polls."""
+
+    def __init__(self, disconnect_after: int | None = None) -> None:
+        self.polls = 0
+        self.disconnect_after = disconnect_after
+
+    async def is_disconnected(self) -> bool:
+        self.polls += 1
+        return self.disconnect_after is not None and self.polls > self.disconnect_after
+
+
+@pytest.mark.asyncio
+async def test_deadline_budget_shrinks_across_steps():
+    """Test that later steps only get the budget left by earlier ones."""
+    deadline = Deadline(0.2)
+
+    await deadline.run(asyncio.sleep(0.1), "first step")
+
+    with pytest.raises(DeadlineExceededError, match="second step"):
+        await deadline.run(asyncio.sleep(0.15), "second step")
+
+
+@pytest.mark.asyncio
+async def test_unbounded_deadline_runs_to_completion():
+    """Test that a deadline of None never times out."""
+    deadline = Deadline(None)
+
+    assert deadline.remaining() is None
+    assert await deadline.run(asyncio.sleep(0.01, result="done"), "step") == "done"
+
+
+@pytest.mark.asyncio
+async def test_run_until_disconnected_returns_result():
+    """Test that work completes normally while the client stays connected."""
+    result = await run_until_disconnected(
+        FakeRequest(), asyncio.sleep(0.01, result="lore"), "faction"
+    )
+
+    assert result == "lore"
+
+
+@pytest.mark.asyncio
+async def test_run_until_disconnected_cancels_work():
+    """Test that work is cancelled and counted when the client disconnects."""
+    cancelled = asyncio.Event()
+
+    async def generation() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    before = abandoned_total.value(kind="quest")
+    with patch.object(settings, "disconnect_poll_interval", 0.01):
+        with pytest.raises(ClientDisconnectedError):
+            await run_until_disconnected(FakeRequest(disconnect_after=2), generation(), "quest")
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    assert abandoned_total.value(kind="quest") == before + 1
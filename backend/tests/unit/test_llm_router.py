@@ -0,0 +1,153 @@
+"""Tests for LLM endpoint routing."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from langchain_core.messages import HumanMessage
+from langchain_openai import ChatOpenAI
+
+from lore_engine.core.config import LLMEndpointConfig
+from lore_engine.core.deadline import Deadline, DeadlineExceededError
+from lore_engine.services.llm_router import LLMRouter
+from lore_engine.services.lore_generator import LoreGenerator
+
+
+def _router(*configs: LLMEndpointConfig) -> LLMRouter:
+    return LLMRouter(list(configs), llm_factory=lambda config: None)
+
+
+def test_router_prefers_lowest_latency_and_cost():
+    """Test that endpoints are ranked by latency weighted by cost."""
+    router = _router(
+        LLMEndpointConfig(name="fast", model="m"),
+        LLMEndpointConfig(name="slow", model="m"),
+        LLMEndpointConfig(name="pricey", model="m", cost_weight=10.0),
+    )
+    fast, slow, pricey = router.endpoints
+    router.record_success(fast, 1.0)
+    router.record_success(slow, 3.0)
+    router.record_success(pricey, 0.5)
+
+    assert router.select() is fast
+
+
+def test_router_filters_by_request_size():
+    """Test that large requests skip endpoints limited to small ones."""
+    router = _router(
+        LLMEndpointConfig(name="small", model="m", max_request_size=2),
+        LLMEndpointConfig(name="large", model="m"),
+    )
+    small, large = router.endpoints
+    router.record_success(small, 0.1)
+    router.record_success(large, 2.0)
+
+    assert router.select(request_size=1) is small
+    assert router.select(request_size=10) is large
+
+
+def test_router_ejects_failing_endpoint():
+    """Test that repeated failures eject an endpoint until its cool-down ends."""
+    router = _router(
+        LLMEndpointConfig(name="flaky", model="m"),
+        LLMEndpointConfig(name="steady", model="m"),
+    )
+    flaky, steady = router.endpoints
+    router.record_success(flaky, 0.1)
+    router.record_success(steady, 1.0)
+
+    for _ in range(router.eject_after):
+        router.record_failure(flaky)
+
+    assert router.select() is steady
+
+    flaky.ejected_until = 0.0
+    assert router.select() is flaky
+
+
+def _stand_in_server(fail: bool) -> FastAPI:
+    """Minimal OpenAI-compatible chat completions server."""
+    app = FastAPI()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(body: dict) -> JSONResponse:
+        if fail:
+            return JSONResponse({"error": {"message": "unavailable"}}, status_code=503)
+        return JSONResponse(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        )
+
+    return app
+
+
+def _stand_in_model(config: LLMEndpointConfig) -> ChatOpenAI:
+    app = _stand_in_server(fail=config.name == "down")
+    return ChatOpenAI(
+        model=config.model,
+        api_key="test-key",
+        base_url=config.base_url,
+        max_retries=0,
+        http_async_client=httpx.AsyncClient(transport=httpx.ASGITransport(app=app)),
+    )
+
+
+@pytest.mark.asyncio
+async def test_generator_fails_over_between_stand_in_servers():
+    """Test that a failing endpoint is recorded and the call is retried on another one."""
+    router = LLMRouter(
+        [
+            LLMEndpointConfig(name="down", model="m", base_url="http://down.local/v1"),
+            LLMEndpointConfig(name="up", model="m", base_url="http://up.local/v1"),
+        ],
+        llm_factory=_stand_in_model,
+    )
+    down, up = router.endpoints
+    generator = LoreGenerator(router=router)
+
+    response = await generator._invoke_llm(
+        [HumanMessage(content="hi")], [], 1, Deadline(5), "test call"
+    )
+
+    assert response.content == "ok"
+    assert down.consecutive_failures == 1
+    assert up.latency_ewma is not None
+
+
+class HangingLLM:
+    """Chat model stand-in that never answers."""
+
+    async def ainvoke(self, messages: list, **kwargs) -> None:
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_deadline_timeout_counts_against_endpoint():
+    """Test that a call cut off by the deadline is recorded as a slow failure."""
+    router = LLMRouter(
+        [LLMEndpointConfig(name="hung", model="m")], llm_factory=lambda c: HangingLLM()
+    )
+    [hung] = router.endpoints
+    generator = LoreGenerator(router=router)
+
+    with pytest.raises(DeadlineExceededError):
+        await generator._invoke_llm(
+            [HumanMessage(content="hi")], [], 1, Deadline(0.05), "test call"
+        )
+
+    assert hung.consecutive_failures == 1
+    assert hung.latency_ewma >= 0.04
@@ -0,0 +1,44 @@
+"""Tests for structured logging helpers."""
+
+import json
+import logging
+
+from lore_engine.core.logging import (
+    JSONFormatter,
+    RequestContextFilter,
+    SamplingFilter,
+    request_id_var,
+)
+
+
+def _record(**extra: object) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "lore_engine", logging.INFO, __file__, 1, "hello %s", ("world",), None
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_request_id():
+    """Test that records carry the current request's correlation id as JSON."""
+    token = request_id_var.set("req-123")
+    try:
+        record = _record()
+        RequestContextFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["message"] == "hello world"
+    assert entry["request_id"] == "req-123"
+    assert entry["level"] == "INFO"
+
+
+def test_sampling_filter_only_drops_sampled_records():
+    """Test that unmarked records always pass and sampled ones are dropped at rate 0."""
+    sampling = SamplingFilter(rate=0.0)
+
+    assert sampling.filter(_record())
+    assert not sampling.filter(_record(sampled=True))
+    assert SamplingFilter(rate=1.0).filter(_record(sampled=True))
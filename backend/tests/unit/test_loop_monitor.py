@@ -0,0 +1,57 @@
+"""Tests for the event-loop lag monitor and blocking-call watchdog."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from lore_engine.api.app import app, lifespan
+from lore_engine.core.config import settings
+from lore_engine.core.loop_monitor import LoopMonitor
+from lore_engine.core.metrics import metrics
+
+
+def block_loop(seconds: float) -> None:
+    """Synchronous work standing in for a blocking call on the event loop."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(1000))
+
+
+@pytest.mark.asyncio
+async def test_monitor_records_lag_and_catches_blocking_stack():
+    """Test that a blocked loop shows up as lag and is reported once with its stack."""
+    blocked = metrics.counter("event_loop_blocked_total")
+    before = blocked.value()
+    monitor = LoopMonitor(interval=0.01, block_threshold=0.05)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        block_loop(0.3)
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop()
+
+    assert blocked.value() == before + 1
+    [stack] = monitor.blocked_stacks
+    assert "block_loop" in stack
+    lag = metrics.histogram("event_loop_lag_seconds").snapshot()["values"][""]
+    assert lag["buckets"]["0.25"] < lag["count"]
+
+
+@pytest.mark.asyncio
+async def test_failed_startup_leaves_no_watchdog_running():
+    """Test that the monitor is not started when an earlier startup step fails."""
+    with (
+        patch.object(settings, "loop_monitor_enabled", True),
+        patch.object(settings, "mcp_server_url", "http://127.0.0.1:1/mcp"),
+        patch.object(settings, "traffic_mode", "live"),
+        patch("lore_engine.api.app.MCPClientPool.start", side_effect=ConnectionError("down")),
+        pytest.raises(ConnectionError),
+    ):
+        async with lifespan(app):
+            pass
+
+    assert not any(thread.name == "loop-watchdog" for thread in threading.enumerate())
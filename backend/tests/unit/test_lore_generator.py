@@ -0,0 +1,194 @@
+"""Tests for the LoreGenerator service."""
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from langchain_core.messages import AIMessage
+from mcp.types import TextContent
+
+from lore_engine.core.config import LLMEndpointConfig
+from lore_engine.services.llm_router import LLMRouter
+from lore_engine.services.lore_generator import LoreGenerator
+
+FACTION = {"name": "Iron Tide", "symbol": "A wave", "values": "Freedom", "soundtrack_vibe": "ska"}
+
+
+class FakeMCPClient:
+    """MCP client stand-in serving a fixed tool list."""
+
+    def __init__(self) -> None:
+        self.list_tools_calls = 0
+        self.tool_calls: list[str] = []
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        self.list_tools_calls += 1
+        return [
+            {"name": "fetch_genre", "description": "Random genre", "inputSchema": {}},
+            {"name": "fetch_story", "description": "Random story", "inputSchema": {}},
+        ]
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None) -> str:
+        self.tool_calls.append(tool_name)
+        return "balkan doom polka"
+
+
+class ScriptedLLM:
+    """Chat model stand-in that asks for one genre per faction, then answers."""
+
+    def __init__(self) -> None:
+        self.bind_calls = 0
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> "ScriptedLLM":
+        self.bind_calls += 1
+        return self
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> AIMessage:
+        await asyncio.sleep(0)
+        if len(messages) == 2:
+            return AIMessage(
+                content="",
+                tool_calls=[{"name": "fetch_genre", "args": {}, "id": "call-1"}],
+            )
+        return AIMessage(content=json.dumps([FACTION]))
+
+
+def _generator() -> tuple[LoreGenerator, ScriptedLLM]:
+    llm = ScriptedLLM()
+    router = LLMRouter([LLMEndpointConfig(name="fake", model="m")], llm_factory=lambda c: llm)
+    return LoreGenerator(router=router), llm
+
+
+@pytest.mark.asyncio
+async def test_shared_generator_reuses_tools_and_bound_model():
+    """Test that concurrent requests share tool discovery and the tool-bound model."""
+    generator, llm = _generator()
+    clients = [FakeMCPClient() for _ in range(5)]
+
+    results = await asyncio.gather(*(generator.generate_faction(c, count=1) for c in clients))
+
+    assert results == [[FACTION]] * 5
+    assert sum(client.list_tools_calls for client in clients) == 1
+    assert llm.bind_calls == 1
+    # Each request's tool calls go through its own MCP client
+    assert all(client.tool_calls == ["fetch_genre"] for client in clients)
+
+
+class GreedyLLM:
+    """Chat model stand-in that asks for one genre too many whenever tools are bound."""
+
+    def __init__(self, tools_bound: bool = False, calls: list[bool] | None = None) -> None:
+        self.tools_bound = tools_bound
+        self.calls = calls if calls is not None else []
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> "GreedyLLM":
+        return GreedyLLM(tools_bound=True, calls=self.calls)
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> AIMessage:
+        self.calls.append(self.tools_bound)
+        if self.tools_bound:
+            tool_calls = [{"name": "fetch_genre", "args": {}, "id": f"call-{i}"} for i in range(3)]
+            return AIMessage(content="", tool_calls=tool_calls)
+        return AIMessage(content=json.dumps([FACTION, FACTION]))
+
+
+@pytest.mark.asyncio
+async def test_tool_budget_forces_final_answer():
+    """Test that redundant tool calls are refused and the answer turn has no tools."""
+    llm = GreedyLLM()
+    router = LLMRouter([LLMEndpointConfig(name="fake", model="m")], llm_factory=lambda c: llm)
+    generator = LoreGenerator(router=router)
+    client = FakeMCPClient()
+
+    factions = await generator.generate_faction(client, count=2)
+
+    assert factions == [FACTION, FACTION]
+    # One round with tools (3 calls requested, 2 executed), then the forced answer
+    assert llm.calls == [True, False]
+    assert client.tool_calls == ["fetch_genre", "fetch_genre"]
+
+
+class BatchMCPClient(FakeMCPClient):
+    """MCP client stand-in that also serves the batch genre tool."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tool_args: list[dict[str, Any]] = []
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        schema = {"properties": {"n": {"type": "integer"}}, "required": ["n"]}
+        batch = {"name": "fetch_genres", "description": "Random genres", "inputSchema": schema}
+        return [*(await super().list_tools()), batch]
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None) -> Any:
+        self.tool_calls.append(tool_name)
+        self.tool_args.append(arguments)
+        return [TextContent(type="text", text=f"genre {i}") for i in range(arguments["n"])]
+
+
+class BatchLLM:
+    """Chat model stand-in that asks for too many genres in one batch call."""
+
+    def __init__(self) -> None:
+        self.tool_results: list[str] = []
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> "BatchLLM":
+        self.batch_schema = next(t for t in tools if t.name == "fetch_genres").args_schema
+        return self
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> AIMessage:
+        if len(messages) == 2:
+            assert "fetch_genres with n=3" in messages[1].content
+            tool_calls = [{"name": "fetch_genres", "args": {"n": 5}, "id": "call-1"}]
+            return AIMessage(content="", tool_calls=tool_calls)
+        self.tool_results.append(messages[-1].content)
+        return AIMessage(content=json.dumps([FACTION] * 3))
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_counts_seeds_against_budget():
+    """Test that one batch call covers the budget and is trimmed to the seeds needed."""
+    llm = BatchLLM()
+    router = LLMRouter([LLMEndpointConfig(name="fake", model="m")], llm_factory=lambda c: llm)
+    client = BatchMCPClient()
+
+    factions = await LoreGenerator(router=router).generate_faction(client, count=3)
+
+    assert factions == [FACTION] * 3
+    assert client.tool_calls == ["fetch_genres"]
+    assert client.tool_args == [{"n": 3}]
+    assert llm.batch_schema.model_fields["n"].annotation is int
+    assert llm.tool_results == ["genre 0\ngenre 1\ngenre 2"]
+
+
+class OneCallPerRoundLLM:
+    """Chat model stand-in that asks for one genre per round while tools are bound."""
+
+    def __init__(self, tools_bound: bool = False, calls: list[bool] | None = None) -> None:
+        self.tools_bound = tools_bound
+        self.calls = calls if calls is not None else []
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> "OneCallPerRoundLLM":
+        return OneCallPerRoundLLM(tools_bound=True, calls=self.calls)
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> AIMessage:
+        self.calls.append(self.tools_bound)
+        if self.tools_bound:
+            tool_calls = [{"name": "fetch_genre", "args": {}, "id": f"call-{len(self.calls)}"}]
+            return AIMessage(content="", tool_calls=tool_calls)
+        return AIMessage(content=json.dumps([FACTION] * 10))
+
+
+@pytest.mark.asyncio
+async def test_last_round_is_kept_for_the_answer():
+    """Test that a budget larger than the round cap still leaves a final answer turn."""
+    llm = OneCallPerRoundLLM()
+    router = LLMRouter([LLMEndpointConfig(name="fake", model="m")], llm_factory=lambda c: llm)
+    client = FakeMCPClient()
+
+    factions = await LoreGenerator(router=router).generate_faction(client, count=10)
+
+    assert factions == [FACTION] * 10
+    assert llm.calls == [True] * 9 + [False]
+    assert client.tool_calls == ["fetch_genre"] * 9
@@ -0,0 +1,100 @@
+"""Tests for the persistent lore store."""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from lore_engine.services.lore_store import LoreStore
+
+
+def _faction(name: str, values: str = "Honor and steel") -> dict[str, str]:
+    return {"name": name, "symbol": "A sigil", "values": values, "soundtrack_vibe": "doom polka"}
+
+
+def _quest(title: str, location: str) -> dict[str, str]:
+    return {"title": title, "quest_brief": "", "npcs": "", "conflict": "", "location": location}
+
+
+@pytest.mark.asyncio
+async def test_add_assigns_stable_ids_and_deduplicates(tmp_path):
+    """Test that identical content gets the same id and is stored once."""
+    store = LoreStore(tmp_path / "lore.jsonl")
+
+    [first] = await store.add("faction", [_faction("The Ashen Choir")])
+    [second] = await store.add("faction", [_faction("The Ashen Choir")])
+
+    assert first["id"] == second["id"]
+    assert store.version("faction") == 1
+    assert store.get("faction", first["id"])["data"]["name"] == "The Ashen Choir"
+    assert store.get("quest", first["id"]) is None
+
+
+@pytest.mark.asyncio
+async def test_records_survive_reload(tmp_path):
+    """Test that a new store instance loads and indexes records from disk."""
+    path = tmp_path / "lore.jsonl"
+    await LoreStore(path).add("quest", [_quest("The Drowned Bell", "Saltmere")])
+
+    store = LoreStore(path)
+    store.load()
+    records, _ = store.search("quest", query="saltm")
+
+    assert [record["data"]["title"] for record in records] == ["The Drowned Bell"]
+
+
+@pytest.mark.asyncio
+async def test_search_matches_all_words_newest_first(tmp_path):
+    """Test that search requires every query word and returns newest records first."""
+    store = LoreStore(tmp_path / "lore.jsonl")
+    await store.add(
+        "faction",
+        [
+            _faction("Iron Wardens", "Order through iron discipline"),
+            _faction("Iron Tide", "Freedom of the seas"),
+            _faction("Tide Singers", "Iron will and song"),
+        ],
+    )
+
+    records, _ = store.search("faction", query="iron tide")
+
+    assert [record["data"]["name"] for record in records] == ["Tide Singers", "Iron Tide"]
+
+
+@pytest.mark.asyncio
+async def test_search_pages_with_cursor(tmp_path):
+    """Test that paging with the returned cursor walks every record exactly once."""
+    store = LoreStore(tmp_path / "lore.jsonl")
+    await store.add("faction", [_faction(f"Faction {i}") for i in range(5)])
+
+    names = []
+    cursor = None
+    while True:
+        records, cursor = store.search("faction", limit=2, cursor=cursor)
+        names.extend(record["data"]["name"] for record in records)
+        if cursor is None:
+            break
+
+    assert names == [f"Faction {i}" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+async def test_invalid_records_are_neither_stored_nor_loaded(tmp_path):
+    """Test that malformed lore is rejected on add and skipped when loading from disk."""
+    path = tmp_path / "lore.jsonl"
+    store = LoreStore(path)
+    await store.add("faction", [_faction("Iron Tide")])
+
+    with pytest.raises(ValidationError):
+        await store.add("faction", [_faction("Ashen Choir"), {"name": "No symbol"}])
+    bad = {"id": "bad", "kind": "faction", "created_at": "", "data": {"name": "No symbol"}}
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(bad) + "\n")
+        f.write("{not json\n")
+
+    reloaded = LoreStore(path)
+    reloaded.load()
+    records, _ = reloaded.search("faction")
+
+    assert store.version("faction") == 1
+    assert [record["data"]["name"] for record in records] == ["Iron Tide"]
@@ -0,0 +1,91 @@
+"""Tests for pooled MCP sessions over streamable HTTP."""
+
+import asyncio
+import socket
+from unittest.mock import patch
+
+import httpx
+import pytest
+import uvicorn
+from mcp import McpError
+from mcp.types import CONNECTION_CLOSED, INVALID_PARAMS, ErrorData
+
+from lore_engine.mcp_client import MCPClient, MCPClientPool
+from lore_engine.mcp_client.client import is_connection_error
+from lore_engine.mcp_server.config import server_settings
+from lore_engine.mcp_server.server import mcp
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _serve(port: int) -> tuple[uvicorn.Server, asyncio.Task]:
+    # A fresh app per server: the session manager of an app can only run once
+    mcp._session_manager = None
+    config = uvicorn.Config(mcp.streamable_http_app(), port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    return server, task
+
+
+@pytest.mark.asyncio
+async def test_pool_shares_sessions_and_reconnects_after_server_restart():
+    """Test that pooled sessions serve concurrent calls and survive a server restart."""
+    port = _free_port()
+    pool = MCPClientPool(f"http://127.0.0.1:{port}/mcp", size=2)
+
+    with patch.object(server_settings, "genre_source", "local"):
+        server, task = await _serve(port)
+        await pool.start()
+        results = await asyncio.gather(*(pool.get().call_tool("fetch_genre") for _ in range(10)))
+        assert all(result[0].text for result in results)
+
+        server.should_exit = True
+        await task
+        server, task = await _serve(port)
+
+        # Sessions on the old server are gone; each client reconnects transparently
+        for _ in pool.clients:
+            result = await pool.get().call_tool("fetch_genre")
+            assert result[0].text
+
+        await pool.aclose()
+        server.should_exit = True
+        await task
+
+
+def test_only_lost_sessions_count_as_connection_errors():
+    """Test that errors answered by the server are not treated as a lost session."""
+    assert is_connection_error(httpx.ConnectError("refused"))
+    assert is_connection_error(McpError(ErrorData(code=CONNECTION_CLOSED, message="closed")))
+    assert not is_connection_error(McpError(ErrorData(code=INVALID_PARAMS, message="bad n")))
+    timeout = ErrorData(code=httpx.codes.REQUEST_TIMEOUT, message="Timed out")
+    assert not is_connection_error(McpError(timeout))
+    assert not is_connection_error(ValueError("tool failed"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_reconnect():
+    """Test that callers finding the session gone reconnect it once between them."""
+    port = _free_port()
+    client = MCPClient()
+
+    with patch.object(server_settings, "genre_source", "local"):
+        server, task = await _serve(port)
+        await client.connect_url(f"http://127.0.0.1:{port}/mcp")
+        await client.cleanup()
+
+        with patch.object(client, "connect_url", wraps=client.connect_url) as connect_url:
+            results = await asyncio.gather(*(client.call_tool("fetch_genre") for _ in range(5)))
+
+        assert all(result[0].text for result in results)
+        assert connect_url.call_count == 1
+
+        await client.cleanup()
+        server.should_exit = True
+        await task
@@ -4,7 +4,8 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from lore_engine.mcp_server.server import fetch_genre, fetch_story
+from lore_engine.mcp_server.genrenator import Genrenator
+from lore_engine.mcp_server.server import fetch_genre, fetch_story, server_settings
 
 
 @pytest.mark.asyncio
@@ -31,7 +32,10 @@ async def test_fetch_genre_returns_string():
 @pytest.mark.asyncio
 async def test_fetch_genre_handles_missing_name():
     """Test that fetch_genre() handles missing 'name' key gracefully."""
-    with patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client:
+    with (
+        patch.object(server_settings, "genre_source", "remote"),
+        patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client,
+    ):
         # Mock response without 'name' key
         mock_response = AsyncMock()
         mock_response.json = lambda: {}
@@ -55,7 +59,10 @@ async def test_fetch_genre_handles_http_error():
     """Test that fetch_genre() handles HTTP errors gracefully."""
     import httpx
 
-    with patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client:
+    with (
+        patch.object(server_settings, "genre_source", "remote"),
+        patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client,
+    ):
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
         mock_async_client.__aexit__.return_value = None
@@ -94,7 +101,10 @@ async def test_fetch_story_returns_string():
 @pytest.mark.asyncio
 async def test_fetch_story_handles_missing_name():
     """Test that fetch_story() handles missing 'name' key gracefully."""
-    with patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client:
+    with (
+        patch.object(server_settings, "story_source", "remote"),
+        patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client,
+    ):
         # Mock response without 'name' key
         mock_response = AsyncMock()
         mock_response.json = lambda: {}
@@ -118,7 +128,10 @@ async def test_fetch_story_handles_http_error():
     """Test that fetch_story() handles HTTP errors gracefully."""
     import httpx
 
-    with patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client:
+    with (
+        patch.object(server_settings, "story_source", "remote"),
+        patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client,
+    ):
         mock_async_client = AsyncMock()
         mock_async_client.__aenter__.return_value = mock_async_client
         mock_async_client.__aexit__.return_value = None
@@ -130,3 +143,49 @@ async def test_fetch_story_handles_http_error():
 
         assert isinstance(result, str)
         assert "Error fetching story:" in result
+
+
+@pytest.mark.asyncio
+async def test_fetch_genre_falls_back_to_local_generator():
+    """Test that fetch_genre() uses the local generator when the upstream is down."""
+    import httpx
+
+    with (
+        patch.object(server_settings, "genre_source", "auto"),
+        patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client,
+    ):
+        mock_async_client = AsyncMock()
+        mock_async_client.__aenter__.return_value = mock_async_client
+        mock_async_client.__aexit__.return_value = None
+        mock_async_client.get = AsyncMock(side_effect=httpx.ReadTimeout("Timed out"))
+
+        mock_client.return_value = mock_async_client
+
+        result = await fetch_genre()
+
+        assert isinstance(result, str)
+        assert result
+        assert "Error" not in result
+
+
+@pytest.mark.asyncio
+async def test_fetch_story_local_source_skips_upstream():
+    """Test that fetch_story() never calls the upstream when configured as local."""
+    with (
+        patch.object(server_settings, "story_source", "local"),
+        patch("lore_engine.mcp_server.server.httpx.AsyncClient") as mock_client,
+    ):
+        result = await fetch_story()
+
+        assert isinstance(result, str)
+        assert result.endswith(".")
+        mock_client.assert_not_called()
+
+
+def test_genrenator_is_reproducible_with_seed():
+    """Test that seeded generators produce identical sequences."""
+    first = Genrenator(seed=42)
+    second = Genrenator(seed=42)
+
+    assert [first.genre() for _ in range(5)] == [second.genre() for _ in range(5)]
+    assert [first.story() for _ in range(5)] == [second.story() for _ in range(5)]
@@ -0,0 +1,63 @@
+"""Tests for the on-demand profiling endpoint."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from lore_engine.api.app import app
+from lore_engine.core.config import settings
+
+
+def burn_cpu(seconds: float) -> None:
+    """Busy loop standing in for blocking work on the event loop."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(1000))
+
+
+async def _busy_task(until: float) -> None:
+    while time.perf_counter() < until:
+        burn_cpu(0.01)
+        await asyncio.sleep(0)
+
+
+def _client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_profile_endpoint_is_hidden_and_guarded():
+    """Test that the endpoint is 404 unless enabled and checks the debug token."""
+    async with _client() as client:
+        assert (await client.get("/debug/profile?seconds=0.01")).status_code == 404
+
+        with (
+            patch.object(settings, "debug_endpoints_enabled", True),
+            patch.object(settings, "debug_token", "s3cret"),
+        ):
+            assert (await client.get("/debug/profile?seconds=0.01")).status_code == 403
+            response = await client.get(
+                "/debug/profile?seconds=0.01", headers={"X-Debug-Token": "s3cret"}
+            )
+            assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["sampling", "cprofile"])
+async def test_profile_attributes_time_to_busy_task(mode):
+    """Test that both profilers see work done by other tasks on the loop."""
+    busy = asyncio.create_task(_busy_task(time.perf_counter() + 0.5))
+    with patch.object(settings, "debug_endpoints_enabled", True):
+        async with _client() as client:
+            response = await client.get(f"/debug/profile?seconds=0.3&mode={mode}")
+    await busy
+
+    assert response.status_code == 200
+    assert "burn_cpu" in response.text
+    if mode == "sampling":
+        # Collapsed stacks: "outer;...;inner count"
+        stack, count = response.text.splitlines()[0].rsplit(" ", 1)
+        assert ";" in stack and int(count) > 0
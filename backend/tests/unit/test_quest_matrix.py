@@ -0,0 +1,119 @@
+"""Tests for bulk quest generation over faction pairs."""
+
+import asyncio
+import json
+import re
+from typing import Any
+
+import httpx
+import pytest
+from langchain_core.messages import AIMessage
+
+from lore_engine.api.app import app
+from lore_engine.api.dependencies import get_lore_generator, get_mcp_client
+from lore_engine.core.config import LLMEndpointConfig, settings
+from lore_engine.services.llm_router import LLMRouter
+from lore_engine.services.lore_generator import LoreGenerator
+from lore_engine.services.quest_matrix import generate_quest_matrix
+
+FACTIONS = [
+    {"name": name, "symbol": "A sigil", "values": "Pride", "soundtrack_vibe": "drone"}
+    for name in ("Iron Tide", "Ashen Choir", "Glass Court")
+]
+
+
+class FakeMCPClient:
+    """MCP client stand-in serving the story tool."""
+
+    def __init__(self) -> None:
+        self.list_tools_calls = 0
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        self.list_tools_calls += 1
+        return [{"name": "fetch_story", "description": "Random story", "inputSchema": {}}]
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None) -> str:
+        return "a heist gone wrong"
+
+
+class PairLLM:
+    """Chat model stand-in writing a quest titled after the factions in its prompt."""
+
+    def __init__(self, failing: str | None = None) -> None:
+        self.failing = failing
+        self.running = 0
+        self.max_running = 0
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> "PairLLM":
+        return self
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> AIMessage:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if len(messages) == 2:
+            return AIMessage(
+                content="", tool_calls=[{"name": "fetch_story", "args": {}, "id": "call-1"}]
+            )
+        names = re.findall(r"Faction: (.+)", messages[1].content)
+        if self.failing in names:
+            return AIMessage(content="not json")
+        quest = {"npcs": "", "conflict": "", "location": "", "quest_brief": ""}
+        return AIMessage(content=json.dumps({**quest, "title": " vs ".join(names)}))
+
+
+def _generator(llm: PairLLM) -> LoreGenerator:
+    router = LLMRouter([LLMEndpointConfig(name="fake", model="m")], llm_factory=lambda c: llm)
+    return LoreGenerator(router=router)
+
+
+@pytest.mark.asyncio
+async def test_matrix_generates_every_pair_concurrently_and_reports_failures():
+    """Test that all pairs are generated under the concurrency bound, failures included."""
+    llm = PairLLM(failing="Glass Court")
+    client = FakeMCPClient()
+
+    results = [
+        result
+        async for result in generate_quest_matrix(
+            _generator(llm), client, FACTIONS, max_concurrency=2
+        )
+    ]
+
+    by_pair = {result.pair: result for result in results}
+    assert sorted(by_pair) == [(0, 1), (0, 2), (1, 2)]
+    assert by_pair[(0, 1)].quest["title"] == "Iron Tide vs Ashen Choir"
+    assert "valid JSON" in by_pair[(1, 2)].error
+    assert llm.max_running == 2
+    assert client.list_tools_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_matrix_endpoint_streams_selected_pairs_as_ndjson(monkeypatch):
+    """Test that the endpoint streams one line per distinct pair and validates pairs."""
+    monkeypatch.setattr(settings, "lore_store_enabled", False)
+    app.dependency_overrides[get_lore_generator] = lambda: _generator(PairLLM())
+    app.dependency_overrides[get_mcp_client] = FakeMCPClient
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(
+                "/quests/matrix", json={"factions": FACTIONS, "pairs": [[2, 0], [0, 2]]}
+            )
+            invalid = await client.post(
+                "/quests/matrix", json={"factions": FACTIONS, "pairs": [[1, 1]]}
+            )
+            too_many = await client.post(
+                "/quests/matrix", json={"factions": FACTIONS, "pairs": [[0, 1]] * 4}
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    [line] = response.text.splitlines()
+    item = json.loads(line)
+    assert item["pair"] == [0, 2]
+    assert item["quest"]["title"] == "Iron Tide vs Glass Court"
+    assert invalid.status_code == 422
+    assert too_many.status_code == 422
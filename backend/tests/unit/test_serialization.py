@@ -0,0 +1,50 @@
+"""Tests for the single-validation response path."""
+
+import httpx
+import pytest
+
+from lore_engine.api.app import app
+from lore_engine.api.dependencies import get_lore_store
+from lore_engine.models.responses import NPC, QuestResponse, QuestsPage
+from lore_engine.services.lore_store import LoreStore, record_payload
+
+QUEST = {
+    "title": "The Drowned Bell",
+    "quest_brief": "A bell rings under the sea.",
+    "npcs": [{"name": "Sister Wren", "role": "bell keeper"}],
+    "conflict": "Who silences it",
+    "location": "Saltmere",
+}
+
+
+def test_npcs_validate_as_objects_or_fall_back_to_text():
+    """Test that NPC lists are validated as objects and anything else becomes a string."""
+    assert QuestResponse(**QUEST).npcs == [NPC(name="Sister Wren", role="bell keeper")]
+    assert QuestResponse(**{**QUEST, "npcs": ["Sister Wren", {"name": "Tam"}]}).npcs == str(
+        ["Sister Wren", {"name": "Tam"}]
+    )
+    assert QuestResponse(**{**QUEST, "npcs": {"Sister Wren": "keeper"}}).npcs == str(
+        {"Sister Wren": "keeper"}
+    )
+
+
+@pytest.mark.asyncio
+async def test_lore_page_body_matches_model_and_keeps_etag(tmp_path):
+    """Test that a page serialized once has the model's JSON, ids and ETag."""
+    store = LoreStore(tmp_path / "lore.jsonl")
+    [record] = await store.add("quest", [QUEST])
+    app.dependency_overrides[get_lore_store] = lambda: store
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/lore/quests")
+            cached = await client.get(
+                "/lore/quests", headers={"If-None-Match": response.headers["ETag"]}
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    expected = QuestsPage(quests=[QuestResponse(**record_payload(record))], next_cursor=None)
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == expected.model_dump(mode="json")
+    assert cached.status_code == 304
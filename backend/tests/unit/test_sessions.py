@@ -0,0 +1,194 @@
+"""Tests for stateful generation sessions."""
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from lore_engine.api.app import app
+from lore_engine.api.dependencies import get_lore_generator, get_lore_store, get_mcp_client
+from lore_engine.core.config import LLMEndpointConfig, settings
+from lore_engine.services.llm_router import LLMRouter
+from lore_engine.services.lore_generator import LoreGenerator
+from lore_engine.services.lore_store import LoreStore
+from lore_engine.services.sessions import SessionStore, trim_turns
+
+FACTIONS = [
+    {"name": "Iron Tide", "symbol": "A wave", "values": "Freedom", "soundtrack_vibe": "ska"},
+    {"name": "Ashen Choir", "symbol": "Ash", "values": "Grief", "soundtrack_vibe": "doom"},
+]
+QUEST = {
+    "title": "The Drowned Hymn",
+    "quest_brief": "Recover the hymn.",
+    "npcs": "A tidecaller and a cantor",
+    "conflict": "Both want the hymn",
+    "location": "The flooded abbey",
+}
+
+
+class SessionMCPClient:
+    """MCP client stand-in counting seed fetches."""
+
+    def __init__(self) -> None:
+        self.tool_calls: list[str] = []
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return [
+            {"name": "fetch_genre", "description": "Random genre", "inputSchema": {}},
+            {"name": "fetch_story", "description": "Random story", "inputSchema": {}},
+        ]
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None) -> str:
+        self.tool_calls.append(tool_name)
+        return "seed"
+
+
+class SessionLLM:
+    """Chat model stand-in that fetches seeds only for opening requests."""
+
+    def __init__(self) -> None:
+        self.conversations: list[list[Any]] = []
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> "SessionLLM":
+        return self
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> AIMessage:
+        self.conversations.append(list(messages))
+        last = messages[-1]
+        if isinstance(last, HumanMessage) and len(messages) == 2:
+            tool = "fetch_genre" if "faction" in last.content.split("\n")[0] else "fetch_story"
+            return AIMessage(content="", tool_calls=[{"name": tool, "args": {}, "id": "c1"}])
+        if "Revise faction 2" in last.content:
+            return AIMessage(content=json.dumps([FACTIONS[0], {**FACTIONS[1], "values": "Hope"}]))
+        if "faction" in messages[1].content.split("\n")[0]:
+            return AIMessage(content=json.dumps(FACTIONS))
+        return AIMessage(content=json.dumps(QUEST))
+
+
+def test_trim_turns_keeps_opening_and_recent_turns():
+    """Test that trimming never separates tool calls from their results."""
+    messages = [
+        SystemMessage(content="sys"),
+        HumanMessage(content="open"),
+        AIMessage(content="", tool_calls=[{"name": "fetch_story", "args": {}, "id": "c1"}]),
+        ToolMessage(content="seed", tool_call_id="c1"),
+        AIMessage(content="q1"),
+    ]
+    for i in range(2, 6):
+        messages += [HumanMessage(content=f"again {i}"), AIMessage(content=f"q{i}")]
+
+    trimmed = trim_turns(messages, max_turns=3)
+
+    assert [m.content for m in trimmed] == [
+        "sys", "open", "", "seed", "q1", "again 4", "q4", "again 5", "q5",
+    ]  # fmt: skip
+    assert [m.content for m in trim_turns(messages, max_turns=1)] == [
+        "sys", "open", "", "seed", "q1",
+    ]  # fmt: skip
+
+
+def test_session_store_evicts_least_recently_used():
+    """Test that the store is bounded and reading a session refreshes it."""
+    store = SessionStore(max_sessions=2)
+    first, second = store.create(), store.create()
+
+    assert store.get(first.id) is first
+    store.create()
+
+    assert len(store) == 2
+    assert store.get(second.id) is None
+    assert store.get(first.id) is first
+
+
+def test_websocket_session_continues_conversations():
+    """Test that follow-up actions reuse the session's conversation and tool results."""
+    llm = SessionLLM()
+    router = LLMRouter([LLMEndpointConfig(name="fake", model="m")], llm_factory=lambda c: llm)
+    generator = LoreGenerator(router=router)
+    mcp_client = SessionMCPClient()
+
+    async def fake_mcp_client():
+        yield mcp_client
+
+    app.dependency_overrides[get_mcp_client] = fake_mcp_client
+    app.dependency_overrides[get_lore_generator] = lambda: generator
+    try:
+        with (
+            patch.object(settings, "lore_store_enabled", False),
+            TestClient(app) as client,
+            client.websocket_connect("/sessions/ws") as ws,
+        ):
+            session_id = ws.receive_json()["session_id"]
+
+            ws.send_json({"action": "factions", "count": 2})
+            assert ws.receive_json()["factions"][1]["name"] == "Ashen Choir"
+
+            ws.send_json({"action": "quest"})
+            ws.send_json({"action": "quest"})
+            assert ws.receive_json()["quest"]["title"] == QUEST["title"]
+            assert ws.receive_json()["quest"]["title"] == QUEST["title"]
+
+            ws.send_json({"action": "tweak_faction", "index": 2, "instruction": "More hopeful"})
+            assert ws.receive_json()["factions"][1]["values"] == "Hope"
+
+            ws.send_json({"action": "tweak_faction", "index": 9, "instruction": "x"})
+            assert ws.receive_json()["type"] == "error"
+
+            with client.websocket_connect(f"/sessions/ws?session_id={session_id}") as resumed:
+                assert resumed.receive_json()["factions"][1]["values"] == "Hope"
+    finally:
+        app.dependency_overrides.clear()
+
+    # One genre and one story fetch: the second quest reused the first one's seeds
+    assert mcp_client.tool_calls == ["fetch_genre", "fetch_story"]
+    first_quest, second_quest = llm.conversations[3], llm.conversations[4]
+    assert second_quest[: len(first_quest)] == first_quest
+
+
+class MalformedTweakLLM(SessionLLM):
+    """Session model stand-in whose faction revisions are missing required fields."""
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> AIMessage:
+        if "Revise faction" in messages[-1].content:
+            return AIMessage(content=json.dumps([{"name": "Iron Tide"}]))
+        return await super().ainvoke(messages, **kwargs)
+
+
+def test_websocket_session_does_not_store_invalid_lore(tmp_path):
+    """Test that a malformed answer is reported as an error and never reaches the store."""
+    llm = MalformedTweakLLM()
+    router = LLMRouter([LLMEndpointConfig(name="fake", model="m")], llm_factory=lambda c: llm)
+    generator = LoreGenerator(router=router)
+    store = LoreStore(tmp_path / "lore.jsonl")
+
+    async def fake_mcp_client():
+        yield SessionMCPClient()
+
+    app.dependency_overrides[get_mcp_client] = fake_mcp_client
+    app.dependency_overrides[get_lore_generator] = lambda: generator
+    app.dependency_overrides[get_lore_store] = lambda: store
+    try:
+        with (
+            patch.object(settings, "lore_store_enabled", True),
+            TestClient(app) as client,
+            client.websocket_connect("/sessions/ws") as ws,
+        ):
+            ws.receive_json()
+            ws.send_json({"action": "factions", "count": 2})
+            factions = ws.receive_json()["factions"]
+
+            ws.send_json({"action": "tweak_faction", "index": 1, "instruction": "Simpler"})
+            tweaked = ws.receive_json()
+
+            # The rejected revision left the session's factions intact
+            ws.send_json({"action": "quest"})
+            quest = ws.receive_json()
+    finally:
+        app.dependency_overrides.clear()
+
+    assert all(faction["id"] for faction in factions)
+    assert tweaked["type"] == "error"
+    assert quest["quest"]["title"] == QUEST["title"]
+    assert store.version("faction") == 2
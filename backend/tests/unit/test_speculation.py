@@ -0,0 +1,102 @@
+"""Tests for speculative quest generation."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from lore_engine.services.speculation import QuestSpeculator, faction_set_key
+
+IRON_TIDE = {"name": "Iron Tide", "symbol": "A wave", "values": "Freedom", "soundtrack_vibe": "ska"}
+ASHEN_CHOIR = {"name": "Ashen Choir", "symbol": "Ash", "values": "Grief", "soundtrack_vibe": "doom"}
+
+
+class SlowQuestGenerator:
+    """Generator stand-in whose quests finish when released."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def generate_quest(self, mcp_client: Any, factions=None, deadline=None) -> dict:
+        self.calls += 1
+        await self.release.wait()
+        return {"title": f"Quest {self.calls}", "factions": [f["name"] for f in factions]}
+
+
+@asynccontextmanager
+async def _mcp_client():
+    yield object()
+
+
+def test_faction_set_key_ignores_order_and_ids():
+    """Test that the faction set hash is canonical."""
+    assert faction_set_key([IRON_TIDE, ASHEN_CHOIR]) == faction_set_key(
+        [{**ASHEN_CHOIR, "id": "abc"}, IRON_TIDE]
+    )
+    assert faction_set_key([IRON_TIDE]) != faction_set_key([IRON_TIDE, ASHEN_CHOIR])
+
+
+@pytest.mark.asyncio
+async def test_quest_request_joins_speculation_in_progress():
+    """Test that a matching quest request joins the running generation exactly once."""
+    generator = SlowQuestGenerator()
+    speculator = QuestSpeculator(generator, _mcp_client)
+
+    assert await speculator.schedule([IRON_TIDE, ASHEN_CHOIR])
+    assert not await speculator.schedule([ASHEN_CHOIR, IRON_TIDE])
+
+    take = asyncio.create_task(speculator.take([ASHEN_CHOIR, IRON_TIDE]))
+    await asyncio.sleep(0.01)
+    generator.release.set()
+
+    assert (await take)["title"] == "Quest 1"
+    assert generator.calls == 1
+    # Results are handed out once
+    assert await speculator.take([IRON_TIDE, ASHEN_CHOIR]) is None
+
+
+@pytest.mark.asyncio
+async def test_speculation_budget_skips_new_faction_sets():
+    """Test that speculation beyond the in-flight budget is skipped, not queued."""
+    generator = SlowQuestGenerator()
+    speculator = QuestSpeculator(generator, _mcp_client, max_inflight=1)
+
+    assert await speculator.schedule([IRON_TIDE])
+    assert not await speculator.schedule([ASHEN_CHOIR])
+    assert await speculator.take([ASHEN_CHOIR]) is None
+    await asyncio.sleep(0.01)
+
+    await speculator.aclose()
+    assert generator.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_speculation_claimable():
+    """Test that a quest request cancelled while joined does not orphan the generation."""
+    generator = SlowQuestGenerator()
+    speculator = QuestSpeculator(generator, _mcp_client)
+    await speculator.schedule([IRON_TIDE, ASHEN_CHOIR])
+
+    take = asyncio.create_task(speculator.take([IRON_TIDE, ASHEN_CHOIR]))
+    await asyncio.sleep(0.01)
+    take.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await take
+
+    retry = asyncio.create_task(speculator.take([IRON_TIDE, ASHEN_CHOIR]))
+    await asyncio.sleep(0.01)
+    generator.release.set()
+    assert (await retry)["title"] == "Quest 1"
+
+    # A generation whose waiter was cancelled is still cancelled on shutdown
+    speculator = QuestSpeculator(SlowQuestGenerator(), _mcp_client)
+    await speculator.schedule([IRON_TIDE])
+    take = asyncio.create_task(speculator.take([IRON_TIDE]))
+    await asyncio.sleep(0.01)
+    take.cancel()
+    await asyncio.gather(take, return_exceptions=True)
+    [entry] = speculator._entries.values()
+    await speculator.aclose()
+    assert entry.task.cancelled()
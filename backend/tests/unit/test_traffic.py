@@ -0,0 +1,104 @@
+"""Tests for LLM and MCP traffic record/replay."""
+
+import json
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from lore_engine.core.config import LLMEndpointConfig, settings
+from lore_engine.services.llm_router import LLMRouter
+from lore_engine.services.lore_generator import LoreGenerator
+from lore_engine.services.traffic import (
+    CassetteLibrary,
+    OfflineMCPClient,
+    get_cassette_library,
+    traffic_session,
+)
+
+FACTION = {"name": "Iron Tide", "symbol": "A wave", "values": "Freedom", "soundtrack_vibe": "ska"}
+
+
+class RecordingMCPClient:
+    """MCP client stand-in with a single genre tool."""
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return [{"name": "fetch_genre", "description": "Random genre", "inputSchema": {}}]
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any] | None = None) -> str:
+        return "balkan doom polka"
+
+
+class GenreLLM:
+    """Chat model stand-in that fetches a genre, then answers with the genre it saw."""
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> "GenreLLM":
+        return self
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> AIMessage:
+        if len(messages) == 2:
+            return AIMessage(
+                content="", tool_calls=[{"name": "fetch_genre", "args": {}, "id": "call-1"}]
+            )
+        return AIMessage(content=json.dumps([{**FACTION, "soundtrack_vibe": messages[-1].content}]))
+
+
+class UnreachableLLM:
+    """Chat model stand-in that fails the test if it is ever called."""
+
+    def bind_tools(self, tools: list[Any], **kwargs: Any) -> "UnreachableLLM":
+        return self
+
+    async def ainvoke(self, messages: list[Any], **kwargs: Any) -> AIMessage:
+        raise AssertionError("LLM called during replay")
+
+
+def _generator(llm: Any) -> LoreGenerator:
+    router = LLMRouter([LLMEndpointConfig(name="fake", model="m")], llm_factory=lambda c: llm)
+    return LoreGenerator(router=router)
+
+
+@pytest.mark.asyncio
+async def test_recorded_traffic_replays_without_providers(tmp_path):
+    """Test that a recorded request replays from its cassette with no LLM or MCP server."""
+    expected = [{**FACTION, "soundtrack_vibe": "balkan doom polka"}]
+
+    with (
+        patch.object(settings, "traffic_mode", "record"),
+        patch.object(settings, "traffic_cassette_dir", str(tmp_path)),
+    ):
+        async with traffic_session("faction", {"count": 1}):
+            recorded = await _generator(GenreLLM()).generate_faction(RecordingMCPClient())
+
+    [path] = tmp_path.glob("*.json")
+    cassette = json.loads(path.read_text())
+    assert recorded == expected
+    assert [event["type"] for event in cassette["events"]] == ["llm", "tool", "llm"]
+    assert cassette["tools"][0]["name"] == "fetch_genre"
+
+    get_cassette_library.cache_clear()
+    with (
+        patch.object(settings, "traffic_mode", "replay"),
+        patch.object(settings, "traffic_cassette_dir", str(tmp_path)),
+        patch.object(settings, "traffic_replay_time_scale", 0.0),
+    ):
+        async with traffic_session("faction", {"count": 1}):
+            replayed = await _generator(UnreachableLLM()).generate_faction(OfflineMCPClient())
+    get_cassette_library.cache_clear()
+
+    assert replayed == expected
+
+
+def test_library_prefers_matching_params(tmp_path):
+    """Test that cassettes recorded with the request's parameters are served first."""
+    for cassette_id, count in [("one", 1), ("three", 3)]:
+        cassette = {"id": cassette_id, "kind": "faction", "params": {"count": count}}
+        (tmp_path / f"{cassette_id}.json").write_text(json.dumps(cassette))
+    library = CassetteLibrary(tmp_path)
+
+    assert library.select("faction", {"count": 3})["id"] == "three"
+    assert library.select("faction", {"count": 7})["id"] in {"one", "three"}
+    assert library.select("faction", {"count": 1}, cassette_id="one")["id"] == "one"
+    with pytest.raises(LookupError):
+        library.select("quest", {"factions": None})